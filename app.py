@@ -4,52 +4,320 @@ Alumni Mentor Portal - Flask Testing Application
 This app provides a web interface to test the MySQL database functionality
 """
 
+from flask import (Flask, render_template, request, jsonify, redirect, url_for, flash, session, g,
+                   has_request_context, abort, Response, stream_with_context, make_response,
+                   before_render_template, template_rendered, message_flashed)
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.http import is_resource_modified
 import mysql.connector
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session
 from mysql.connector import Error
-from datetime import date
+from datetime import date, datetime, timezone
+from functools import wraps
+import atexit
+import hashlib
 import logging
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+import os
+import threading
+from types import MappingProxyType
+import time
+import click
+
+from db_pool import (get_pool, remove_pool, pool_stats, forget_all_pools, close_all_pools, evict_idle_pools,
+                     PoolTimeoutError)
+from fanout import QueryFanout
+from exports import EXPORT_FORMATS, EXPORT_QUERIES, CONNECTIONS_QUERY, stream_export
+from bulk_import import IMPORT_SPECS, decode_upload, import_csv
+from audit import AuditLog
+from availability import (AVAILABILITY_TABLES, DEFAULT_FREE, DEFAULT_SLOTS, MAX_FREE, MAX_MENTORS, MAX_SLOTS,
+                          AvailabilityIndex)
+import archive
+import datagen
+import partitions
+from lookup import LOOKUP_SOURCES, DEFAULT_LIMIT, MAX_LIMIT, PrefixIndex
+from matching import MatchEngine
+from metrics import Metrics, read_shared, retire_shared, server_timing, write_shared
+from slow_queries import SlowQueryLog
+from snapshots import UserRegistry
+from validation import KEY_SOURCES, KeySet, validate_form
+from migrate import MIGRATIONS, MigrationError, apply_migrations, baseline, check_indexes, migration_status
+from pagination import ListSpec, build_page_query, encode_cursor, finish_page, prefix, parse_date
+from search import build_search, finish_search, scope_sources
+from query_cache import (QueryCache, KNOWN_TABLES, PROCEDURE_READS, PROCEDURE_WRITES, VERSIONED_TABLES,
+                         tables_read, tables_written, upstream_tables, with_dependents)
+
+# Configure logging (the process id tells worker processes apart)
+logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(process)d] %(levelname)s %(name)s: %(message)s')
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
-app.secret_key = 'your-secret-key-here'
-
-# Database configuration
-DB_CONFIG = {
-    'host': 'localhost',
-    'user': 'root',
-    'password': 'root',
-    'database': 'mentor_alumni_portal',
+# Every worker process must sign sessions with the same key
+app.secret_key = os.environ.get('PORTAL_SECRET_KEY', 'your-secret-key-here')
+# Largest request body accepted; a bulk import CSV is read into memory whole
+app.config['MAX_CONTENT_LENGTH'] = 32 * 1024 * 1024
+
+# Database configuration (read-only: copy it to change a setting for one connection)
+DB_CONFIG = MappingProxyType({
+    'host': os.environ.get('PORTAL_DB_HOST', 'localhost'),
+    'port': int(os.environ.get('PORTAL_DB_PORT', 3306)),
+    'user': os.environ.get('PORTAL_DB_USER', 'root'),
+    'password': os.environ.get('PORTAL_DB_PASSWORD', 'root'),
+    'database': os.environ.get('PORTAL_DB_NAME', 'mentor_alumni_portal'),
     'autocommit': True
+})
+
+# Connection pool settings (one pool per logged-in database user)
+POOL_CONFIG = {
+    'max_size': 10,          # connections per database user
+    'acquire_timeout': 5.0,  # seconds to wait for a free connection
+    'max_idle_time': 300,    # seconds before an idle connection is closed
+    'ping_after': 30         # ping connections idle longer than this on checkout
+}
+# Pools only evict on checkout, so one request every 'interval' seconds sweeps them all
+POOL_EVICTION = {'interval': 60.0, 'checked_at': float('-inf')}
+POOL_EVICTION_LOCK = threading.Lock()
+
+# Result cache for repeated reads; write paths bump per-table versions to invalidate it
+CACHE_CONFIG = {
+    'max_entries': 512,  # cached result sets
+    'max_rows': 50000,   # total rows across all entries
+    'max_age': 300       # seconds, guards against writes made outside the app
+}
+QUERY_CACHE = QueryCache(**CACHE_CONFIG)
+
+# In-memory mentor matching, one engine per database user
+MATCH_CONFIG = {
+    'max_age': 300           # full reload at least this often (seconds)
+}
+MATCH_ENGINES = UserRegistry(lambda: MatchEngine(**MATCH_CONFIG))
+
+# In-memory typeahead indexes for the alumni/student pickers, one set per database user
+LOOKUP_CONFIG = {
+    'max_age': 300           # full reload at least this often (seconds)
+}
+LOOKUP_INDEXES = UserRegistry(lambda kind: PrefixIndex(*LOOKUP_SOURCES[kind], **LOOKUP_CONFIG))
+
+# Form inserts are checked against cached alumni/student IDs, emails and phones, one set per database user
+VALIDATION_CONFIG = {
+    'max_age': 300           # full reload at least this often (seconds)
+}
+VALIDATION_KEYS = UserRegistry(lambda table: KeySet(table, KEY_SOURCES[table], **VALIDATION_CONFIG))
+
+# Sessions per mentor and day over the scheduling window, for free-slot search and the session form
+AVAILABILITY_CONFIG = {
+    'max_age': 300           # full reload at least this often (seconds)
+}
+AVAILABILITY_INDEXES = UserRegistry(lambda: AvailabilityIndex(**AVAILABILITY_CONFIG))
+
+# Per-endpoint statement, checkout and request metrics served on /metrics
+METRICS_CONFIG = {
+    # Bearer token that lets a scraper read /metrics without logging in; None allows logged-in users only
+    'token': os.environ.get('PORTAL_METRICS_TOKEN'),
+    # Directory where gunicorn workers share their metrics (set by gunicorn.conf.py), so any
+    # worker's /metrics reports them all; each worker rewrites its file this often (seconds)
+    'shared_dir': None,
+    'share_interval': 1.0
+}
+METRICS = Metrics()
+METRICS_SHARE_LOCK = threading.Lock()
+METRICS_SHARE_STOP = threading.Event()
+
+# Statements slower than the threshold are kept (with their EXPLAIN plan) for /debug/queries
+SLOW_QUERY_CONFIG = {
+    'threshold_ms': 200,     # record statements at least this slow
+    'max_entries': 500,      # ring buffer size
+    'explain_ttl': 300,      # re-run EXPLAIN for a fingerprint at most this often (seconds)
+    'admins': ('root',)      # database users allowed to open /debug/queries
+}
+SLOW_QUERIES = SlowQueryLog(SLOW_QUERY_CONFIG['threshold_ms'], SLOW_QUERY_CONFIG['max_entries'],
+                            SLOW_QUERY_CONFIG['explain_ttl'])
+
+# Independent page reads run concurrently on a separate 'fanout' pool per database user
+FANOUT_CONFIG = {
+    'workers': 16,           # threads shared by all requests
+    'max_size': 10,          # fan-out connections per database user
+    'timeout': 10.0          # seconds before unfinished reads are killed and the page gets None
+}
+FANOUT = QueryFanout(FANOUT_CONFIG['workers'])
+
+# Old sessions move to Session_Archive in throttled batches (route runs it in a background thread)
+ARCHIVE_CONFIG = {
+    'older_than_days': 7,    # archive sessions dated before today minus this many days
+    'batch_size': 1000,      # Session_IDs per transaction
+    'pause': 0.05,           # minimum sleep between batches (seconds)
+    'throttle': 1.0,         # also sleep this multiple of each batch's run time
+    'lock_wait_timeout': 2,  # give up a batch quickly when foreground writes hold its rows, then retry
+    'lock_retries': 5
 }
+ARCHIVE_TABLES = with_dependents(('MentorshipSession', 'Session_Archive', 'Archive_Jobs'))
+ARCHIVE_THREAD = None
+ARCHIVE_THREAD_LOCK = threading.Lock()
+ARCHIVE_STOP = threading.Event()
+
+# Feedback_Log / Activity_Log rows for form inserts are queued and written in batches
+# (sql/async_audit.sql makes the log triggers skip those inserts); False logs in the triggers
+AUDIT_CONFIG = {
+    'async': os.environ.get('PORTAL_AUDIT_ASYNC', '1') != '0',
+    # The writer is one background connection for every user's rows, so it has its own
+    # account (INSERT on the two log tables is enough)
+    'db_user': os.environ.get('PORTAL_AUDIT_DB_USER', DB_CONFIG['user']),
+    'db_password': os.environ.get('PORTAL_AUDIT_DB_PASSWORD', DB_CONFIG['password']),
+    # A failed startup check is logged and the writer retries or spills; True refuses to start instead
+    'require_writer': os.environ.get('PORTAL_AUDIT_REQUIRED', '0') == '1',
+    'queue_size': 10000,     # rows waiting for the writer
+    'batch_size': 500,       # rows per INSERT
+    'flush_interval': 1.0,   # write a partial batch after this long (seconds)
+    'put_timeout': 0.5,      # a request waits this long on a full queue, then spills its row
+    'retries': 3,            # attempts per batch before it is spilled
+    'spill_path': os.path.join(os.path.dirname(os.path.abspath(__file__)), 'audit_spill.jsonl')
+}
+AUDIT_SETTINGS = ('async', 'db_user', 'db_password', 'require_writer')
+
+def audit_db_config():
+    """Connection settings of the audit writer's account"""
+    return dict(DB_CONFIG, user=AUDIT_CONFIG['db_user'], password=AUDIT_CONFIG['db_password'])
 
-DEFAULT_DB_CONFIG = DB_CONFIG.copy()
+def make_audit_log():
+    return AuditLog(lambda: mysql.connector.connect(**audit_db_config()),
+                    on_flush=lambda tables: invalidate_tables(tables),
+                    **{key: value for key, value in AUDIT_CONFIG.items() if key not in AUDIT_SETTINGS})
+
+def check_audit_writer():
+    """Check at startup that the audit writer can log in, so bad credentials show up in the log.
+
+    MySQL may just not be up yet, so by default the server starts anyway and the
+    writer retries each batch, spilling what fails; with require_writer it refuses to start.
+    """
+    if not AUDIT_CONFIG['async']:
+        return
+    try:
+        mysql.connector.connect(**audit_db_config()).close()
+    except Error as e:
+        message = (f"Audit writer cannot connect as {AUDIT_CONFIG['db_user']}: {e}. "
+                   "Check PORTAL_AUDIT_DB_USER/PORTAL_AUDIT_DB_PASSWORD; until it connects, "
+                   f"audit rows go to {AUDIT_CONFIG['spill_path']}")
+        if AUDIT_CONFIG['require_writer']:
+            raise SystemExit(message)
+        logger.error(message)
+
+AUDIT_LOG = make_audit_log()
+atexit.register(lambda: AUDIT_LOG.close())
+
+# The log triggers skip rows inserted while this is set (sql/async_audit.sql)
+AUDIT_FLAG_ON = "SET @portal_async_audit = 1"
+AUDIT_FLAG_OFF = "SET @portal_async_audit = NULL"
+
+# Monthly RANGE partitions on the history tables (partition-table converts, maintain-partitions keeps up)
+PARTITION_CONFIG = {
+    'ahead_months': 3,       # months kept split off ahead of today, so new rows never land in pmax
+    'retention_months': {    # months kept before a partition expires; None keeps everything
+        'MentorshipSession': None,
+        'Feedback': None,
+        'Activity_Log': 12,
+        'Feedback_Log': 12,
+    },
+    'archive_expired': True  # exchange expired months into <table>_pYYYYMM tables instead of dropping them
+}
+
+# Multi-process serving (wsgi.py, gunicorn.conf.py). Each worker has its own result cache and
+# in-memory indexes, so workers read Table_Versions to see each other's writes.
+WORKER_CONFIG = {
+    'version_sync': 2.0      # seconds between Table_Versions checks in a forked worker
+}
+VERSION_SYNC = {'enabled': False, 'checked_at': float('-inf'), 'seen': None}
+VERSION_SYNC_LOCK = threading.Lock()
+
+
+def current_db_config():
+    """Database settings for the logged-in user, falling back to DB_CONFIG."""
+    config = DB_CONFIG.copy()
+    if has_request_context() and session.get('db_user'):
+        config['user'] = session['db_user']
+        config['password'] = session.get('db_password', '')
+    return config
 
 
 def verify_db_credentials(username, password):
-    """Attempt to connect with provided credentials to verify access."""
+    """Attempt to connect with provided credentials to verify access.
+
+    Returns True or False, or None when the account's pool is saturated: its
+    connections were opened with these credentials, so they are not rejected.
+    """
     test_config = DB_CONFIG.copy()
     test_config['user'] = username
     test_config['password'] = password
     try:
-        connection = mysql.connector.connect(**test_config)
-        if connection.is_connected():
-            connection.close()
-            return True
+        # The verified connection stays in the user's pool for their first page
+        connection = get_pool(test_config, **POOL_CONFIG).acquire()
+        connection.close()
+        return True
+    except PoolTimeoutError as e:
+        logger.warning(f"Login for user {username} timed out waiting for a connection: {e}")
+        return None
     except Error as e:
+        remove_pool(test_config)
         logger.warning(f"Failed login attempt for user {username}: {e}")
     return False
 
 
+def metrics_endpoint():
+    """Endpoint label for metrics ('cli' outside a request)"""
+    if not has_request_context():
+        return 'cli'
+    return request.endpoint or 'unmatched'
+
+def request_totals():
+    """Running query/db/render totals for the current request, or None"""
+    return g.get('request_totals') if has_request_context() else None
+
+@app.before_request
+def start_request_metrics():
+    """Start the request clock and its query/db/render totals"""
+    g.request_started = time.perf_counter()
+    g.request_totals = {'queries': 0, 'db': 0.0, 'acquire': 0.0, 'render': 0.0}
+
+@app.after_request
+def finish_request_metrics(response):
+    """Record the request and expose its breakdown in a Server-Timing header"""
+    started = g.get('request_started')
+    if started is None:
+        return response
+    elapsed = time.perf_counter() - started
+    totals = g.request_totals
+    METRICS.observe_request(metrics_endpoint(), request.method, response.status_code, elapsed, totals)
+    response.headers['Server-Timing'] = server_timing(totals, elapsed)
+    return response
+
+def share_metrics():
+    """Rewrite this worker's shared metrics file"""
+    with METRICS_SHARE_LOCK:
+        try:
+            write_shared(METRICS_CONFIG['shared_dir'], METRICS, metrics_gauges())
+        except OSError as e:
+            logger.warning(f"Could not share metrics: {e}")
+
+def run_metrics_sharing():
+    """Background loop of a worker: share its metrics every share_interval until it exits"""
+    while not METRICS_SHARE_STOP.wait(METRICS_CONFIG['share_interval']):
+        share_metrics()
+
+@before_render_template.connect_via(app)
+def start_render_timer(sender, template, context, **extra):
+    if has_request_context():
+        g.render_started = time.perf_counter()
+
+@template_rendered.connect_via(app)
+def stop_render_timer(sender, template, context, **extra):
+    totals = request_totals()
+    started = g.pop('render_started', None) if has_request_context() else None
+    if totals is not None and started is not None:
+        totals['render'] += time.perf_counter() - started
+
 @app.before_request
 def require_login():
     """Require login for all routes except the login page and static files."""
     # request.endpoint may be None for some requests (favicon, etc.)
     endpoint = request.endpoint or ''
-    allowed_endpoints = ('login', 'logout', 'static')
+    allowed_endpoints = ('login', 'logout', 'static', 'metrics')
     if endpoint in allowed_endpoints:
         return
 
@@ -70,24 +338,27 @@ def login():
         password = request.form.get('password') or ''
         target = request.form.get('next') or next_url
 
-        if verify_db_credentials(username, password):
-            DB_CONFIG['user'] = username
-            DB_CONFIG['password'] = password
+        verified = verify_db_credentials(username, password)
+        if verified:
             session['user'] = username
             session['db_user'] = username
             session['db_password'] = password
             flash('Logged in successfully', 'success')
             return redirect(target)
 
-        flash('Invalid credentials or database connection failed', 'error')
+        if verified is None:
+            flash('The server is busy, please try again in a moment', 'error')
+        else:
+            flash('Invalid credentials or database connection failed', 'error')
 
     return render_template('login.html', next=next_url)
 
 
 @app.route('/logout')
 def logout():
-    DB_CONFIG['user'] = DEFAULT_DB_CONFIG['user']
-    DB_CONFIG['password'] = DEFAULT_DB_CONFIG['password']
+    if session.get('db_user'):
+        # Other sessions of the same account open a new pool on their next request
+        remove_pool(current_db_config())
     session.pop('user', None)
     session.pop('db_user', None)
     session.pop('db_password', None)
@@ -95,48 +366,285 @@ def logout():
     return redirect(url_for('login'))
 
 def get_db_connection():
-    """Get database connection"""
+    """Get a pooled database connection for the current user (close() returns it to the pool)"""
+    started = time.perf_counter()
     try:
-        connection = mysql.connector.connect(**DB_CONFIG)
-        if connection.is_connected():
-            logger.info("Successfully connected to database")
-            return connection
+        connection = get_pool(current_db_config(), **POOL_CONFIG).acquire()
     except Error as e:
+        record_acquire(started, error=True)
         logger.error(f"Error connecting to database: {e}")
         return None
-    return None
+    record_acquire(started)
+    return connection
+
+def record_acquire(started, error=False):
+    """Pool checkout time by endpoint, added to the request's db time"""
+    elapsed = time.perf_counter() - started
+    METRICS.observe_acquire(metrics_endpoint(), elapsed, error)
+    totals = request_totals()
+    if totals is not None:
+        totals['acquire'] += elapsed
+
+def record_statement(operation, started, statements, rows=0, error=False, connection=None):
+    """Statement hook: latency, rows and errors by endpoint, the request totals, and the
+    slow query log. statements is the list of (sql, params) sent; connection, if still
+    checked out, is used to EXPLAIN a slow one.
+    """
+    elapsed = time.perf_counter() - started
+    observe_statement(metrics_endpoint(), operation, elapsed, statements, rows, error, connection)
+    totals = request_totals()
+    if totals is not None:
+        totals['queries'] += len(statements)
+        totals['db'] += elapsed
+
+def observe_statement(endpoint, operation, elapsed, statements, rows=0, error=False, connection=None):
+    """Statement metrics and slow query log without touching the request (safe from worker threads)"""
+    METRICS.observe_statement(endpoint, operation, elapsed, rows, error)
+    if SLOW_QUERIES.is_slow(elapsed):
+        SLOW_QUERIES.record(operation, statements, elapsed, endpoint, error, connection)
+
+def record_cache_hits(count=1):
+    METRICS.observe_cache_hit(metrics_endpoint(), count)
+
+def get_request_connection():
+    """Connection held in g for the whole request (released in teardown)"""
+    connection = g.get('db_connection')
+    if connection is None:
+        connection = get_db_connection()
+        g.db_connection = connection
+    return connection
+
+@app.teardown_appcontext
+def release_request_connection(exception=None):
+    """Hand the request's connection back to the pool"""
+    connection = g.pop('db_connection', None)
+    if connection is not None:
+        connection.close()
 
-def execute_query(query, params=None, fetch=True):
-    """Execute database query"""
-    connection = get_db_connection()
+def checkout_connection():
+    """Return (connection, owned); owned connections must be closed by the caller"""
+    if has_request_context():
+        return get_request_connection(), False
+    return get_db_connection(), True
+
+def discard_connection(connection, owned):
+    """Drop a connection that failed mid-statement so it is not reused"""
+    if not owned and g.get('db_connection') is connection:
+        g.pop('db_connection')
+    connection.discard()
+
+def cache_key(kind, text, params):
+    """Cache key: database user, statement text and parameters"""
+    return (current_db_config()['user'], kind, ' '.join(text.split()), tuple(params or ()))
+
+def cache_lookup(kind, text, params, tables):
+    """Return (key, versions, rows) for a cacheable read; rows is None on a miss"""
+    key = cache_key(kind, text, params)
+    hit, rows = QUERY_CACHE.get(key)
+    if hit:
+        return key, None, rows
+    return key, QUERY_CACHE.versions(tables), None
+
+def invalidate_tables(tables):
+    """Bump table versions after a write so cached reads of them are dropped"""
+    QUERY_CACHE.bump(tables)
+
+def execute_query(query, params=None, fetch=True, cache=False, audit=None):
+    """Execute database query.
+
+    With cache=True a read is served from QUERY_CACHE until one of its tables is written.
+    audit is a list of (kind, values) log rows for a write; with AUDIT_CONFIG['async']
+    they are queued on AUDIT_LOG after the commit and the log triggers skip the statement.
+    """
+    audit = audit if audit and AUDIT_CONFIG['async'] else None
+    tables = tables_read(query) if cache and fetch else ()
+    if tables:
+        key, versions, rows = cache_lookup('query', query, params, tables)
+        if rows is not None:
+            record_cache_hits()
+            return rows
+
+    connection, owned = checkout_connection()
     if not connection:
         return None
 
+    operation = 'select' if fetch else 'write'
+    started = time.perf_counter()
     try:
         cursor = connection.cursor(dictionary=True)
-        cursor.execute(query, params)
+        if audit:
+            # One round trip: the flag is set for this statement only
+            steps = cursor.execute(f"{AUDIT_FLAG_ON}; {query}; {AUDIT_FLAG_OFF}", params, multi=True)
+            rowcounts = [step.rowcount for step in steps]
+        else:
+            cursor.execute(query, params)
 
         if fetch:
             result = cursor.fetchall()
+            if tables:
+                QUERY_CACHE.put(key, tables, versions, result)
         else:
             connection.commit()
-            result = cursor.rowcount
+            result = rowcounts[1] if audit else cursor.rowcount
 
         cursor.close()
+        record_statement(operation, started, [(query, params)], len(result) if fetch else result,
+                         connection=connection)
+        for kind, values in audit or ():
+            AUDIT_LOG.record(kind, **values)
         return result
     except Error as e:
+        record_statement(operation, started, [(query, params)], error=True)
         logger.error(f"Error executing query: {e}")
-        connection.rollback()  # ← ADD THIS LINE (rollback on error)
+        try:
+            connection.rollback()
+            if audit:
+                connection.cursor().execute(AUDIT_FLAG_OFF)
+        except Error:
+            discard_connection(connection, owned)
+            owned = False
         return None
     finally:
-        connection.close()
+        if not fetch:
+            invalidate_tables(tables_written(query))
+        if owned:
+            connection.close()
 
-def execute_procedure(procedure_name, params=None):
-    """Execute stored procedure"""
-    connection = get_db_connection()
+def execute_batch(queries, cache=False):
+    """Run several read statements in one round trip and return a list of result sets.
+
+    Each item is either a SQL string or a (sql, params) tuple. With cache=True only the
+    statements missing from QUERY_CACHE are sent.
+    """
+    items, results, pending = cached_reads(queries, cache)
+    if not pending:
+        return results
+
+    connection, owned = checkout_connection()
     if not connection:
         return None
 
+    sent = [items[index] for index, _, _, _ in pending]
+    statements = []
+    params = []
+    for query, query_params in sent:
+        statements.append(query.strip().rstrip(';'))
+        params.extend(query_params or ())
+
+    started = time.perf_counter()
+    try:
+        cursor = connection.cursor(dictionary=True)
+        result_sets = []
+        for result in cursor.execute(';\n'.join(statements), tuple(params) or None, multi=True):
+            result_sets.append(result.fetchall() if result.with_rows else [])
+        cursor.close()
+        record_statement('batch', started, sent, sum(len(rows) for rows in result_sets), connection=connection)
+    except Error as e:
+        record_statement('batch', started, sent, error=True)
+        logger.error(f"Error executing batch: {e}")
+        remember_db_error(e)
+        # Unread result sets would be left on the connection, so drop it
+        discard_connection(connection, owned)
+        owned = False
+        return None
+    finally:
+        if owned:
+            connection.close()
+
+    return store_reads(results, pending, result_sets)
+
+def remember_db_error(e):
+    """Keep a failed read's error in g.db_error, for callers that act on its errno"""
+    if has_request_context():
+        g.db_error = e
+
+def cached_reads(queries, cache):
+    """Split batch reads into (items, results, pending): results holds the cache hits and
+    pending lists (index, key, tables, versions) for the statements still to run"""
+    items = [(item, None) if isinstance(item, str) else item for item in queries]
+    results = [None] * len(items)
+    pending = []
+    for index, (query, query_params) in enumerate(items):
+        tables = tables_read(query) if cache else ()
+        if tables:
+            key, versions, rows = cache_lookup('query', query, query_params, tables)
+            if rows is not None:
+                results[index] = rows
+                continue
+            pending.append((index, key, tables, versions))
+        else:
+            pending.append((index, None, (), None))
+    if len(pending) < len(items):
+        record_cache_hits(len(items) - len(pending))
+    return items, results, pending
+
+def store_reads(results, pending, result_sets):
+    """Fill in the result sets that were run and cache them"""
+    for (index, key, tables, versions), rows in zip(pending, result_sets):
+        results[index] = rows
+        if tables:
+            QUERY_CACHE.put(key, tables, versions, rows)
+    return results
+
+def execute_parallel(queries, cache=False, timeout=None):
+    """Run independent reads concurrently and return their result sets in order.
+
+    Takes the same items as execute_batch, but each statement runs on its own
+    connection from the user's fan-out pool, so the wait is the slowest statement
+    rather than the sum. Returns None if any statement fails or the reads are not
+    done within timeout (FANOUT_CONFIG['timeout']); unfinished statements are killed.
+    """
+    items, results, pending = cached_reads(queries, cache)
+    sent = [items[index] for index, _, _, _ in pending]
+    if len(sent) < 2:
+        # Nothing to overlap; one statement is cheapest on the request's own connection
+        result_sets = execute_batch(sent) if sent else []
+        return None if result_sets is None else store_reads(results, pending, result_sets)
+
+    endpoint = metrics_endpoint()
+    pool = get_pool(current_db_config(), name='fanout', **dict(POOL_CONFIG, max_size=FANOUT_CONFIG['max_size']))
+
+    def on_acquire(seconds, error):
+        METRICS.observe_acquire(endpoint, seconds, error)
+
+    def on_statement(sql, params, seconds, rows, error, connection):
+        observe_statement(endpoint, 'parallel', seconds, [(sql, params)], rows, error, connection)
+
+    started = time.perf_counter()
+    try:
+        result_sets = FANOUT.run(pool, sent, timeout or FANOUT_CONFIG['timeout'], on_acquire, on_statement)
+    except Error as e:
+        logger.error(f"Error executing parallel reads: {e}")
+        remember_db_error(e)
+        return None
+    finally:
+        # The request waited for the slowest read, so that is its database time
+        totals = request_totals()
+        if totals is not None:
+            totals['queries'] += len(sent)
+            totals['db'] += time.perf_counter() - started
+    return store_reads(results, pending, result_sets)
+
+def execute_procedure(procedure_name, params=None, cache=False):
+    """Execute stored procedure.
+
+    Read-only procedures listed in PROCEDURE_READS can be cached with cache=True;
+    any other procedure is treated as a write and invalidates the tables it touches.
+    """
+    reads = PROCEDURE_READS.get(procedure_name)
+    if cache and reads:
+        key, versions, rows = cache_lookup('procedure', procedure_name, params, reads)
+        if rows is not None:
+            record_cache_hits()
+            return rows
+
+    connection, owned = checkout_connection()
+    if not connection:
+        return None
+
+    operation = f'call {procedure_name}'
+    call = [(f"CALL {procedure_name}({', '.join(['%s'] * len(params or ()))})", params)]
+    started = time.perf_counter()
     try:
         cursor = connection.cursor(dictionary=True)
 
@@ -151,57 +659,321 @@ def execute_procedure(procedure_name, params=None):
             result.extend(dataset.fetchall())
 
         cursor.close()
+        record_statement(operation, started, call, len(result))
+        if cache and reads:
+            QUERY_CACHE.put(key, reads, versions, result)
         return result
     except Error as e:
+        record_statement(operation, started, call, error=True)
         logger.error(f"Error executing procedure {procedure_name}: {e}")
         return None
     finally:
-        connection.close()
+        if not reads:
+            written = PROCEDURE_WRITES.get(procedure_name)
+            invalidate_tables(with_dependents(written) if written else tuple(KNOWN_TABLES.values()))
+        if owned:
+            connection.close()
+
+def paginate(spec):
+    """Fetch one keyset page of a list for the current request args"""
+    query, params, state = build_page_query(spec, request.args)
+    return finish_page(execute_query(query, params, cache=True), state, spec)
+
+# Conditional GET: pages marked @conditional send an ETag and Last-Modified built from the
+# Table_Versions rows of the tables they read, and answer 304 while those are unchanged
+TABLE_VERSIONS_QUERY = """
+    SELECT Table_Name, SUM(Version) AS Version, UNIX_TIMESTAMP(MAX(Changed_At)) AS Changed_At
+    FROM Table_Versions
+    WHERE Table_Name IN ({})
+    GROUP BY Table_Name
+"""
+
+def release_tag():
+    """Latest change to app.py or a template, so new markup is never answered with 304"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    paths = [os.path.join(root, 'app.py')]
+    for folder, _, files in os.walk(os.path.join(root, 'templates')):
+        paths.extend(os.path.join(folder, name) for name in files)
+    return str(max(os.path.getmtime(path) for path in paths))
+
+PAGE_RELEASE = release_tag()
+
+def conditional(*sources):
+    """Answer a GET page with 304 Not Modified, without running the view, while the tables
+    it reads are unchanged. sources are the ListSpecs, SQL or procedure names the view reads.
+    """
+    read = set()
+    for source in sources:
+        if isinstance(source, ListSpec):
+            read.update(tables_read(source.select))
+        elif source in PROCEDURE_READS:
+            read.update(PROCEDURE_READS[source])
+        else:
+            read.update(tables_read(source))
+    watched = upstream_tables(read)
+    unversioned = set(watched) - set(VERSIONED_TABLES)
+    if unversioned:
+        raise ValueError(f"No change version for {', '.join(sorted(unversioned))}")
+    query = TABLE_VERSIONS_QUERY.format(', '.join(['%s'] * len(watched)))
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            # Pending flash messages belong in a fresh render
+            if request.method != 'GET' or session.get('_flashes'):
+                return view(*args, **kwargs)
+            rows = execute_query(query, watched)
+            if not rows:
+                # sql/table_versions.sql not installed
+                return view(*args, **kwargs)
+            versions = sorted((row['Table_Name'], int(row['Version'])) for row in rows)
+            changed_at = max(float(row['Changed_At']) for row in rows)
+            etag = hashlib.sha1(repr((PAGE_RELEASE, session.get('db_user'), request.full_path,
+                                      versions)).encode()).hexdigest()
+            last_modified = datetime.fromtimestamp(changed_at, timezone.utc)
+
+            if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+                response = Response(status=304)
+            else:
+                g.flashed = False
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200 or g.flashed:
+                    return response
+            response.set_etag(etag)
+            # Last-Modified has 1s resolution: only send it once no same-second change can follow
+            if time.time() - changed_at >= 1:
+                response.last_modified = last_modified
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
+
+@message_flashed.connect_via(app)
+def note_flash(sender, message, category, **extra):
+    g.flashed = True
+
+def touch_table_versions(tables):
+    """Bump change versions for writes no trigger sees (derived table rebuilds)"""
+    for table in tables:
+        execute_procedure('sp_touch_table_version', (table,))
+
+VERSION_SYNC_QUERY = TABLE_VERSIONS_QUERY.format(', '.join(['%s'] * len(VERSIONED_TABLES)))
+
+@app.before_request
+def sync_table_versions():
+    """In a forked worker, drop cached results of tables other workers changed.
+
+    At most every WORKER_CONFIG['version_sync'] seconds one request compares
+    Table_Versions with what this worker saw last and bumps the local
+    versions of the changed tables. The worker's own writes show up there too,
+    so their tables are bumped twice; that costs a reload, never a stale read.
+    """
+    if not VERSION_SYNC['enabled'] or not session.get('user'):
+        return
+    if time.monotonic() - VERSION_SYNC['checked_at'] < WORKER_CONFIG['version_sync']:
+        return
+    if not VERSION_SYNC_LOCK.acquire(blocking=False):
+        return
+    try:
+        VERSION_SYNC['checked_at'] = time.monotonic()
+        rows = execute_query(VERSION_SYNC_QUERY, VERSIONED_TABLES)
+        if not rows:
+            return
+        seen = {row['Table_Name']: int(row['Version']) for row in rows}
+        last = VERSION_SYNC['seen']
+        if last is not None:
+            changed = [table for table, version in seen.items() if last.get(table) != version]
+            if changed:
+                invalidate_tables(with_dependents(changed))
+        VERSION_SYNC['seen'] = seen
+    finally:
+        VERSION_SYNC_LOCK.release()
+
+@app.before_request
+def evict_idle_connections():
+    """Close idle-expired connections of every pool, at most every POOL_EVICTION['interval'] seconds.
+
+    A pool only evicts when it is checked out, so without this the pools of
+    users who stopped using the site would hold their connections open.
+    """
+    if time.monotonic() - POOL_EVICTION['checked_at'] < POOL_EVICTION['interval']:
+        return
+    if not POOL_EVICTION_LOCK.acquire(blocking=False):
+        return
+    try:
+        POOL_EVICTION['checked_at'] = time.monotonic()
+        evicted = evict_idle_pools()
+        if evicted:
+            logger.info(f"Closed {evicted} idle pooled connections")
+    finally:
+        POOL_EVICTION_LOCK.release()
+
+@app.route('/api/audit/stats')
+def api_audit_stats():
+    """Audit queue depth, written, spilled and replayed rows"""
+    return jsonify({'success': True, 'data': dict(AUDIT_LOG.stats(), async_enabled=AUDIT_CONFIG['async'])})
+
+@app.route('/api/pool/stats')
+def api_pool_stats():
+    """Connection pool usage (in-use, waiters, wait time) for sizing"""
+    return jsonify({'success': True, 'data': pool_stats()})
+
+@app.route('/metrics')
+def metrics():
+    """Statement, checkout and request metrics in Prometheus text format"""
+    token = METRICS_CONFIG['token']
+    if not session.get('user') and not (token and request.headers.get('Authorization') == f'Bearer {token}'):
+        abort(401)
+    directory = METRICS_CONFIG['shared_dir']
+    if directory:
+        # Every worker, this one included, is read from its file: files only grow, so the
+        # totals never go backwards whichever worker the next scrape reaches
+        share_metrics()
+        text = METRICS.render(metrics_gauges(), read_shared(directory), own=False)
+    else:
+        text = METRICS.render(metrics_gauges())
+    return Response(text, content_type='text/plain; version=0.0.4; charset=utf-8')
+
+def metrics_gauges():
+    """Pool and query cache gauges of this process"""
+    # Summed over database users, so the output never lists login names
+    pools = {}
+    for pool in pool_stats():
+        totals = pools.setdefault(pool['name'], {'in_use': 0, 'idle': 0, 'waiters': 0})
+        for key in totals:
+            totals[key] += pool[key]
+    cache = QUERY_CACHE.stats()
+    gauges = [
+        ('portal_db_pool_connections', 'Pooled connections by state.', ('pool', 'state'),
+         [((name, state), totals[state]) for name, totals in pools.items() for state in ('in_use', 'idle')]),
+        ('portal_db_pool_waiters', 'Requests waiting for a pooled connection.', ('pool',),
+         [((name,), totals['waiters']) for name, totals in pools.items()]),
+        ('portal_query_cache_entries', 'Result sets held in the query cache.', (), [((), cache['entries'])]),
+        ('portal_query_cache_rows', 'Rows held in the query cache.', (), [((), cache['rows'])]),
+    ]
+    return gauges
+
+@app.route('/api/cache/stats')
+def api_cache_stats():
+    """Query cache hit/miss counters and table versions"""
+    return jsonify({'success': True, 'data': QUERY_CACHE.stats()})
 
 @app.route('/')
 def index():
     """Home page"""
     return render_template('index.html')
 
+# Row counts kept exact by the triggers in sql/dashboard_counters.sql
+MISSING_TABLE_ERRNO = 1146
+EMPTY_DASHBOARD = {'alumni_count': 0, 'student_count': 0, 'session_count': 0, 'feedback_count': 0,
+                   'recent_sessions': []}
+DASHBOARD_COUNTS_QUERY = """
+    SELECT Table_Name, SUM(Row_Count) as count
+    FROM Table_Counts
+    WHERE Table_Name IN ('Alumni', 'Student', 'MentorshipSession', 'Feedback')
+    GROUP BY Table_Name
+"""
+
+# Covered by idx_session_date (Session_Date, Session_ID, Alumni_ID, Student_ID), read
+# backwards and stopped after 5 rows
+RECENT_SESSIONS_QUERY = """
+    SELECT ms.Session_Date, a.Name as Alumni_Name, s.Name as Student_Name
+    FROM MentorshipSession ms
+    JOIN Alumni a ON ms.Alumni_ID = a.Alumni_ID
+    JOIN Student s ON ms.Student_ID = s.Student_ID
+    ORDER BY ms.Session_Date DESC, ms.Session_ID DESC LIMIT 5
+"""
+
 @app.route('/dashboard')
+@conditional(DASHBOARD_COUNTS_QUERY, RECENT_SESSIONS_QUERY)
 def dashboard():
     """Dashboard showing database statistics"""
     try:
         stats = {}
 
-        # Get table counts
-        stats['alumni_count'] = execute_query("SELECT COUNT(*) as count FROM Alumni")[0]['count']
-        stats['student_count'] = execute_query("SELECT COUNT(*) as count FROM Student")[0]['count']
-        stats['session_count'] = execute_query("SELECT COUNT(*) as count FROM MentorshipSession")[0]['count']
-        stats['feedback_count'] = execute_query("SELECT COUNT(*) as count FROM Feedback")[0]['count']
-
-        # Get recent activity
-        stats['recent_sessions'] = execute_query("""
-            SELECT ms.Session_Date, a.Name as Alumni_Name, s.Name as Student_Name
-            FROM MentorshipSession ms
-            JOIN Alumni a ON ms.Alumni_ID = a.Alumni_ID
-            JOIN Student s ON ms.Student_ID = s.Student_ID
-            ORDER BY ms.Session_Date DESC LIMIT 5
-        """)
+        # Table counts (from the trigger-maintained counters) and recent activity, fetched concurrently
+        g.pop('db_error', None)
+        results = execute_parallel([DASHBOARD_COUNTS_QUERY, RECENT_SESSIONS_QUERY], cache=True)
+        if results is None and getattr(g.pop('db_error', None), 'errno', None) == MISSING_TABLE_ERRNO:
+            # sql/dashboard_counters.sql not installed; fall back to scanning the tables
+            scanned = execute_parallel([
+                "SELECT COUNT(*) as count FROM Alumni",
+                "SELECT COUNT(*) as count FROM Student",
+                "SELECT COUNT(*) as count FROM MentorshipSession",
+                "SELECT COUNT(*) as count FROM Feedback",
+                RECENT_SESSIONS_QUERY
+            ], cache=True)
+            if scanned is not None:
+                alumni, students, sessions, feedback, recent = scanned
+                results = [[
+                    {'Table_Name': 'Alumni', 'count': alumni[0]['count']},
+                    {'Table_Name': 'Student', 'count': students[0]['count']},
+                    {'Table_Name': 'MentorshipSession', 'count': sessions[0]['count']},
+                    {'Table_Name': 'Feedback', 'count': feedback[0]['count']}
+                ], recent]
+        if results is None:
+            # A timeout or lost connection; scanning the tables would only add load
+            flash('Error loading dashboard: the statistics could not be read', 'error')
+            return render_template('dashboard.html', stats=EMPTY_DASHBOARD)
+        counts, recent = results
+        counts = {row['Table_Name']: int(row['count']) for row in counts}
+
+        stats['alumni_count'] = counts.get('Alumni', 0)
+        stats['student_count'] = counts.get('Student', 0)
+        stats['session_count'] = counts.get('MentorshipSession', 0)
+        stats['feedback_count'] = counts.get('Feedback', 0)
+        stats['recent_sessions'] = recent
 
         return render_template('dashboard.html', stats=stats)
     except Exception as e:
         flash(f'Error loading dashboard: {str(e)}', 'error')
-        return render_template('dashboard.html', stats={})
+        return render_template('dashboard.html', stats=EMPTY_DASHBOARD)
 
 # Alumni Routes
-@app.route('/alumni')
-def list_alumni():
-    """List all alumni"""
-    alumni = execute_query("""
+ALUMNI_LIST = ListSpec(
+    select="""
         SELECT Alumni_ID, Name, Email, Current_Designation, Company, Years_of_Experience
         FROM Alumni
-        ORDER BY Name
-    """)
-    return render_template('alumni/list.html', alumni=alumni)
+    """,
+    id_column='Alumni_ID', id_key='Alumni_ID',
+    sorts={
+        'name': ('Name', 'Name', 'asc', False),
+        'experience': ('Years_of_Experience', 'Years_of_Experience', 'desc', True)
+    },
+    default_sort='name',
+    filters={
+        'name': ('Name LIKE %s', prefix),
+        'company': ('Company = %s', str),
+        'designation': ('Current_Designation = %s', str)
+    }
+)
+
+@app.route('/alumni')
+@conditional(ALUMNI_LIST)
+def list_alumni():
+    """List alumni one keyset page at a time"""
+    alumni, page = paginate(ALUMNI_LIST)
+    filter_fields = [('name', 'Name starts with', 'text'), ('company', 'Company', 'text'),
+                     ('designation', 'Designation', 'text')]
+    return render_template('alumni/list.html', alumni=alumni, page=page, filter_fields=filter_fields)
 
 # Alumni Achievements Route
+ACHIEVEMENT_LIST = ListSpec(
+    select="""
+        SELECT Achievement_ID, Alumni_ID, Awarding_Body, Title, Description, Year
+        FROM Achievement
+    """,
+    id_column='Achievement_ID', id_key='Achievement_ID',
+    sorts={'year': ('Year', 'Year', 'desc', True)},
+    default_sort='year',
+    filters={
+        'alumni_id': ('Alumni_ID = %s', str),
+        'year': ('Year = %s', int)
+    }
+)
+
 @app.route('/alumni/achievements')
+@conditional(ACHIEVEMENT_LIST)
 def alumni_achievements():
     """Display all alumni achievements and handle add form submission"""
     if request.method == 'POST':
@@ -221,19 +993,20 @@ def alumni_achievements():
         except Exception as e:
             flash(f'Error adding achievement: {str(e)}', 'error')
             # fall through to reload page with error
-    achievements = execute_query("""
-        SELECT Achievement_ID, Alumni_ID, Awarding_Body, Title, Description, Year
-        FROM Achievement
-        ORDER BY Year DESC
-    """)
-    return render_template('alumni/achievements.html', achievements=achievements)
+    achievements, page = paginate(ACHIEVEMENT_LIST)
+    filter_fields = [('alumni_id', 'Alumni ID', 'text'), ('year', 'Year', 'number')]
+    return render_template('alumni/achievements.html', achievements=achievements, page=page,
+                           filter_fields=filter_fields)
 
 # Delete Achievement Route
 @app.route('/alumni/achievements/delete/<achievement_id>', methods=['POST'])
 def delete_achievement(achievement_id):
     try:
-        execute_query('DELETE FROM Achievement WHERE Achievement_ID = %s', (achievement_id,), fetch=False)
-        flash('Achievement deleted successfully!', 'success')
+        query = 'DELETE FROM Achievement WHERE Achievement_ID = %s'
+        if execute_query(query, (achievement_id,), fetch=False) is None:
+            flash('Could not delete achievement; see the log for details', 'error')
+        else:
+            flash('Achievement deleted successfully!', 'success')
     except Exception as e:
         flash(f'Error deleting achievement: {str(e)}', 'error')
     return redirect(url_for('alumni_achievements'))
@@ -251,9 +1024,11 @@ def edit_achievement(achievement_id):
                 data['alumni_id'], data['awarding_body'], data['title'],
                 data['description'], data['year'], achievement_id
             )
-            execute_query(query, params, fetch=False)
-            flash('Achievement updated successfully!', 'success')
-            return redirect(url_for('alumni_achievements'))
+            if execute_query(query, params, fetch=False) is None:
+                flash('Could not update achievement; see the log for details', 'error')
+            else:
+                flash('Achievement updated successfully!', 'success')
+                return redirect(url_for('alumni_achievements'))
         except Exception as e:
             flash(f'Error updating achievement: {str(e)}', 'error')
     # GET: fetch achievement
@@ -267,19 +1042,31 @@ def edit_achievement(achievement_id):
 app.add_url_rule('/alumni/achievements', view_func=alumni_achievements, methods=['GET', 'POST'])
 
 # Industry Routes
-@app.route('/industries')
-def list_industries():
-    """List all industries"""
-    industries = execute_query(
-        """
+INDUSTRY_LIST = ListSpec(
+    select="""
         SELECT i.Industry_ID, i.Alumni_ID, i.Sector, i.Location, i.Size, i.Industry_Name,
                a.Name as Alumni_Name
         FROM Industry i
         LEFT JOIN Alumni a ON i.Alumni_ID = a.Alumni_ID
-        ORDER BY i.Industry_Name
-        """
-    ) or []
-    return render_template('industry/list.html', industries=industries)
+    """,
+    id_column='i.Industry_ID', id_key='Industry_ID',
+    sorts={'name': ('i.Industry_Name', 'Industry_Name', 'asc', True)},
+    default_sort='name',
+    filters={
+        'name': ('i.Industry_Name LIKE %s', prefix),
+        'sector': ('i.Sector = %s', str),
+        'location': ('i.Location = %s', str)
+    }
+)
+
+@app.route('/industries')
+@conditional(INDUSTRY_LIST)
+def list_industries():
+    """List industries one keyset page at a time"""
+    industries, page = paginate(INDUSTRY_LIST)
+    filter_fields = [('name', 'Name starts with', 'text'), ('sector', 'Sector', 'text'),
+                     ('location', 'Location', 'text')]
+    return render_template('industry/list.html', industries=industries, page=page, filter_fields=filter_fields)
 
 
 @app.route('/industries/add', methods=['GET', 'POST'])
@@ -301,17 +1088,25 @@ def add_industry():
                 data.get('industry_name') or None
             )
 
-            execute_query(query, params, fetch=False)
+            if execute_query(query, params, fetch=False) is None:
+                flash('Could not add industry; see the log for details', 'error')
+                return render_template('industry/add.html', edit_mode=False)
             flash('Industry added successfully!', 'success')
             return redirect(url_for('list_industries'))
 
         except Exception as e:
             flash(f'Error adding industry: {str(e)}', 'error')
 
-    alumni = execute_query("SELECT Alumni_ID, Name FROM Alumni ORDER BY Name") or []
-    return render_template('industry/add.html', alumni=alumni, edit_mode=False)
+    return render_template('industry/add.html', edit_mode=False)
 
 
+# Form rows carry the picked alumnus' name for the lookup field
+INDUSTRY_FORM_QUERY = """
+    SELECT i.*, a.Name AS Alumni_Name
+    FROM Industry i LEFT JOIN Alumni a ON i.Alumni_ID = a.Alumni_ID
+    WHERE i.Industry_ID = %s
+"""
+
 @app.route('/industries/edit/<industry_id>', methods=['GET', 'POST'])
 def edit_industry(industry_id):
     """Edit existing industry"""
@@ -332,20 +1127,21 @@ def edit_industry(industry_id):
                 industry_id
             )
 
-            execute_query(query, params, fetch=False)
-            flash('Industry updated successfully!', 'success')
-            return redirect(url_for('list_industries'))
+            if execute_query(query, params, fetch=False) is None:
+                flash('Could not update industry; see the log for details', 'error')
+            else:
+                flash('Industry updated successfully!', 'success')
+                return redirect(url_for('list_industries'))
 
         except Exception as e:
             flash(f'Error updating industry: {str(e)}', 'error')
 
-    industry = execute_query("SELECT * FROM Industry WHERE Industry_ID = %s", (industry_id,))
+    industry = execute_query(INDUSTRY_FORM_QUERY, (industry_id,))
     if not industry:
         flash('Industry not found!', 'error')
         return redirect(url_for('list_industries'))
 
-    alumni = execute_query("SELECT Alumni_ID, Name FROM Alumni ORDER BY Name") or []
-    return render_template('industry/add.html', industry=industry[0], alumni=alumni, edit_mode=True)
+    return render_template('industry/add.html', industry=industry[0], edit_mode=True)
 
 
 @app.route('/industries/delete/<industry_id>', methods=['POST'])
@@ -353,25 +1149,37 @@ def delete_industry(industry_id):
     """Delete industry"""
     try:
         query = "DELETE FROM Industry WHERE Industry_ID = %s"
-        execute_query(query, (industry_id,), fetch=False)
-        flash('Industry deleted successfully!', 'success')
+        if execute_query(query, (industry_id,), fetch=False) is None:
+            flash('Could not delete industry; see the log for details', 'error')
+        else:
+            flash('Industry deleted successfully!', 'success')
     except Exception as e:
         flash(f'Error deleting industry: {str(e)}', 'error')
     return redirect(url_for('list_industries'))
 
 
 # Skills Routes
-@app.route('/skills')
-def list_skills():
-    """List all skills"""
-    skills = execute_query(
-        """
+SKILL_LIST = ListSpec(
+    select="""
         SELECT Skill_ID, Skill_Name, Proficiency_Level, Category
         FROM Skill
-        ORDER BY Skill_Name
-        """
-    ) or []
-    return render_template('skills/list.html', skills=skills)
+    """,
+    id_column='Skill_ID', id_key='Skill_ID',
+    sorts={'name': ('Skill_Name', 'Skill_Name', 'asc', False)},
+    default_sort='name',
+    filters={
+        'name': ('Skill_Name LIKE %s', prefix),
+        'category': ('Category = %s', str)
+    }
+)
+
+@app.route('/skills')
+@conditional(SKILL_LIST)
+def list_skills():
+    """List skills one keyset page at a time"""
+    skills, page = paginate(SKILL_LIST)
+    filter_fields = [('name', 'Name starts with', 'text'), ('category', 'Category', 'text')]
+    return render_template('skills/list.html', skills=skills, page=page, filter_fields=filter_fields)
 
 
 @app.route('/skills/add', methods=['GET', 'POST'])
@@ -391,7 +1199,9 @@ def add_skill():
                 data.get('category') or None
             )
 
-            execute_query(query, params, fetch=False)
+            if execute_query(query, params, fetch=False) is None:
+                flash('Could not add skill; see the log for details', 'error')
+                return render_template('skills/add.html', edit_mode=False)
             flash('Skill added successfully!', 'success')
             return redirect(url_for('list_skills'))
 
@@ -419,9 +1229,11 @@ def edit_skill(skill_id):
                 skill_id
             )
 
-            execute_query(query, params, fetch=False)
-            flash('Skill updated successfully!', 'success')
-            return redirect(url_for('list_skills'))
+            if execute_query(query, params, fetch=False) is None:
+                flash('Could not update skill; see the log for details', 'error')
+            else:
+                flash('Skill updated successfully!', 'success')
+                return redirect(url_for('list_skills'))
 
         except Exception as e:
             flash(f'Error updating skill: {str(e)}', 'error')
@@ -439,8 +1251,10 @@ def delete_skill(skill_id):
     """Delete skill"""
     try:
         query = "DELETE FROM Skill WHERE Skill_ID = %s"
-        execute_query(query, (skill_id,), fetch=False)
-        flash('Skill deleted successfully!', 'success')
+        if execute_query(query, (skill_id,), fetch=False) is None:
+            flash('Could not delete skill; see the log for details', 'error')
+        else:
+            flash('Skill deleted successfully!', 'success')
     except Exception as e:
         flash(f'Error deleting skill: {str(e)}', 'error')
     return redirect(url_for('list_skills'))
@@ -457,13 +1271,22 @@ def add_alumni():
                                   Current_Designation, Company, Location, Years_of_Experience)
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
-            params = (
-                data['alumni_id'], data['name'], data['phone'], data['email'],
-                data['graduation_year'], data['designation'], data['company'],
-                data['location'], data['experience'] or None
-            )
-
-            execute_query(query, params, fetch=False)
+            params, errors = check_insert('alumni', {
+                'Alumni_ID': data['alumni_id'], 'Name': data['name'], 'Phone_Number': data['phone'],
+                'Email': data['email'], 'Graduation_Year': data['graduation_year'],
+                'Current_Designation': data['designation'], 'Company': data['company'],
+                'Location': data['location'], 'Years_of_Experience': data['experience']
+            })
+            if errors:
+                for error in errors:
+                    flash(error, 'error')
+                return render_template('alumni/add.html')
+
+            before = QUERY_CACHE.versions(('Alumni',))
+            if execute_query(query, params, fetch=False) is None:
+                flash('Could not add alumni; see the log for details', 'error')
+                return render_template('alumni/add.html')
+            remember_insert('Alumni', params[0], params[3], params[2], before)
             flash('Alumni added successfully!', 'success')
             return redirect(url_for('list_alumni'))
 
@@ -491,7 +1314,10 @@ def edit_alumni(alumni_id):
                 data['location'], data['experience'] or None, alumni_id
             )
 
-            execute_query(query, params, fetch=False)
+            if execute_query(query, params, fetch=False) is None:
+                flash('Could not update alumni; see the log for details', 'error')
+                alumni = execute_query("SELECT * FROM Alumni WHERE Alumni_ID = %s", (alumni_id,))
+                return render_template('alumni/add.html', alumni=alumni[0] if alumni else None, edit_mode=True)
             flash('Alumni updated successfully!', 'success')
             return redirect(url_for('list_alumni'))
 
@@ -517,7 +1343,9 @@ def delete_alumni(alumni_id):
         result = execute_query(query, (alumni_id,), fetch=False)
 
         # Verify the deletion worked
-        if result and result > 0:
+        if result is None:
+            flash('Could not delete alumni; see the log for details', 'error')
+        elif result > 0:
             flash(f'Alumni deleted successfully! ({result} record(s) removed)', 'success')
         else:
             flash('Insufficient priveleges.', 'error')
@@ -526,15 +1354,29 @@ def delete_alumni(alumni_id):
     return redirect(url_for('list_alumni'))
 
 # Student Routes
-@app.route('/students')
-def list_students():
-    """List all students"""
-    students = execute_query("""
+STUDENT_LIST = ListSpec(
+    select="""
         SELECT Student_ID, Name, Email, Department, Year_of_Study
         FROM Student
-        ORDER BY Name
-    """)
-    return render_template('students/list.html', students=students)
+    """,
+    id_column='Student_ID', id_key='Student_ID',
+    sorts={'name': ('Name', 'Name', 'asc', False)},
+    default_sort='name',
+    filters={
+        'name': ('Name LIKE %s', prefix),
+        'department': ('Department = %s', str),
+        'year': ('Year_of_Study = %s', int)
+    }
+)
+
+@app.route('/students')
+@conditional(STUDENT_LIST)
+def list_students():
+    """List students one keyset page at a time"""
+    students, page = paginate(STUDENT_LIST)
+    filter_fields = [('name', 'Name starts with', 'text'), ('department', 'Department', 'text'),
+                     ('year', 'Year of Study', 'number')]
+    return render_template('students/list.html', students=students, page=page, filter_fields=filter_fields)
 
 @app.route('/students/add', methods=['GET', 'POST'])
 def add_student():
@@ -546,12 +1388,21 @@ def add_student():
                 INSERT INTO Student (Student_ID, Name, Phone_Number, Email, Department, Year_of_Study)
                 VALUES (%s, %s, %s, %s, %s, %s)
             """
-            params = (
-                data['student_id'], data['name'], data['phone'], data['email'],
-                data['department'], data['year_of_study']
-            )
-
-            execute_query(query, params, fetch=False)
+            params, errors = check_insert('students', {
+                'Student_ID': data['student_id'], 'Name': data['name'], 'Phone_Number': data['phone'],
+                'Email': data['email'], 'Department': data['department'],
+                'Year_of_Study': data['year_of_study']
+            })
+            if errors:
+                for error in errors:
+                    flash(error, 'error')
+                return render_template('students/add.html')
+
+            before = QUERY_CACHE.versions(('Student',))
+            if execute_query(query, params, fetch=False) is None:
+                flash('Could not add student; see the log for details', 'error')
+                return render_template('students/add.html')
+            remember_insert('Student', params[0], params[3], params[2], before)
             flash('Student added successfully!', 'success')
             return redirect(url_for('list_students'))
 
@@ -577,7 +1428,10 @@ def edit_student(student_id):
                 data['department'], data['year_of_study'], student_id
             )
 
-            execute_query(query, params, fetch=False)
+            if execute_query(query, params, fetch=False) is None:
+                flash('Could not update student; see the log for details', 'error')
+                student = execute_query("SELECT * FROM Student WHERE Student_ID = %s", (student_id,))
+                return render_template('students/add.html', student=student[0] if student else None, edit_mode=True)
             flash('Student updated successfully!', 'success')
             return redirect(url_for('list_students'))
 
@@ -600,25 +1454,42 @@ def delete_student(student_id):
     """Delete student"""
     try:
         query = "DELETE FROM Student WHERE Student_ID = %s"
-        execute_query(query, (student_id,), fetch=False)
-        flash('Student deleted successfully!', 'success')
+        if execute_query(query, (student_id,), fetch=False) is None:
+            flash('Could not delete student; see the log for details', 'error')
+        else:
+            flash('Student deleted successfully!', 'success')
     except Exception as e:
         flash(f'Error deleting student: {str(e)}', 'error')
     return redirect(url_for('list_students'))
 
 # Mentorship Session Routes
-@app.route('/sessions')
-def list_sessions():
-    """List mentorship sessions"""
-    sessions = execute_query("""
+SESSION_LIST = ListSpec(
+    select="""
         SELECT ms.Session_ID, ms.Session_Date, ms.Duration_Minutes, ms.Topic,
                a.Name as Alumni_Name, s.Name as Student_Name
         FROM MentorshipSession ms
         JOIN Alumni a ON ms.Alumni_ID = a.Alumni_ID
         JOIN Student s ON ms.Student_ID = s.Student_ID
-        ORDER BY ms.Session_Date DESC
-    """)
-    return render_template('sessions/list.html', sessions=sessions)
+    """,
+    id_column='ms.Session_ID', id_key='Session_ID',
+    sorts={'date': ('ms.Session_Date', 'Session_Date', 'desc', True)},
+    default_sort='date',
+    filters={
+        'alumni_id': ('ms.Alumni_ID = %s', str),
+        'student_id': ('ms.Student_ID = %s', str),
+        'date_from': ('ms.Session_Date >= %s', parse_date),
+        'date_to': ('ms.Session_Date <= %s', parse_date)
+    }
+)
+
+@app.route('/sessions')
+@conditional(SESSION_LIST)
+def list_sessions():
+    """List mentorship sessions one keyset page at a time"""
+    sessions, page = paginate(SESSION_LIST)
+    filter_fields = [('alumni_id', 'Alumni ID', 'text'), ('student_id', 'Student ID', 'text'),
+                     ('date_from', 'From', 'date'), ('date_to', 'To', 'date')]
+    return render_template('sessions/list.html', sessions=sessions, page=page, filter_fields=filter_fields)
 
 @app.route('/sessions/add', methods=['GET', 'POST'])
 def add_session():
@@ -631,26 +1502,42 @@ def add_session():
                                              Session_Date, Duration_Minutes, Topic)
                 VALUES (%s, %s, %s, %s, %s, %s)
             """
-            params = (
-                data['session_id'], data['alumni_id'], data['student_id'],
-                data['session_date'], data['duration'], data['topic']
-            )
-
-            execute_query(query, params, fetch=False)
+            params, errors = check_insert('sessions', {
+                'Session_ID': data['session_id'], 'Alumni_ID': data['alumni_id'],
+                'Student_ID': data['student_id'], 'Session_Date': data['session_date'],
+                'Duration_Minutes': data['duration'], 'Topic': data['topic']
+            })
+            if errors:
+                for error in errors:
+                    flash(error, 'error')
+                return render_template('sessions/add.html')
+            activity = {
+                'Activity_Type': 'Session Scheduled', 'Alumni_ID': data['alumni_id'],
+                'Student_ID': data['student_id'], 'Activity_Date': data['session_date'],
+                'Details': f"Topic: {data['topic']}, Duration: {data['duration']} mins"
+            }
+
+            before = QUERY_CACHE.versions(AVAILABILITY_TABLES)
+            if execute_query(query, params, fetch=False, audit=[('activity', activity)]) is None:
+                flash('Could not add session; see the log for details', 'error')
+                return render_template('sessions/add.html')
+            record_session_write(params[0], params[1], params[3], before)
             flash('Session added successfully!', 'success')
             return redirect(url_for('list_sessions'))
 
         except Exception as e:
             flash(f'Error adding session: {str(e)}', 'error')
-            # Get alumni and student lists for dropdown
-            alumni = execute_query("SELECT Alumni_ID, Name FROM Alumni ORDER BY Name")
-            students = execute_query("SELECT Student_ID, Name FROM Student ORDER BY Name")
-            return render_template('sessions/add.html', alumni=alumni, students=students)
 
-    # Get alumni and student lists for dropdown
-    alumni = execute_query("SELECT Alumni_ID, Name FROM Alumni ORDER BY Name")
-    students = execute_query("SELECT Student_ID, Name FROM Student ORDER BY Name")
-    return render_template('sessions/add.html', alumni=alumni, students=students)
+    return render_template('sessions/add.html')
+
+# Form rows carry the picked alumnus' and student's names for the lookup fields
+SESSION_FORM_QUERY = """
+    SELECT ms.*, a.Name AS Alumni_Name, s.Name AS Student_Name
+    FROM MentorshipSession ms
+    LEFT JOIN Alumni a ON ms.Alumni_ID = a.Alumni_ID
+    LEFT JOIN Student s ON ms.Student_ID = s.Student_ID
+    WHERE ms.Session_ID = %s
+"""
 
 @app.route('/sessions/edit/<session_id>', methods=['GET', 'POST'])
 def edit_session(session_id):
@@ -668,87 +1555,141 @@ def edit_session(session_id):
                 data['session_date'], data['duration'], data['topic'], session_id
             )
 
-            execute_query(query, params, fetch=False)
+            before = QUERY_CACHE.versions(AVAILABILITY_TABLES)
+            if execute_query(query, params, fetch=False) is None:
+                flash('Could not update session; see the log for details', 'error')
+                session = execute_query(SESSION_FORM_QUERY, (session_id,))
+                return render_template('sessions/add.html', session=session[0] if session else None,
+                                       edit_mode=True)
+            record_session_write(session_id, data['alumni_id'], data['session_date'], before)
             flash('Session updated successfully!', 'success')
             return redirect(url_for('list_sessions'))
 
         except Exception as e:
             flash(f'Error updating session: {str(e)}', 'error')
-            # Get alumni and student lists for dropdown
-            alumni = execute_query("SELECT Alumni_ID, Name FROM Alumni ORDER BY Name")
-            students = execute_query("SELECT Student_ID, Name FROM Student ORDER BY Name")
-            # Get session data for form repopulation
-            session = execute_query("SELECT * FROM MentorshipSession WHERE Session_ID = %s", (session_id,))
-            return render_template('sessions/add.html', alumni=alumni, students=students, session=session[0] if session else None, edit_mode=True)
+            # Session data for form repopulation
+            session = execute_query(SESSION_FORM_QUERY, (session_id,))
+            return render_template('sessions/add.html', session=session[0] if session else None, edit_mode=True)
 
     # GET request - fetch session data
-    session = execute_query("SELECT * FROM MentorshipSession WHERE Session_ID = %s", (session_id,))
+    session = execute_query(SESSION_FORM_QUERY, (session_id,))
     if not session:
         flash('Session not found!', 'error')
         return redirect(url_for('list_sessions'))
 
-    # Get alumni and student lists for dropdown
-    alumni = execute_query("SELECT Alumni_ID, Name FROM Alumni ORDER BY Name")
-    students = execute_query("SELECT Student_ID, Name FROM Student ORDER BY Name")
-    return render_template('sessions/add.html', alumni=alumni, students=students, session=session[0], edit_mode=True)
+    return render_template('sessions/add.html', session=session[0], edit_mode=True)
 
 @app.route('/sessions/delete/<session_id>', methods=['POST'])
 def delete_session(session_id):
     """Delete mentorship session"""
     try:
         query = "DELETE FROM MentorshipSession WHERE Session_ID = %s"
-        execute_query(query, (session_id,), fetch=False)
-        flash('Session deleted successfully!', 'success')
+        before = QUERY_CACHE.versions(AVAILABILITY_TABLES)
+        if execute_query(query, (session_id,), fetch=False) is None:
+            flash('Could not delete session; see the log for details', 'error')
+        else:
+            record_session_write(session_id, None, None, before)
+            flash('Session deleted successfully!', 'success')
     except Exception as e:
         flash(f'Error deleting session: {str(e)}', 'error')
     return redirect(url_for('list_sessions'))
 
-@app.route('/sessions/delete-old', methods=['POST'])
-def delete_old_sessions():
-    """Delete all mentorship sessions older than 7 days"""
+def run_archive(config):
+    """Archive job body for the background thread, on its own connection"""
     try:
-        result = execute_procedure('DeleteOldSessions')
-        if result:
-            message = result[0].get('Message', 'Old sessions deleted successfully')
-            flash(message, 'success')
-        else:
-            flash('No sessions to delete or error occurred', 'info')
-    except Exception as e:
-        flash(f'Error deleting old sessions: {str(e)}', 'error')
+        connection = mysql.connector.connect(**config)
+    except Error as e:
+        logger.error(f"Session archive could not connect: {e}")
+        return
+    try:
+        progress = archive.archive_sessions(
+            connection, on_batch=lambda progress: invalidate_tables(ARCHIVE_TABLES),
+            should_stop=ARCHIVE_STOP.is_set, **ARCHIVE_CONFIG
+        )
+        logger.info(f"Session archive job {progress['job_id']} {progress['status']}: "
+                    f"{progress['archived']} archived in {progress['elapsed_seconds']}s")
+    except (Error, archive.ArchiveError) as e:
+        logger.error(f"Session archive failed: {e}")
+    finally:
+        connection.close()
+        invalidate_tables(ARCHIVE_TABLES)
+
+def start_archive():
+    """Start the archive job in the background unless it is already running here"""
+    global ARCHIVE_THREAD
+    with ARCHIVE_THREAD_LOCK:
+        if ARCHIVE_THREAD is not None and ARCHIVE_THREAD.is_alive():
+            return False
+        ARCHIVE_STOP.clear()
+        ARCHIVE_THREAD = threading.Thread(target=run_archive, args=(current_db_config(),),
+                                          name='session-archive', daemon=True)
+        ARCHIVE_THREAD.start()
+        return True
+
+@app.route('/sessions/archive', methods=['POST'])
+def archive_old_sessions():
+    """Move sessions older than ARCHIVE_CONFIG['older_than_days'] to Session_Archive in the background"""
+    if request.form.get('action') == 'stop':
+        # The job may be running in another worker process
+        ARCHIVE_STOP.set()
+        execute_query(archive.PAUSE_RUNNING_JOB, fetch=False)
+        flash('Session archive will pause after the current batch', 'info')
+    elif start_archive():
+        flash(f"Archiving sessions older than {ARCHIVE_CONFIG['older_than_days']} days in the background", 'success')
+    else:
+        flash('Session archive is already running', 'info')
     return redirect(url_for('list_sessions'))
 
+@app.route('/api/archive/sessions')
+def api_archive_status():
+    """Latest archive job from Archive_Jobs, and whether this process is running it"""
+    rows = execute_query("SELECT * FROM Archive_Jobs ORDER BY Job_ID DESC LIMIT 1")
+    if rows is None:
+        return jsonify({'success': False, 'error': 'Could not read Archive_Jobs (is session_archive.sql installed?)'})
+    running = ARCHIVE_THREAD is not None and ARCHIVE_THREAD.is_alive()
+    return jsonify({'success': True, 'data': {'job': rows[0] if rows else None, 'running_here': running}})
+
 # Feedback Routes
+FEEDBACK_LIST = ListSpec(
+    select="""
+        SELECT f.Feedback_ID, f.Rating, f.Date, f.Comments,
+               a.Name as Alumni_Name, s.Name as Student_Name
+        FROM Feedback f
+        JOIN Alumni a ON f.Alumni_ID = a.Alumni_ID
+        JOIN Student s ON f.Student_ID = s.Student_ID
+    """,
+    id_column='f.Feedback_ID', id_key='Feedback_ID',
+    sorts={
+        'date': ('f.Date', 'Date', 'desc', True),
+        'rating': ('f.Rating', 'Rating', 'desc', True)
+    },
+    default_sort='date',
+    filters={
+        'alumni_id': ('f.Alumni_ID = %s', str),
+        'student_id': ('f.Student_ID = %s', str),
+        'min_rating': ('f.Rating >= %s', int)
+    }
+)
+
 @app.route('/feedback')
+@conditional(FEEDBACK_LIST)
 def list_feedback():
-    """List all feedback"""
+    """List feedback one keyset page at a time"""
     # Get alumni filter parameter
     alumni_filter = request.args.get('alumni_id', '')
-    
-    # Get all alumni for dropdown
-    alumni = execute_query("SELECT Alumni_ID, Name FROM Alumni ORDER BY Name")
-    
-    # Build query based on filter
+
+    # Feedback page and the filtered alumnus' name (for the lookup field), fetched concurrently
+    query, params, state = build_page_query(FEEDBACK_LIST, request.args)
+    reads = [(query, params)]
     if alumni_filter:
-        feedback = execute_query("""
-            SELECT f.Feedback_ID, f.Rating, f.Date, f.Comments,
-                   a.Name as Alumni_Name, s.Name as Student_Name
-            FROM Feedback f
-            JOIN Alumni a ON f.Alumni_ID = a.Alumni_ID
-            JOIN Student s ON f.Student_ID = s.Student_ID
-            WHERE f.Alumni_ID = %s
-            ORDER BY f.Date DESC
-        """, (alumni_filter,))
-    else:
-        feedback = execute_query("""
-            SELECT f.Feedback_ID, f.Rating, f.Date, f.Comments,
-                   a.Name as Alumni_Name, s.Name as Student_Name
-            FROM Feedback f
-            JOIN Alumni a ON f.Alumni_ID = a.Alumni_ID
-            JOIN Student s ON f.Student_ID = s.Student_ID
-            ORDER BY f.Date DESC
-        """)
-    
-    return render_template('feedback/list.html', feedback=feedback, alumni=alumni, selected_alumni=alumni_filter)
+        reads.append(("SELECT Name FROM Alumni WHERE Alumni_ID = %s", (alumni_filter,)))
+    results = execute_parallel(reads, cache=True) or [None] * len(reads)
+    feedback = results[0]
+    alumni = results[1] if alumni_filter else None
+    feedback, page = finish_page(feedback, state, FEEDBACK_LIST)
+
+    return render_template('feedback/list.html', feedback=feedback, selected_alumni=alumni_filter,
+                           selected_alumni_name=alumni[0]['Name'] if alumni else '', page=page)
 
 @app.route('/feedback/add', methods=['GET', 'POST'])
 def add_feedback():
@@ -761,26 +1702,37 @@ def add_feedback():
                                     Rating, Date, Comments)
                 VALUES (%s, %s, %s, %s, %s, %s)
             """
-            params = (
-                data['feedback_id'], data['alumni_id'], data['student_id'],
-                data['rating'], data['feedback_date'], data['comments']
-            )
-
-            execute_query(query, params, fetch=False)
+            params, errors = check_insert('feedback', {
+                'Feedback_ID': data['feedback_id'], 'Alumni_ID': data['alumni_id'],
+                'Student_ID': data['student_id'], 'Rating': data['rating'],
+                'Date': data['feedback_date'], 'Comments': data['comments']
+            })
+            if errors:
+                for error in errors:
+                    flash(error, 'error')
+                return render_template('feedback/add.html')
+            logged = {'Alumni_ID': data['alumni_id'], 'Student_ID': data['student_id'],
+                      'Feedback_Date': data['feedback_date']}
+
+            if execute_query(query, params, fetch=False, audit=[('feedback', logged)]) is None:
+                flash('Could not add feedback; see the log for details', 'error')
+                return render_template('feedback/add.html')
             flash('Feedback added successfully!', 'success')
             return redirect(url_for('list_feedback'))
 
         except Exception as e:
             flash(f'Error adding feedback: {str(e)}', 'error')
-            # Get alumni and student lists for dropdown
-            alumni = execute_query("SELECT Alumni_ID, Name FROM Alumni ORDER BY Name")
-            students = execute_query("SELECT Student_ID, Name FROM Student ORDER BY Name")
-            return render_template('feedback/add.html', alumni=alumni, students=students)
 
-    # Get alumni and student lists for dropdown
-    alumni = execute_query("SELECT Alumni_ID, Name FROM Alumni ORDER BY Name")
-    students = execute_query("SELECT Student_ID, Name FROM Student ORDER BY Name")
-    return render_template('feedback/add.html', alumni=alumni, students=students)
+    return render_template('feedback/add.html')
+
+# Form rows carry the picked alumnus' and student's names for the lookup fields
+FEEDBACK_FORM_QUERY = """
+    SELECT f.*, a.Name AS Alumni_Name, s.Name AS Student_Name
+    FROM Feedback f
+    LEFT JOIN Alumni a ON f.Alumni_ID = a.Alumni_ID
+    LEFT JOIN Student s ON f.Student_ID = s.Student_ID
+    WHERE f.Feedback_ID = %s
+"""
 
 @app.route('/feedback/edit/<feedback_id>', methods=['GET', 'POST'])
 def edit_feedback(feedback_id):
@@ -798,65 +1750,216 @@ def edit_feedback(feedback_id):
                 data['rating'], data['feedback_date'], data['comments'], feedback_id
             )
 
-            execute_query(query, params, fetch=False)
+            if execute_query(query, params, fetch=False) is None:
+                flash('Could not update feedback; see the log for details', 'error')
+                feedback = execute_query(FEEDBACK_FORM_QUERY, (feedback_id,))
+                return render_template('feedback/add.html', feedback=feedback[0] if feedback else None, edit_mode=True)
             flash('Feedback updated successfully!', 'success')
             return redirect(url_for('list_feedback'))
 
         except Exception as e:
             flash(f'Error updating feedback: {str(e)}', 'error')
-            # Get alumni and student lists for dropdown
-            alumni = execute_query("SELECT Alumni_ID, Name FROM Alumni ORDER BY Name")
-            students = execute_query("SELECT Student_ID, Name FROM Student ORDER BY Name")
-            # Get feedback data for form repopulation
-            feedback = execute_query("SELECT * FROM Feedback WHERE Feedback_ID = %s", (feedback_id,))
-            return render_template('feedback/add.html', alumni=alumni, students=students, feedback=feedback[0] if feedback else None, edit_mode=True)
+            # Feedback data for form repopulation
+            feedback = execute_query(FEEDBACK_FORM_QUERY, (feedback_id,))
+            return render_template('feedback/add.html', feedback=feedback[0] if feedback else None, edit_mode=True)
 
     # GET request - fetch feedback data
-    feedback = execute_query("SELECT * FROM Feedback WHERE Feedback_ID = %s", (feedback_id,))
+    feedback = execute_query(FEEDBACK_FORM_QUERY, (feedback_id,))
     if not feedback:
         flash('Feedback not found!', 'error')
         return redirect(url_for('list_feedback'))
 
-    # Get alumni and student lists for dropdown
-    alumni = execute_query("SELECT Alumni_ID, Name FROM Alumni ORDER BY Name")
-    students = execute_query("SELECT Student_ID, Name FROM Student ORDER BY Name")
-    return render_template('feedback/add.html', alumni=alumni, students=students, feedback=feedback[0], edit_mode=True)
+    return render_template('feedback/add.html', feedback=feedback[0], edit_mode=True)
 
 @app.route('/feedback/delete/<feedback_id>', methods=['POST'])
 def delete_feedback(feedback_id):
     """Delete feedback"""
     try:
         query = "DELETE FROM Feedback WHERE Feedback_ID = %s"
-        execute_query(query, (feedback_id,), fetch=False)
-        flash('Feedback deleted successfully!', 'success')
+        if execute_query(query, (feedback_id,), fetch=False) is None:
+            flash('Could not delete feedback; see the log for details', 'error')
+        else:
+            flash('Feedback deleted successfully!', 'success')
     except Exception as e:
         flash(f'Error deleting feedback: {str(e)}', 'error')
     return redirect(url_for('list_feedback'))
 
 # Connections Route
 @app.route('/connections')
+@conditional(CONNECTIONS_QUERY)
 def alumni_student_connections():
     """Show alumni-student mentorship connections"""
-    query = """
-        SELECT 
-            a.Name as Alumni_Name,
-            a.Company,
-            a.Current_Designation,
-            s.Name as Student_Name,
-            s.Department,
-            s.Year_of_Study,
-            COUNT(ms.Session_ID) as Total_Sessions,
-            MAX(ms.Session_Date) as Last_Session
-        FROM Alumni a
-        INNER JOIN MentorshipSession ms ON a.Alumni_ID = ms.Alumni_ID
-        INNER JOIN Student s ON ms.Student_ID = s.Student_ID
-        GROUP BY a.Alumni_ID, a.Name, a.Company, a.Current_Designation,
-                 s.Student_ID, s.Name, s.Department, s.Year_of_Study
-        ORDER BY Total_Sessions DESC, Last_Session DESC
-    """
-    connections = execute_query(query)
+    connections = execute_query(CONNECTIONS_QUERY)
     return render_template('connections.html', connections=connections)
 
+# Full-Text Search
+def run_search():
+    """Search results for the request args (see search.py), or None if the reads failed"""
+    statements, state = build_search(request.args)
+    if not statements:
+        return finish_search(None, state)
+    result_sets = execute_parallel(statements, cache=True)
+    if result_sets is None:
+        return None
+    return finish_search(result_sets, state)
+
+@app.route('/search')
+@conditional(*scope_sources())
+def search():
+    """Relevance-ranked search over alumni, achievements, feedback and skills"""
+    results = run_search()
+    if results is None:
+        flash('Could not run search', 'error')
+    return render_template('search.html', results=results)
+
+@app.route('/api/search')
+@conditional(*scope_sources())
+def api_search():
+    """Search results, facets and per-scope totals as JSON"""
+    results = run_search()
+    if results is None:
+        return jsonify({'success': False, 'error': 'Could not run search'})
+    return jsonify({'success': True, 'data': results})
+
+@app.route('/export/<dataset>.<fmt>')
+def export_dataset(dataset, fmt):
+    """Stream a full extract as CSV or NDJSON without buffering it in memory"""
+    if dataset not in EXPORT_QUERIES or fmt not in EXPORT_FORMATS:
+        abort(404)
+
+    # A dedicated connection: the stream outlives the view and must not share
+    # the request connection with other statements while rows are unread
+    connection = get_db_connection()
+    if not connection:
+        flash('Database connection failed', 'error')
+        return redirect(url_for('dashboard'))
+
+    response = Response(
+        stream_with_context(stream_export(connection, EXPORT_QUERIES[dataset], fmt)),
+        mimetype=EXPORT_FORMATS[fmt]
+    )
+    response.headers['Content-Disposition'] = f'attachment; filename={dataset}.{fmt}'
+    response.headers['X-Accel-Buffering'] = 'no'
+    # A HEAD request never starts the stream, so its finally would not release the connection
+    response.call_on_close(connection.close)
+    return response
+
+def run_import(dataset, text):
+    """Validate and bulk-load a CSV on a dedicated connection; returns the report or None"""
+    connection = get_db_connection()
+    if not connection:
+        return None
+    try:
+        return import_csv(connection, dataset, text)
+    except Error as e:
+        logger.error(f"Error importing {dataset}: {e}")
+        connection.discard()
+        connection = None
+        return None
+    finally:
+        if connection is not None:
+            connection.close()
+        invalidate_tables(with_dependents((IMPORT_SPECS[dataset].table,)))
+
+@app.route('/import', methods=['GET', 'POST'])
+def bulk_import():
+    """Upload a CSV of alumni, students, sessions or feedback"""
+    report = None
+    if request.method == 'POST':
+        dataset = request.form.get('dataset')
+        upload = request.files.get('file')
+        if dataset not in IMPORT_SPECS or not upload or not upload.filename:
+            flash('Choose a table and a CSV file to import', 'error')
+        else:
+            text, errors = decode_upload(upload.read())
+            report = run_import(dataset, text) if text is not None else None
+            if errors:
+                for error in errors:
+                    flash(f"Line {error['line']}: {'; '.join(error['errors'])}", 'error')
+            elif report is None:
+                flash('Import failed; database connection error', 'error')
+            elif report['failed']:
+                flash(f"Imported {report['inserted']} of {report['total']} rows; "
+                      f"{report['failed']} row(s) rejected", 'warning')
+            else:
+                flash(f"Imported {report['inserted']} rows", 'success')
+
+    return render_template('import.html', specs=IMPORT_SPECS, report=report)
+
+@app.errorhandler(RequestEntityTooLarge)
+def request_too_large(e):
+    """Report an upload over MAX_CONTENT_LENGTH on the import page instead of a bare 413"""
+    limit = app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)
+    if request.endpoint != 'bulk_import':
+        return f'Request larger than {limit} MB', 413
+    flash(f'The file is larger than the {limit} MB upload limit; split it into smaller files', 'error')
+    return redirect(url_for('bulk_import'))
+
+# Reporting Routes
+# name -> (title, view query or procedure, is_procedure)
+REPORTS = {
+    'mentor-performance': ('Mentor Performance', 'sp_alumni_performance_dashboard', True),
+    'top-mentors': ('Top Mentors', 'SELECT * FROM v_top_mentors', False),
+    'mentorship-summary': ('Mentorship Summary',
+                           'SELECT * FROM v_mentorship_summary ORDER BY Alumni_Name, Student_Name', False),
+}
+
+def run_report(name):
+    """Rows for a report (cached until its tables change), or None on error"""
+    _, source, is_procedure = REPORTS[name]
+    if is_procedure:
+        return execute_procedure(source, cache=True)
+    return execute_query(source, cache=True)
+
+@app.route('/reports', defaults={'name': 'mentor-performance'})
+@app.route('/reports/<name>')
+@conditional(*[source for _, source, _ in REPORTS.values()])
+def reports(name):
+    """Mentor reporting views"""
+    if name not in REPORTS:
+        abort(404)
+    rows = run_report(name)
+    if rows is None:
+        flash('Could not load report', 'error')
+    return render_template('reports.html', reports=REPORTS, name=name, title=REPORTS[name][0], rows=rows or [])
+
+@app.route('/api/reports/<name>')
+@conditional(*[source for _, source, _ in REPORTS.values()])
+def api_report(name):
+    """Report rows as JSON"""
+    if name not in REPORTS:
+        return jsonify({'success': False, 'error': 'Unknown report'}), 404
+    rows = run_report(name)
+    if rows is None:
+        return jsonify({'success': False, 'error': 'Could not load report'})
+    return jsonify({'success': True, 'data': rows})
+
+# Slow Query Console
+def require_query_admin():
+    """Slow statements carry parameter values, so only SLOW_QUERY_CONFIG admins may see them"""
+    if session.get('db_user') not in SLOW_QUERY_CONFIG['admins']:
+        abort(403)
+
+@app.route('/debug/queries', methods=['GET', 'POST'])
+def debug_queries():
+    """Slow statements grouped by fingerprint, with their EXPLAIN plans"""
+    require_query_admin()
+    if request.method == 'POST':
+        SLOW_QUERIES.clear()
+        flash('Slow query log cleared', 'success')
+        return redirect(url_for('debug_queries'))
+    return render_template('debug/queries.html', groups=SLOW_QUERIES.groups(), stats=slow_query_stats())
+
+def slow_query_stats():
+    """Slow query log stats; worker is this process's pid when several workers each keep their own log"""
+    return dict(SLOW_QUERIES.stats(), worker=os.getpid() if METRICS_CONFIG['shared_dir'] else None)
+
+@app.route('/api/debug/queries')
+def api_debug_queries():
+    """Slow query groups as JSON"""
+    require_query_admin()
+    return jsonify({'success': True, 'data': {'stats': slow_query_stats(), 'groups': SLOW_QUERIES.groups()}})
+
 # Trigger Testing Routes
 @app.route('/test/triggers')
 def test_triggers():
@@ -913,7 +2016,9 @@ def test_auto_logging():
             VALUES (%s, %s, %s, %s, %s, %s)
         """
         params = ('TEST_AUTO_LOG', 'ALUM001', 'STU001', 5, date.today(), 'Test auto logging')
-        execute_query(query, params, fetch=False)
+        logged = {'Alumni_ID': 'ALUM001', 'Student_ID': 'STU001', 'Feedback_Date': date.today()}
+        execute_query(query, params, fetch=False, audit=[('feedback', logged)])
+        AUDIT_LOG.flush()
 
         # Check if it was logged
         log_check = execute_query("""
@@ -954,5 +2059,564 @@ def api_test_procedure(procedure_name):
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
+@app.route('/api/mentors/<alumni_id>/stats')
+def api_mentor_stats(alumni_id):
+    """Cached GetMentorStats for one alumnus"""
+    result = execute_procedure('GetMentorStats', (alumni_id,), cache=True)
+    if result is None:
+        return jsonify({'success': False, 'error': 'Could not load mentor statistics'})
+    return jsonify({'success': True, 'data': result})
+
+@app.route('/api/students/<student_id>/sessions')
+def api_student_sessions(student_id):
+    """Cached GetStudentSessions for one student"""
+    result = execute_procedure('GetStudentSessions', (student_id,), cache=True)
+    if result is None:
+        return jsonify({'success': False, 'error': 'Could not load student sessions'})
+    return jsonify({'success': True, 'data': result})
+
+def user_snapshot(registry, *key):
+    """The current database user's object in registry, refreshed; None if it could not load"""
+    item = registry.get(current_db_config()['user'], *key)
+    if not item.refresh(execute_batch, QUERY_CACHE.versions):
+        return None
+    return item
+
+def lookup_index(kind):
+    """Typeahead index of one kind for the current database user, reloaded after writes"""
+    return user_snapshot(LOOKUP_INDEXES, kind)
+
+def validation_keysets(tables):
+    """Cached key sets of the given tables for the current database user, or None if one failed to load"""
+    keysets = {table: user_snapshot(VALIDATION_KEYS, table) for table in tables}
+    return None if None in keysets.values() else keysets
+
+def check_insert(dataset, values):
+    """(row, errors) for a form insert, with values converted for the INSERT.
+
+    A rejection is checked again against freshly loaded keys, since the cached
+    sets can miss writes made by other processes. If the keys cannot be loaded
+    the row goes to MySQL unchecked and its constraints decide.
+    """
+    tables = {'alumni': ('Alumni',), 'students': ('Student',)}.get(dataset, ('Alumni', 'Student'))
+    keysets = validation_keysets(tables)
+    if keysets is None:
+        return tuple(values.get(column) or None for column in IMPORT_SPECS[dataset].columns), []
+    # A session is also checked against the daily limit with the availability index
+    index = availability_index() if dataset == 'sessions' else None
+    caches = list(keysets.values()) + ([index] if index else [])
+    row, errors = validate_form(dataset, values, keysets, daily=index.daily if index else None)
+    if errors and any(cache.age > 1 for cache in caches):
+        for cache in caches:
+            cache.refresh(execute_batch, QUERY_CACHE.versions, force=True)
+        row, errors = validate_form(dataset, values, keysets, daily=index.daily if index else None)
+    return row, errors
+
+def remember_insert(table, row_id, email, phone, before):
+    """Add a just-inserted alumnus or student to the cached keys instead of reloading them"""
+    keyset = VALIDATION_KEYS.peek(current_db_config()['user'], table)
+    if keyset is not None:
+        keyset.remember(row_id, email, phone, before, QUERY_CACHE.versions)
+
+def availability_index():
+    """Mentor availability index for the current database user, reloaded after other writes"""
+    return user_snapshot(AVAILABILITY_INDEXES)
+
+def record_session_write(session_id, alumni_id, day, before):
+    """Apply a session written by this request to the availability index instead of reloading it"""
+    index = AVAILABILITY_INDEXES.peek(current_db_config()['user'])
+    if index is not None:
+        index.record(session_id, alumni_id, day, before, QUERY_CACHE.versions)
+
+@app.route('/api/lookup/<kind>')
+def api_lookup(kind):
+    """Top matches for a typed prefix of a name, a later word of the name, or an ID"""
+    if kind not in LOOKUP_SOURCES:
+        return jsonify({'success': False, 'error': 'Unknown lookup'}), 404
+    index = lookup_index(kind)
+    if index is None:
+        return jsonify({'success': False, 'error': f'Could not load {kind}'})
+    limit = max(1, min(request.args.get('limit', DEFAULT_LIMIT, type=int) or DEFAULT_LIMIT, MAX_LIMIT))
+    skip = frozenset()
+    free_on = parse_day(request.args.get('free_on'))
+    if kind == 'alumni' and free_on:
+        # The session form offers only mentors below the daily limit on its date
+        availability = availability_index()
+        if availability is not None:
+            skip = availability.full_on(free_on)
+    return jsonify({'success': True, 'data': index.search(request.args.get('q', ''), limit, skip)})
+
+def parse_day(value):
+    """A YYYY-MM-DD query argument as a date, or None"""
+    try:
+        return parse_date(value) if value else None
+    except ValueError:
+        return None
+
+@app.route('/api/availability/slots')
+def api_availability_slots():
+    """Next free days of one or more mentors (alumni_id, comma-separated or repeated), from a date"""
+    index = availability_index()
+    if index is None:
+        return jsonify({'success': False, 'error': 'Could not load mentor availability'})
+    alumni_ids = [alumni_id.strip() for value in request.args.getlist('alumni_id')
+                  for alumni_id in value.split(',') if alumni_id.strip()][:MAX_MENTORS]
+    if not alumni_ids:
+        return jsonify({'success': False, 'error': 'alumni_id is required'}), 400
+    start = request.args.get('from')
+    if start and parse_day(start) is None:
+        return jsonify({'success': False, 'error': 'from must be a YYYY-MM-DD date'}), 400
+    limit = max(1, min(request.args.get('limit', DEFAULT_SLOTS, type=int) or DEFAULT_SLOTS, MAX_SLOTS))
+    slots = index.next_free(alumni_ids, parse_day(start), limit)
+    first, last = index.window()
+    return jsonify({'success': True, 'data': {
+        'window': [first.isoformat(), last.isoformat()],
+        'daily_limit': index.daily_limit,
+        'mentors': {alumni_id: [{'date': day.isoformat(), 'remaining': remaining} for day, remaining in free]
+                    for alumni_id, free in slots.items()},
+        'unknown': [alumni_id for alumni_id in alumni_ids if alumni_id not in slots],
+    }})
+
+@app.route('/api/availability/free')
+def api_availability_free():
+    """Mentors below the daily limit on a date, by ID; pass the last ID as after for the next page"""
+    index = availability_index()
+    if index is None:
+        return jsonify({'success': False, 'error': 'Could not load mentor availability'})
+    day = parse_day(request.args.get('date'))
+    if day is None:
+        return jsonify({'success': False, 'error': 'date must be a YYYY-MM-DD date'}), 400
+    first, last = index.window()
+    if not first <= day <= last:
+        return jsonify({'success': False, 'error': f'Sessions can be scheduled from {first} to {last}'}), 400
+    limit = max(1, min(request.args.get('limit', DEFAULT_FREE, type=int) or DEFAULT_FREE, MAX_FREE))
+    mentors = index.free_on(day, limit, request.args.get('after'))
+    return jsonify({'success': True, 'data': {
+        'date': day.isoformat(),
+        'mentors': [{'id': alumni_id, 'name': name, 'remaining': remaining}
+                    for alumni_id, name, remaining in mentors],
+        'next': mentors[-1][0] if len(mentors) == limit else None,
+    }})
+
+@app.route('/api/availability/stats')
+def api_availability_stats():
+    """Size, window and reload/in-place update counts of the availability index"""
+    index = availability_index()
+    if index is None:
+        return jsonify({'success': False, 'error': 'Could not load mentor availability'})
+    return jsonify({'success': True, 'data': index.stats()})
+
+def match_engine():
+    """Matching engine for the current database user, reloaded where its tables changed"""
+    return user_snapshot(MATCH_ENGINES)
+
+def match_args():
+    """(k, min_match) from the query string"""
+    k = request.args.get('k', 10, type=int)
+    min_match = request.args.get('min', 0, type=float)
+    return max(0, min(k or 0, 500)), min_match
+
+@app.route('/api/matches/<student_id>')
+def api_student_matches(student_id):
+    """Top-k mentor matches for a student (in-memory sp_find_mentor_matches)"""
+    engine = match_engine()
+    if engine is None:
+        return jsonify({'success': False, 'error': 'Could not load the skill graph'})
+    if not engine.has_student(student_id):
+        return jsonify({'success': False, 'error': 'Student not found'}), 404
+    k, min_match = match_args()
+    return jsonify({'success': True, 'data': engine.top_matches(student_id, k, min_match)})
+
+@app.route('/api/matches/department/<department>')
+def api_department_matches(department):
+    """Top-k mentor matches for every student in a department"""
+    engine = match_engine()
+    if engine is None:
+        return jsonify({'success': False, 'error': 'Could not load the skill graph'})
+    k, min_match = match_args()
+    return jsonify({'success': True, 'data': engine.match_department(department, k or 5, min_match)})
+
+@app.route('/api/matches/refresh', methods=['POST'])
+def api_refresh_matches():
+    """Reload one alumnus or student after their skills change outside the app (or everything)"""
+    engine = match_engine()
+    if engine is None:
+        return jsonify({'success': False, 'error': 'Could not load the skill graph'})
+    alumni_id = request.values.get('alumni_id')
+    student_id = request.values.get('student_id')
+    ok = True
+    if alumni_id:
+        ok = engine.refresh_alumni(execute_batch, alumni_id) and ok
+    if student_id:
+        ok = engine.refresh_student(execute_batch, student_id) and ok
+    if not alumni_id and not student_id:
+        engine.invalidate()
+        ok = engine.refresh(execute_batch, QUERY_CACHE.versions)
+    if not ok:
+        return jsonify({'success': False, 'error': 'Refresh failed'})
+    return jsonify({'success': True, 'data': engine.stats()})
+
+@app.cli.command('reconcile-counters')
+def reconcile_counters_command():
+    """Correct drift between Table_Counts and the real row counts."""
+    result = execute_procedure('sp_reconcile_table_counts')
+    if result is None:
+        raise SystemExit('Reconcile failed; see the log for details')
+    touch_table_versions(('Table_Counts',))
+    for row in result:
+        print(f"{row['Table_Name']}: counted {row['Counted']}, actual {row['Actual']}, "
+              f"corrected {row['Drift_Corrected']}")
+
+@app.cli.command('rebuild-mentor-stats')
+def rebuild_mentor_stats_command():
+    """Recompute Mentor_Stats from Feedback and MentorshipSession."""
+    result = execute_procedure('sp_rebuild_mentor_stats')
+    if result is None:
+        raise SystemExit('Rebuild failed; see the log for details')
+    touch_table_versions(('Mentor_Stats', 'Mentor_Mentees'))
+    print(f"Rebuilt statistics for {result[0]['Mentors']} mentors")
+
+@app.cli.command('import-csv')
+@click.argument('dataset', type=click.Choice(sorted(IMPORT_SPECS)))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+def import_csv_command(dataset, path):
+    """Bulk-load a CSV file into alumni, students, sessions or feedback."""
+    with open(path, 'rb') as handle:
+        text, errors = decode_upload(handle.read())
+    if errors:
+        raise SystemExit(f"line {errors[0]['line']}: {'; '.join(errors[0]['errors'])}")
+    report = run_import(dataset, text)
+    if report is None:
+        raise SystemExit('Import failed; see the log for details')
+    for error in report['errors']:
+        print(f"line {error['line']}: {'; '.join(error['errors'])}")
+    print(f"{report['table']}: inserted {report['inserted']} of {report['total']} rows "
+          f"in {report['elapsed_seconds']}s ({report['rows_per_sec']} rows/sec)")
+
+@app.cli.command('generate-data')
+@click.option('--rows', default='10k', show_default=True,
+              help='Approximate total rows across all tables, e.g. 50k, 1m, 10m.')
+@click.option('--seed', default=42, show_default=True, help='Random seed; the same seed gives the same data.')
+@click.option('--reset', is_flag=True, help='Delete previously generated rows first.')
+def generate_data_command(rows, seed, reset):
+    """Fill every table with skewed, trigger-valid synthetic data."""
+    try:
+        total = datagen.parse_rows(rows)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    connection = get_db_connection()
+    if not connection:
+        raise SystemExit('Could not connect; see the log for details')
+    try:
+        if reset:
+            for table, deleted in datagen.reset(connection).items():
+                if deleted:
+                    print(f'{table}: deleted {deleted} generated rows')
+        report = datagen.generate(connection, total, seed)
+    except Error as e:
+        connection.discard()
+        connection = None
+        raise SystemExit(f'Generation failed: {e}')
+    finally:
+        if connection is not None:
+            connection.close()
+        invalidate_tables(tuple(KNOWN_TABLES.values()))
+    for table, count in report['tables'].items():
+        print(f'{table:<18} {count:>10}')
+    for table, reason in report['skipped'].items():
+        print(f'{table}: skipped ({reason})')
+    print(f"Inserted {report['inserted']} rows in {report['elapsed_seconds']}s "
+          f"({report['rows_per_sec']} rows/sec)")
+
+@app.cli.command('archive-sessions')
+@click.option('--older-than', 'older_than_days', default=ARCHIVE_CONFIG['older_than_days'], show_default=True,
+              help='Archive sessions dated more than this many days ago.')
+@click.option('--batch-size', default=ARCHIVE_CONFIG['batch_size'], show_default=True,
+              help='Session_IDs per transaction.')
+@click.option('--pause', default=ARCHIVE_CONFIG['pause'], show_default=True,
+              help='Minimum seconds to sleep between batches.')
+@click.option('--throttle', default=ARCHIVE_CONFIG['throttle'], show_default=True,
+              help='Also sleep this multiple of each batch time (1.0 = at most half the time busy).')
+@click.option('--status', is_flag=True, help='Show the latest job and exit.')
+def archive_sessions_command(older_than_days, batch_size, pause, throttle, status):
+    """Move old sessions to Session_Archive in throttled, resumable batches."""
+    try:
+        connection = mysql.connector.connect(**DB_CONFIG)
+    except Error as e:
+        raise SystemExit(f'Could not connect: {e}')
+    try:
+        if status:
+            job = archive.latest_job(connection)
+            if job is None:
+                print('No archive jobs yet')
+            else:
+                print(f"Job {job['Job_ID']} {job['Status']}: cutoff {job['Cutoff_Date']}, {job['Archived']} archived, "
+                      f"{job['Scanned']} scanned in {job['Batches']} batches, up to {job['Last_Session_ID']!r}"
+                      + (f" ({job['Error']})" if job['Error'] else ''))
+            return
+
+        def report(progress):
+            invalidate_tables(ARCHIVE_TABLES)
+            done = f"{progress['archived']}/{progress['to_archive']}"
+            print(f"batch {progress['batches']}: {done} archived, {progress['scanned']} scanned, "
+                  f"up to {progress['last_session_id']!r}")
+
+        options = dict(ARCHIVE_CONFIG, older_than_days=older_than_days, batch_size=batch_size,
+                       pause=pause, throttle=throttle)
+        progress = archive.archive_sessions(connection, on_batch=report, **options)
+        resumed = ' (resumed)' if progress['resumed'] else ''
+        print(f"Job {progress['job_id']}{resumed} {progress['status']}: {progress['archived']} sessions before "
+              f"{progress['cutoff_date']} archived in {progress['elapsed_seconds']}s")
+    except KeyboardInterrupt:
+        raise SystemExit('Paused; run archive-sessions again to resume')
+    except (Error, archive.ArchiveError) as e:
+        raise SystemExit(f'Archive failed: {e}')
+    finally:
+        connection.close()
+
+@app.cli.command('partition-table')
+@click.argument('table', type=click.Choice(sorted(partitions.PARTITION_SPECS)))
+@click.option('--dry-run', is_flag=True, help='Print the statements instead of running them.')
+def partition_table_command(table, dry_run):
+    """Convert a history table to monthly RANGE partitions (foreign keys become triggers)."""
+    try:
+        connection = mysql.connector.connect(**DB_CONFIG)
+    except Error as e:
+        raise SystemExit(f'Could not connect: {e}')
+    try:
+        plan = partitions.partition_plan(connection, table, PARTITION_CONFIG['ahead_months'])
+        if dry_run:
+            print(';\n\n'.join(plan['statements']) + ';')
+            return
+        partitions.apply(connection, plan)
+    except (Error, partitions.PartitionError) as e:
+        raise SystemExit(f'Partitioning failed: {e}')
+    finally:
+        connection.close()
+    invalidate_tables(with_dependents((table,)))
+    print(f"{table}: {len(plan['partitions'])} partitions, primary key ({', '.join(plan['primary_key'])})")
+    for name in plan['dropped_foreign_keys']:
+        print(f'dropped foreign key {name}')
+    for name in plan['triggers']:
+        print(f'created trigger {name}')
+
+@app.cli.command('maintain-partitions')
+@click.option('--dry-run', is_flag=True, help='Print the statements instead of running them.')
+@click.option('--drop', is_flag=True, help='Drop expired months instead of archiving them to tables.')
+def maintain_partitions_command(dry_run, drop):
+    """Add upcoming monthly partitions and remove the ones past retention."""
+    try:
+        connection = mysql.connector.connect(**DB_CONFIG)
+    except Error as e:
+        raise SystemExit(f'Could not connect: {e}')
+    expired = []
+    try:
+        for table in sorted(partitions.PARTITION_SPECS):
+            if not partitions.existing_partitions(connection, table):
+                continue
+            plan = partitions.maintenance_plan(
+                connection, table, PARTITION_CONFIG['ahead_months'],
+                PARTITION_CONFIG['retention_months'].get(table),
+                PARTITION_CONFIG['archive_expired'] and not drop)
+            if dry_run:
+                for sql in plan['statements']:
+                    print(sql + ';')
+                continue
+            partitions.apply(connection, plan)
+            if plan['expired']:
+                expired.append(table)
+            print(f"{table}: added {len(plan['added'])}, removed {len(plan['expired'])} "
+                  f"(~{plan['expired_rows']} rows)" + (f", archived to {', '.join(plan['archive_tables'])}"
+                                                       if plan['archive_tables'] else ''))
+    except (Error, partitions.PartitionError) as e:
+        raise SystemExit(f'Partition maintenance failed: {e}')
+    finally:
+        connection.close()
+        if expired:
+            invalidate_tables(with_dependents(expired))
+    # Dropping a partition fires no delete triggers, so the derived tables are rebuilt from the rest
+    if {'MentorshipSession', 'Feedback'} & set(expired):
+        if execute_procedure('sp_reconcile_table_counts') is None \
+                or execute_procedure('sp_rebuild_mentor_stats') is None:
+            raise SystemExit('Partitions removed but the counters were not rebuilt; '
+                             'run reconcile-counters and rebuild-mentor-stats')
+        touch_table_versions(('Table_Counts', 'Mentor_Stats', 'Mentor_Mentees'))
+    if expired:
+        touch_table_versions([table for table in expired if table in VERSIONED_TABLES])
+
+@app.cli.command('partition-status')
+def partition_status_command():
+    """List each history table's partitions with estimated row counts."""
+    try:
+        connection = mysql.connector.connect(**DB_CONFIG)
+    except Error as e:
+        raise SystemExit(f'Could not connect: {e}')
+    try:
+        for table in sorted(partitions.PARTITION_SPECS):
+            found = partitions.existing_partitions(connection, table)
+            if not found:
+                print(f'{table}: not partitioned')
+                continue
+            retention = PARTITION_CONFIG['retention_months'].get(table)
+            kept = f'{retention} months' if retention is not None else 'everything'
+            print(f"{table}: {len(found)} partitions, keeps {kept}")
+            for name, rows in found:
+                print(f'  {name:<10} ~{rows} rows')
+    except Error as e:
+        raise SystemExit(f'Status failed: {e}')
+    finally:
+        connection.close()
+
+def migration_connection():
+    """Dedicated connection without a default database (version 1 creates it)"""
+    config = DB_CONFIG.copy()
+    database = config.pop('database')
+    return mysql.connector.connect(**config), database
+
+@app.cli.command('migrate')
+@click.option('--to', 'target', type=int, help='Stop after this version.')
+@click.option('--baseline', 'baseline_version', type=int,
+              help='Record versions up to this one as applied without running them.')
+def migrate_command(target, baseline_version):
+    """Apply the pending sql/ scripts in order and record their versions."""
+    try:
+        connection, database = migration_connection()
+    except Error as e:
+        raise SystemExit(f'Could not connect: {e}')
+    try:
+        if baseline_version is not None:
+            baseline(connection, database, baseline_version)
+            print(f'Recorded versions 1-{baseline_version} as applied')
+            return
+        applied = apply_migrations(connection, database, target)
+    except (MigrationError, Error) as e:
+        raise SystemExit(f'Migration failed: {e}')
+    finally:
+        connection.close()
+    for row in applied:
+        print(f"{row['version']:>3} {row['script']}: {row['statements']} statements in {row['duration_ms']} ms")
+    if not applied:
+        print(f'Up to date (version {MIGRATIONS[-1][0]})')
+
+@app.cli.command('migration-status')
+def migration_status_command():
+    """List each sql/ script with its state: applied, changed or pending."""
+    try:
+        connection, database = migration_connection()
+        rows = migration_status(connection, database)
+        connection.close()
+    except Error as e:
+        raise SystemExit(f'Could not read Schema_Migrations: {e}')
+    for row in rows:
+        print(f"{row['version']:>3} {row['script']:<36} {row['state']}")
+
+# Hot list, dashboard and search queries, each with request args that exercise one of the
+# indexes in sql/database_indexes.sql or sql/search_indexes.sql; check-indexes EXPLAINs every one
+INDEX_CHECKS = (
+    ('alumni by name', ALUMNI_LIST, {}),
+    ('alumni by name, next page', ALUMNI_LIST, {'cursor': encode_cursor('M', 'PESALU001')}),
+    ('alumni name prefix', ALUMNI_LIST, {'name': 'Ra'}),
+    ('alumni by experience', ALUMNI_LIST, {'sort': 'experience'}),
+    ('alumni by company', ALUMNI_LIST, {'company': 'Google'}),
+    ('alumni by designation', ALUMNI_LIST, {'designation': 'Software Engineer'}),
+    ('students by name', STUDENT_LIST, {}),
+    ('students name prefix', STUDENT_LIST, {'name': 'Ra'}),
+    ('students by department', STUDENT_LIST, {'department': 'CSE'}),
+    ('students by year', STUDENT_LIST, {'year': '3'}),
+    ('sessions by date', SESSION_LIST, {}),
+    ('sessions by date, next page', SESSION_LIST, {'cursor': encode_cursor(date.today(), 'PESSES001')}),
+    ('sessions in date range', SESSION_LIST, {'date_from': '2024-01-01', 'date_to': '2024-12-31'}),
+    ('sessions for alumni', SESSION_LIST, {'alumni_id': 'PESALU001'}),
+    ('sessions for student', SESSION_LIST, {'student_id': 'PESSTU001'}),
+    ('feedback by date', FEEDBACK_LIST, {}),
+    ('feedback by rating', FEEDBACK_LIST, {'sort': 'rating'}),
+    ('feedback for alumni', FEEDBACK_LIST, {'alumni_id': 'PESALU001'}),
+    ('feedback for student', FEEDBACK_LIST, {'student_id': 'PESSTU001'}),
+    ('achievements by year', ACHIEVEMENT_LIST, {}),
+    ('achievements for alumni', ACHIEVEMENT_LIST, {'alumni_id': 'PESALU001'}),
+    ('industries by name', INDUSTRY_LIST, {}),
+    ('industries by sector', INDUSTRY_LIST, {'sector': 'Technology'}),
+    ('industries by location', INDUSTRY_LIST, {'location': 'Bangalore'}),
+    ('skills by name', SKILL_LIST, {}),
+    ('skills by category', SKILL_LIST, {'category': 'Technical'}),
+    ('dashboard recent sessions', RECENT_SESSIONS_QUERY, None),
+    ('search match totals', build_search, {'q': 'software engineer'}),
+)
+
+def index_checks():
+    """(name, sql, params, tables) for every entry in INDEX_CHECKS"""
+    checks = []
+    for name, source, args in INDEX_CHECKS:
+        if isinstance(source, ListSpec):
+            sql, params, _ = build_page_query(source, args)
+        elif source is build_search:
+            # Fails with "Can't find FULLTEXT index" until sql/search_indexes.sql is applied
+            sql, params = build_search(args)[0][-1]
+        else:
+            sql, params = source, ()
+        checks.append((name, sql, params, tables_read(sql)))
+    return checks
+
+@app.cli.command('check-indexes')
+@click.option('--min-rows', default=1000, show_default=True,
+              help='Tables smaller than this are reported as skipped instead of failing.')
+def check_indexes_command(min_rows):
+    """EXPLAIN the hot queries and fail if any needs a full scan or filesort."""
+    connection = get_db_connection()
+    if not connection:
+        raise SystemExit('Could not connect; see the log for details')
+    try:
+        results = check_indexes(connection, index_checks(), min_rows)
+    except Error as e:
+        raise SystemExit(f'EXPLAIN failed: {e}')
+    finally:
+        connection.close()
+    for result in results:
+        detail = ', '.join(result['problems']) or ', '.join(result['keys'])
+        print(f"{result['status']:<8} {result['name']:<30} {detail}")
+    failed = [result['name'] for result in results if result['status'] == 'fail']
+    skipped = sum(1 for result in results if result['status'] == 'skipped')
+    if skipped:
+        print(f'{skipped} checks skipped: tables under {min_rows} rows, where a scan is cheaper')
+    if failed:
+        raise SystemExit(f"{len(failed)} queries are not served by an index: {', '.join(failed)}")
+
+def reinit_after_fork(threads=None):
+    """Reset the per-process state a forked worker inherits from the preloaded master.
+
+    The parent's pools, fan-out threads, archive thread and audit writer are not
+    usable here: threads do not survive a fork and their locks may be held.
+    With threads, each pool is capped at one connection per request thread.
+    With shared metrics, a thread writes this worker's file every share_interval.
+    """
+    global FANOUT, AUDIT_LOG, ARCHIVE_THREAD, ARCHIVE_THREAD_LOCK, ARCHIVE_STOP
+    forget_all_pools()
+    if threads:
+        POOL_CONFIG['max_size'] = min(POOL_CONFIG['max_size'], threads)
+    FANOUT = QueryFanout(FANOUT_CONFIG['workers'])
+    ARCHIVE_THREAD = None
+    ARCHIVE_THREAD_LOCK = threading.Lock()
+    ARCHIVE_STOP = threading.Event()
+    AUDIT_LOG = make_audit_log()
+    VERSION_SYNC.update(enabled=True, checked_at=float('-inf'), seen=None)
+    if METRICS_CONFIG['shared_dir']:
+        threading.Thread(target=run_metrics_sharing, name='metrics-share', daemon=True).start()
+
+def shutdown_worker(timeout=10.0):
+    """Let a worker that is exiting (recycled or stopped) finish its background work"""
+    ARCHIVE_STOP.set()
+    thread = ARCHIVE_THREAD
+    if thread is not None:
+        thread.join(timeout)
+    AUDIT_LOG.close()
+    close_all_pools()
+    if METRICS_CONFIG['shared_dir']:
+        METRICS_SHARE_STOP.set()
+        with METRICS_SHARE_LOCK:
+            retire_shared(METRICS_CONFIG['shared_dir'], METRICS)
+
 if __name__ == '__main__':
+    # Development server (one process, reloader and debugger); see wsgi.py for production
+    check_audit_writer()
+    AUDIT_LOG.recover()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
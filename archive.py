@@ -0,0 +1,238 @@
+"""
+Alumni Mentor Portal - Session Archival
+Moves mentorship sessions older than a cutoff into Session_Archive in short,
+throttled transactions over consecutive Session_ID ranges, recording progress
+in Archive_Jobs so an interrupted run resumes where it stopped
+"""
+
+import time
+from datetime import date, timedelta
+
+from mysql.connector import Error
+
+# Held for the whole run, so two app processes never archive at once
+ARCHIVE_LOCK = 'mentor_portal.session_archive'
+
+# ER_LOCK_WAIT_TIMEOUT, ER_LOCK_DEADLOCK: a foreground transaction held the rows; back off and retry
+_RETRY_ERRNOS = (1205, 1213)
+
+_UNFINISHED_JOB = """
+    SELECT * FROM Archive_Jobs WHERE Status IN ('running', 'paused', 'failed')
+    ORDER BY Job_ID DESC LIMIT 1
+"""
+
+# The next batch_size primary keys after the cursor: the batch covers (cursor, Upper_ID]
+_NEXT_RANGE = """
+    SELECT MAX(Session_ID) AS Upper_ID, COUNT(*) AS Scanned
+    FROM (SELECT Session_ID FROM MentorshipSession WHERE Session_ID > %s
+          ORDER BY Session_ID LIMIT %s) batch
+"""
+
+_COPY_RANGE = """
+    INSERT INTO Session_Archive (Session_ID, Alumni_ID, Student_ID, Session_Date,
+                                 Duration_Minutes, Topic, Job_ID)
+    SELECT Session_ID, Alumni_ID, Student_ID, Session_Date, Duration_Minutes, Topic, %s
+    FROM MentorshipSession
+    WHERE Session_ID > %s AND Session_ID <= %s AND Session_Date < %s
+"""
+
+_DELETE_RANGE = """
+    DELETE FROM MentorshipSession
+    WHERE Session_ID > %s AND Session_ID <= %s AND Session_Date < %s
+"""
+
+_RECORD_BATCH = """
+    UPDATE Archive_Jobs
+    SET Last_Session_ID = %s, Batches = Batches + 1, Scanned = Scanned + %s, Archived = Archived + %s
+    WHERE Job_ID = %s
+"""
+
+
+# A pause request from any process; the running job sees it between batches
+PAUSE_RUNNING_JOB = "UPDATE Archive_Jobs SET Status = 'paused' WHERE Status = 'running'"
+
+
+class ArchiveError(Exception):
+    """The archive job could not run or was stopped by repeated errors"""
+
+
+class ArchiveBusyError(ArchiveError):
+    """Another process is already archiving sessions"""
+
+
+def latest_job(connection):
+    """The most recent Archive_Jobs row as a dict, or None"""
+    cursor = connection.cursor(dictionary=True)
+    cursor.execute("SELECT * FROM Archive_Jobs ORDER BY Job_ID DESC LIMIT 1")
+    row = cursor.fetchone()
+    cursor.close()
+    return row
+
+
+def _set_status(connection, job_id, status, error=None):
+    cursor = connection.cursor()
+    cursor.execute(
+        "UPDATE Archive_Jobs SET Status = %s, Error = %s, "
+        "Finished_At = IF(%s IN ('done', 'failed'), CURRENT_TIMESTAMP, NULL) WHERE Job_ID = %s",
+        (status, error[:500] if error else None, status, job_id)
+    )
+    connection.commit()
+    cursor.close()
+
+
+def _pause_requested(connection, job_id):
+    cursor = connection.cursor()
+    cursor.execute("SELECT Status FROM Archive_Jobs WHERE Job_ID = %s", (job_id,))
+    row = cursor.fetchone()
+    cursor.close()
+    return row is not None and row[0] == 'paused'
+
+
+def _start_job(connection, older_than_days, today=None):
+    """Resume the last job that did not finish (interrupted, paused or failed), else start a new one"""
+    cursor = connection.cursor(dictionary=True)
+    cursor.execute(_UNFINISHED_JOB)
+    job = cursor.fetchone()
+    if job is None:
+        cutoff = (today or date.today()) - timedelta(days=older_than_days)
+        cursor.execute("INSERT INTO Archive_Jobs (Cutoff_Date) VALUES (%s)", (cutoff,))
+        connection.commit()
+        cursor.execute("SELECT * FROM Archive_Jobs WHERE Job_ID = %s", (cursor.lastrowid,))
+        job = cursor.fetchone()
+        job['resumed'] = False
+    else:
+        cursor.execute("UPDATE Archive_Jobs SET Status = 'running', Error = NULL, Finished_At = NULL "
+                       "WHERE Job_ID = %s",
+                       (job['Job_ID'],))
+        connection.commit()
+        job['resumed'] = True
+    cursor.close()
+    return job
+
+
+def _move_range(connection, job, upper_id, lock_retries):
+    """Copy and delete the old sessions in (Last_Session_ID, upper_id].
+
+    Returns (cursor, copied) with the transaction still open, so the caller records
+    the batch in Archive_Jobs before committing.
+    """
+    bounds = (job['Last_Session_ID'], upper_id, job['Cutoff_Date'])
+    for attempt in range(lock_retries + 1):
+        cursor = connection.cursor()
+        try:
+            connection.start_transaction()
+            cursor.execute(_COPY_RANGE, (job['Job_ID'], *bounds))
+            copied = cursor.rowcount
+            cursor.execute(_DELETE_RANGE, bounds)
+            if cursor.rowcount != copied:
+                raise ArchiveError(f"Copied {copied} sessions but deleted {cursor.rowcount} "
+                                   f"in ({bounds[0]!r}, {bounds[1]!r}]")
+            return cursor, copied
+        except Error as e:
+            connection.rollback()
+            cursor.close()
+            if e.errno not in _RETRY_ERRNOS or attempt == lock_retries:
+                raise
+            time.sleep(0.1 * 2 ** attempt)
+        except ArchiveError:
+            connection.rollback()
+            cursor.close()
+            raise
+
+
+def archive_sessions(connection, older_than_days=7, batch_size=1000, pause=0.05, throttle=1.0,
+                     lock_wait_timeout=2, lock_retries=5, on_batch=None, should_stop=None, today=None):
+    """Archive sessions dated before today - older_than_days, batch_size primary keys at a time.
+
+    connection must be dedicated to the job (it changes session settings). Each
+    batch is one transaction; afterwards the job sleeps max(pause, batch time *
+    throttle), so it uses at most 1 / (1 + throttle) of the time. Short lock waits
+    make it yield to foreground writes and retry. on_batch(progress) is called
+    after each batch; should_stop() is checked between batches and pauses the job, as
+    does PAUSE_RUNNING_JOB run by any process.
+    Returns the final progress dict.
+    """
+    cursor = connection.cursor()
+    cursor.execute("SELECT GET_LOCK(%s, 0)", (ARCHIVE_LOCK,))
+    if cursor.fetchone()[0] != 1:
+        cursor.close()
+        raise ArchiveBusyError('Another session archive job is running')
+    cursor.execute("SET SESSION innodb_lock_wait_timeout = %s", (int(lock_wait_timeout),))
+    cursor.close()
+
+    job = None
+    try:
+        job = _start_job(connection, older_than_days, today)
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute("SELECT COUNT(*) AS Remaining FROM MentorshipSession WHERE Session_Date < %s",
+                       (job['Cutoff_Date'],))
+        remaining = cursor.fetchone()['Remaining']
+        cursor.close()
+
+        progress = {
+            'job_id': job['Job_ID'],
+            'cutoff_date': job['Cutoff_Date'].isoformat(),
+            'resumed': job['resumed'],
+            'status': 'running',
+            'batches': job['Batches'],
+            'scanned': job['Scanned'],
+            'archived': job['Archived'],
+            'to_archive': job['Archived'] + remaining,
+            'last_session_id': job['Last_Session_ID'],
+            'elapsed_seconds': 0.0,
+        }
+        started = time.perf_counter()
+        while True:
+            if (should_stop and should_stop()) or _pause_requested(connection, job['Job_ID']):
+                _set_status(connection, job['Job_ID'], 'paused')
+                progress['status'] = 'paused'
+                return progress
+
+            batch_started = time.perf_counter()
+            cursor = connection.cursor(dictionary=True)
+            cursor.execute(_NEXT_RANGE, (job['Last_Session_ID'], batch_size))
+            upper = cursor.fetchone()
+            cursor.close()
+            if upper['Upper_ID'] is None:
+                _set_status(connection, job['Job_ID'], 'done')
+                progress['status'] = 'done'
+                progress['elapsed_seconds'] = round(time.perf_counter() - started, 3)
+                return progress
+
+            cursor, copied = _move_range(connection, job, upper['Upper_ID'], lock_retries)
+            try:
+                cursor.execute(_RECORD_BATCH, (upper['Upper_ID'], upper['Scanned'], copied, job['Job_ID']))
+                connection.commit()
+            finally:
+                cursor.close()
+            job['Last_Session_ID'] = upper['Upper_ID']
+
+            progress['batches'] += 1
+            progress['scanned'] += upper['Scanned']
+            progress['archived'] += copied
+            progress['last_session_id'] = upper['Upper_ID']
+            progress['elapsed_seconds'] = round(time.perf_counter() - started, 3)
+            if on_batch:
+                on_batch(dict(progress))
+            time.sleep(max(pause, (time.perf_counter() - batch_started) * throttle))
+    except KeyboardInterrupt:
+        if job is not None:
+            connection.rollback()
+            _set_status(connection, job['Job_ID'], 'paused')
+        raise
+    except (Error, ArchiveError) as e:
+        if job is not None:
+            try:
+                connection.rollback()
+                _set_status(connection, job['Job_ID'], 'failed', str(e))
+            except Error:
+                pass
+        raise
+    finally:
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (ARCHIVE_LOCK,))
+            cursor.fetchall()
+            cursor.close()
+        except Error:
+            pass
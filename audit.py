@@ -0,0 +1,288 @@
+"""
+Alumni Mentor Portal - Asynchronous Audit Log
+Queues the Feedback_Log and Activity_Log rows of the web form inserts in a
+bounded in-process queue and writes them in multi-row batches from a
+background thread, spilling to a JSON-lines file whatever the database or the
+queue cannot take
+"""
+
+import glob
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from datetime import date, datetime
+
+from mysql.connector import Error
+
+logger = logging.getLogger(__name__)
+
+# kind -> (log table, columns); every row also gets Logged_At, the time it was recorded
+AUDIT_KINDS = {
+    'feedback': ('Feedback_Log', ('Alumni_ID', 'Student_ID', 'Feedback_Date')),
+    'activity': ('Activity_Log', ('Activity_Type', 'Alumni_ID', 'Student_ID', 'Activity_Date', 'Details')),
+}
+
+_STOP = object()
+
+
+def insert_statement(kind, rows):
+    """One multi-row INSERT for rows of a kind"""
+    table, columns = AUDIT_KINDS[kind]
+    placeholders = '(' + ', '.join(['%s'] * (len(columns) + 1)) + ')'
+    sql = (f"INSERT INTO {table} ({', '.join(columns)}, Logged_At) VALUES "
+           + ', '.join([placeholders] * len(rows)))
+    params = []
+    for row in rows:
+        params.extend(row['values'].get(column) for column in columns)
+        params.append(row['at'])
+    return sql, tuple(params)
+
+
+def _plain(value):
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+class AuditLog:
+    """Bounded queue of audit rows drained by one background writer.
+
+    record() keeps a request waiting at most put_timeout: when the queue is full
+    it blocks that long for the writer (backpressure), then appends the row to
+    the spill file. The writer flushes once batch_size rows are waiting or the
+    oldest has waited flush_interval seconds, one INSERT per log table in one
+    transaction. A batch that still fails after retries is spilled. The spill
+    file is replayed when the writer next starts, and close() spills whatever is
+    still queued, so rows are written at least once.
+    """
+
+    def __init__(self, connect, queue_size=10000, batch_size=500, flush_interval=1.0, put_timeout=0.5,
+                 retries=3, spill_path='audit_spill.jsonl', on_flush=None):
+        self.connect = connect          # () -> dedicated connection for the writer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.retries = retries
+        self.spill_path = spill_path
+        self.on_flush = on_flush        # on_flush(tables) after each written batch
+
+        self._queue = queue.Queue(queue_size)
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._connection = None
+        self._counts_lock = threading.Lock()
+        self._counts = {'recorded': 0, 'written': 0, 'batches': 0, 'blocked': 0,
+                        'spilled': 0, 'replayed': 0, 'errors': 0}
+
+    def _count(self, name, amount=1):
+        with self._counts_lock:
+            self._counts[name] += amount
+
+    def record(self, kind, **values):
+        """Queue one log row; values are the kind's columns"""
+        if kind not in AUDIT_KINDS:
+            raise ValueError(f'Unknown audit kind: {kind}')
+        row = {'kind': kind, 'values': {key: _plain(value) for key, value in values.items()},
+               'at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        self.start()
+        self._count('recorded')
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._count('blocked')
+            try:
+                self._queue.put(row, timeout=self.put_timeout)
+            except queue.Full:
+                self._spill([row])
+
+    def start(self):
+        """Start the writer thread if it is not running"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name='audit-writer', daemon=True)
+            self._thread.start()
+
+    def flush(self, timeout=5.0):
+        """Wait until every queued row is written or spilled; False on timeout"""
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout=5.0):
+        """Stop the writer after it drains the queue; spill what it could not write in time"""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._stopping.set()
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                pass
+            thread.join(timeout)
+        left = []
+        while True:
+            try:
+                row = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if row is not _STOP:
+                left.append(row)
+            self._queue.task_done()
+        if left:
+            self._spill(left)
+        self._disconnect()
+
+    def _run(self):
+        self._replay()
+        batch = []
+        deadline = None
+        stop = False
+        while not stop:
+            timeout = self.flush_interval if not batch else max(0.0, deadline - time.monotonic())
+            try:
+                row = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                row = None
+            while row is not None:
+                if row is _STOP:
+                    self._queue.task_done()
+                    stop = True
+                    break
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    row = self._queue.get_nowait()
+                except queue.Empty:
+                    row = None
+            if batch and (stop or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._write(batch)
+                for _ in batch:
+                    self._queue.task_done()
+                batch = []
+        self._disconnect()
+
+    def _disconnect(self):
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except Error:
+                pass
+
+    def _write(self, batch):
+        """Insert a batch in one transaction, retrying with backoff; spill it if that fails"""
+        by_kind = {}
+        for row in batch:
+            by_kind.setdefault(row['kind'], []).append(row)
+        for attempt in range(self.retries + 1):
+            try:
+                if self._connection is None:
+                    self._connection = self.connect()
+                connection = self._connection
+                cursor = connection.cursor()
+                try:
+                    connection.start_transaction()
+                    for kind, rows in by_kind.items():
+                        cursor.execute(*insert_statement(kind, rows))
+                    connection.commit()
+                finally:
+                    cursor.close()
+            except Error as e:
+                self._count('errors')
+                logger.error(f"Error writing {len(batch)} audit rows (attempt {attempt + 1}): {e}")
+                self._disconnect()
+                if attempt < self.retries and not self._stopping.is_set():
+                    time.sleep(min(0.1 * 2 ** attempt, 2.0))
+                continue
+            self._count('written', len(batch))
+            self._count('batches')
+            if self.on_flush:
+                self.on_flush(tuple(AUDIT_KINDS[kind][0] for kind in by_kind))
+            return True
+        self._spill(batch)
+        return False
+
+    def _spill(self, rows):
+        with self._spill_lock:
+            with open(self.spill_path, 'a', encoding='utf-8') as handle:
+                for row in rows:
+                    handle.write(json.dumps(row) + '\n')
+        self._count('spilled', len(rows))
+        logger.warning(f"Spilled {len(rows)} audit rows to {self.spill_path}")
+
+    def _replay(self):
+        """Write rows spilled by an earlier run (rows that fail again are spilled again).
+
+        The spill file is claimed by renaming it to this process's own replay
+        file, so when worker processes share it each row is replayed by one of
+        them. Lines another process appends while the rename happens are read
+        too, up to the moment the file is removed.
+        """
+        replaying = f'{self.spill_path}.replay.{os.getpid()}'
+        with self._spill_lock:
+            if not os.path.exists(replaying):
+                try:
+                    os.rename(self.spill_path, replaying)
+                except FileNotFoundError:
+                    return
+        replayed = 0
+        offset = 0
+        while True:
+            with open(replaying, 'rb') as handle:
+                handle.seek(offset)
+                lines = [line for line in handle.readlines() if line.endswith(b'\n')]
+            offset += sum(len(line) for line in lines)
+            rows = [json.loads(line) for line in lines if line.strip()]
+            if not lines:
+                break
+            for start in range(0, len(rows), self.batch_size):
+                batch = rows[start:start + self.batch_size]
+                if self._write(batch):
+                    self._count('replayed', len(batch))
+            replayed += len(rows)
+        os.remove(replaying)
+        if replayed:
+            logger.info(f"Replayed {replayed} spilled audit rows")
+
+    def recover(self):
+        """Move replay files left by processes that died mid-replay back into the spill file.
+
+        Call only while no writer runs, such as at server start before workers
+        fork. Rows such a process had already written are written again.
+        """
+        leftovers = glob.glob(glob.escape(self.spill_path) + '.replay*')
+        if not leftovers:
+            return 0
+        with self._spill_lock, open(self.spill_path, 'a', encoding='utf-8') as target:
+            for path in leftovers:
+                with open(path, encoding='utf-8') as source:
+                    shutil.copyfileobj(source, target)
+                os.remove(path)
+        logger.info(f"Recovered {len(leftovers)} unfinished audit replay files")
+        return len(leftovers)
+
+    def stats(self):
+        with self._counts_lock:
+            counts = dict(self._counts)
+        counts.update({
+            'queued': self._queue.qsize(),
+            'capacity': self._queue.maxsize,
+            'writer_running': self._thread is not None and self._thread.is_alive(),
+            'spill_file_bytes': os.path.getsize(self.spill_path) if os.path.exists(self.spill_path) else 0,
+        })
+        return counts
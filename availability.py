@@ -0,0 +1,170 @@
+"""
+Alumni Mentor Portal - Mentor Availability
+Keeps every mentor's sessions per day over the scheduling window (today to
+3 months ahead) in memory, so the session form can offer free days and free
+mentors instead of finding them by inserts the triggers reject
+"""
+
+from bisect import bisect_right
+from datetime import date, timedelta
+
+from bulk_import import MAX_SESSIONS_PER_DAY, add_months
+from snapshots import Snapshot
+
+# Tables the index is built from, in the order of its versions tuple
+AVAILABILITY_TABLES = ('Alumni', 'MentorshipSession')
+
+MENTORS_QUERY = "SELECT Alumni_ID AS Id, Name FROM Alumni"
+SESSIONS_QUERY = """
+    SELECT Session_ID, Alumni_ID, Session_Date FROM MentorshipSession
+    WHERE Session_Date BETWEEN %s AND %s
+"""
+
+DEFAULT_SLOTS = 5
+MAX_SLOTS = 100
+MAX_MENTORS = 50         # mentors per free-slot request
+DEFAULT_FREE = 50
+MAX_FREE = 500
+
+
+def as_date(value):
+    """A date from a date or a YYYY-MM-DD string, or None"""
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+class AvailabilityIndex(Snapshot):
+    """Sessions per mentor and day from today to window_months ahead, for one database user.
+
+    counts maps (alumni, day) to that day's sessions, as the daily-limit
+    trigger counts them, and full maps a day to the mentors at the limit, so a
+    day's free mentors are the sorted mentor list minus one set. Every session
+    in the window is also kept by ID, so an insert, edit or delete made through
+    the app is applied in place (record); any other change to Alumni or
+    MentorshipSession, a new day, or max_age seconds reloads the index.
+    """
+
+    def __init__(self, max_age=300, daily_limit=MAX_SESSIONS_PER_DAY, window_months=3):
+        super().__init__(AVAILABILITY_TABLES, max_age)
+        self.daily_limit = daily_limit
+        self.window_months = window_months
+        # _data: (first, last, names, ids, sessions, counts, full)
+        self._applied = 0
+
+    def is_stale(self, versions):
+        return super().is_stale(versions) or self._data[0] != date.today()
+
+    def _build(self, fetch):
+        first = date.today()
+        last = add_months(first, self.window_months)
+        results = fetch([MENTORS_QUERY, (SESSIONS_QUERY, (first, last))])
+        if results is None:
+            return None
+        mentors, sessions = results
+        names = {row['Id']: row['Name'] for row in mentors}
+        data = (first, last, names, sorted(names), {}, {}, {})
+        for row in sessions:
+            data[4][row['Session_ID']] = (row['Alumni_ID'], row['Session_Date'])
+            self._add(data, row['Alumni_ID'], row['Session_Date'], 1)
+        return data
+
+    def _add(self, data, alumni_id, day, delta):
+        counts, full = data[5], data[6]
+        key = (alumni_id, day)
+        count = counts.get(key, 0) + delta
+        if count > 0:
+            counts[key] = count
+        else:
+            counts.pop(key, None)
+        if count >= self.daily_limit:
+            full.setdefault(day, set()).add(alumni_id)
+        elif day in full:
+            full[day].discard(alumni_id)
+
+    @property
+    def daily(self):
+        """(alumni, day) -> sessions that day, the daily lookup of the import checks"""
+        return self._data[5]
+
+    def window(self):
+        """(first, last) day sessions can be scheduled on"""
+        return self._data[0], self._data[1]
+
+    def next_free(self, alumni_ids, start=None, limit=DEFAULT_SLOTS):
+        """alumni -> up to limit (day, remaining) pairs, the first days from start they are not full"""
+        first, last, names, _, _, counts, _ = self._data
+        start = max(start or first, first)
+        result = {}
+        for alumni_id in alumni_ids:
+            if alumni_id not in names:
+                continue
+            slots = result[alumni_id] = []
+            day = start
+            while day <= last and len(slots) < limit:
+                taken = counts.get((alumni_id, day), 0)
+                if taken < self.daily_limit:
+                    slots.append((day, self.daily_limit - taken))
+                day += timedelta(days=1)
+        return result
+
+    def free_on(self, day, limit=DEFAULT_FREE, after=None):
+        """Up to limit (id, name, remaining) of the mentors free on a day, by ID after the given one"""
+        first, last, names, ids, _, counts, full = self._data
+        if not first <= day <= last:
+            return []
+        busy = full.get(day, ())
+        found = []
+        index = bisect_right(ids, after) if after else 0
+        while index < len(ids) and len(found) < limit:
+            alumni_id = ids[index]
+            if alumni_id not in busy:
+                found.append((alumni_id, names[alumni_id],
+                              self.daily_limit - counts.get((alumni_id, day), 0)))
+            index += 1
+        return found
+
+    def full_on(self, day):
+        """Mentors at the daily limit on a day"""
+        return self._data[6].get(day, frozenset())
+
+    def record(self, session_id, alumni_id, day, before, versions):
+        """Apply a session insert or edit (alumni_id, day) or delete (alumni_id None) made by this process.
+
+        before is the versions of AVAILABILITY_TABLES read ahead of the write.
+        As with KeySet.remember, the change is applied only if the write's own
+        MentorshipSession bump is the only change since; otherwise the next
+        refresh reloads.
+        """
+        with self._lock:
+            data = self._data
+            expected = self._own_write(before, 'MentorshipSession', versions)
+            if expected is None:
+                return False
+            day = as_date(day) if alumni_id is not None else None
+            if alumni_id is not None and day is None:
+                return False
+            old = data[4].pop(session_id, None)
+            if old is not None:
+                self._add(data, old[0], old[1], -1)
+            if day is not None and data[0] <= day <= data[1]:
+                data[4][session_id] = (alumni_id, day)
+                self._add(data, alumni_id, day, 1)
+            self._version = expected
+            self._applied += 1
+            return True
+
+    def stats(self):
+        data = self._data
+        return {
+            'mentors': len(data[2]) if data else 0,
+            'sessions': len(data[4]) if data else 0,
+            'full_days': sum(len(mentors) for mentors in data[6].values()) if data else 0,
+            'window': [data[0].isoformat(), data[1].isoformat()] if data else None,
+            'loads': self._loads,
+            'applied': self._applied,
+            'age_seconds': round(self.age, 1) if data else None,
+        }
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+HTTP load test for the portal's pages, forms and procedure API.
+
+Drives a running app (flask --app app run, or any WSGI server) over HTTP with
+a logged-in session. Each scenario is sent --requests times from --concurrency
+threads after --warmup untimed requests, and reports throughput, p50/p95/p99
+latency and database statements per request (read from the Server-Timing
+header the app adds to every response).
+
+Benchmark mentors, students, sessions and feedback are created directly in
+MySQL with HB-prefixed IDs and removed afterwards. Form posts are also checked
+against the rows they should have written, because a failed insert still
+redirects like a successful one.
+
+    python benchmarks/http_bench.py --password root --save results/before.json
+    python benchmarks/http_bench.py --only dashboard,list_alumni --concurrency 16
+    python benchmarks/http_bench.py --baseline results/before.json --max-regression 0.2
+"""
+
+import argparse
+import itertools
+import json
+import math
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from http.client import HTTPConnection, HTTPException
+from urllib.parse import urlencode, urlsplit
+
+import mysql.connector
+from mysql.connector import Error
+
+PREFIX = 'HB'
+SESSION_DAYS = 87  # sessions stay inside the 3-month window at up to 3 per mentor per day
+SERVER_TIMING_RE = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries"')
+
+# Rows the app holds for the dataset-size line in the report
+SIZE_TABLES = ('Alumni', 'Student', 'MentorshipSession', 'Feedback', 'Achievement', 'Provides')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://localhost:5000', help='base URL of the running app')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=3306)
+    parser.add_argument('--user', default='root', help='database user, also used to log in to the app')
+    parser.add_argument('--password', default='root')
+    parser.add_argument('--database', default='mentor_alumni_portal')
+    parser.add_argument('--concurrency', type=int, default=8, help='client threads')
+    parser.add_argument('--requests', type=int, default=200, help='timed requests per scenario')
+    parser.add_argument('--warmup', type=int, default=20, help='untimed requests per scenario')
+    parser.add_argument('--mentors', type=int, default=50, help='benchmark mentors (and students) to create')
+    parser.add_argument('--only', help='comma-separated scenario names to run')
+    parser.add_argument('--timeout', type=float, default=30.0, help='seconds per request')
+    parser.add_argument('--save', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='compare with an earlier --save file and fail on regressions')
+    parser.add_argument('--max-regression', type=float, default=0.25,
+                        help='allowed fractional p95 increase or throughput drop against the baseline')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    parser.add_argument('--keep', action='store_true', help='leave the benchmark rows in place')
+    return parser.parse_args()
+
+
+class Fixture:
+    """Benchmark rows created in MySQL before the run"""
+
+    def __init__(self, mentors):
+        self.today = date.today()
+        self.alumni = [f'{PREFIX}A{n:06d}' for n in range(mentors)]
+        self.students = [f'{PREFIX}S{n:06d}' for n in range(mentors)]
+        self.sessions = [f'{PREFIX}M{n:06d}' for n in range(mentors)]
+        self.feedback = [f'{PREFIX}F{n:06d}' for n in range(mentors)]
+
+    def pick(self, items, n):
+        return items[n % len(items)]
+
+
+def alumni_form(fixture, n, alumni_id=None):
+    """Add form for new alumnus n, or an edit form for alumni_id that keeps its phone and email unique"""
+    row_id = alumni_id or f'{PREFIX}NA{n:06d}'
+    form = {'name': f'Bench Mentor {n}', 'phone': (5200000000 if alumni_id else 5000000000) + n,
+            'email': f'{row_id.lower()}@example.invalid', 'graduation_year': 2015, 'designation': 'Engineer',
+            'company': 'Bench Corp', 'location': 'Bangalore', 'experience': 10}
+    if alumni_id is None:
+        form['alumni_id'] = row_id
+    return form
+
+
+def student_form(fixture, n, student_id=None):
+    row_id = student_id or f'{PREFIX}NS{n:06d}'
+    form = {'name': f'Bench Student {n}', 'phone': (5300000000 if student_id else 5100000000) + n,
+            'email': f'{row_id.lower()}@example.invalid', 'department': 'CSE', 'year_of_study': 1 + n % 4}
+    if student_id is None:
+        form['student_id'] = row_id
+    return form
+
+
+def session_form(fixture, n, session_id=None):
+    """Mentor n % mentors on day 1 + slot // 3, so never more than 3 sessions per mentor per day;
+    an edited session keeps its seeded date"""
+    slot = n // len(fixture.alumni)
+    day = SESSION_DAYS + 1 if session_id else 1 + slot // 3
+    form = {'alumni_id': fixture.pick(fixture.alumni, n), 'student_id': fixture.pick(fixture.students, n),
+            'session_date': (fixture.today + timedelta(days=day)).isoformat(), 'duration': 60,
+            'topic': 'Benchmark'}
+    if session_id is None:
+        form['session_id'] = f'{PREFIX}NM{n:06d}'
+    return form
+
+
+def feedback_form(fixture, n, feedback_id=None):
+    form = {'alumni_id': fixture.pick(fixture.alumni, n), 'student_id': fixture.pick(fixture.students, n),
+            'rating': 1 + n % 5, 'feedback_date': fixture.today.isoformat(), 'comments': 'Benchmark'}
+    if feedback_id is None:
+        form['feedback_id'] = f'{PREFIX}NF{n:06d}'
+    return form
+
+
+# name -> (method, path(fixture, n), form(fixture, n) or None, expected status, SQL counting rows written)
+SCENARIOS = {
+    'dashboard': ('GET', lambda f, n: '/dashboard', None, 200, None),
+    'list_alumni': ('GET', lambda f, n: '/alumni', None, 200, None),
+    'list_achievements': ('GET', lambda f, n: '/alumni/achievements', None, 200, None),
+    'list_industries': ('GET', lambda f, n: '/industries', None, 200, None),
+    'list_skills': ('GET', lambda f, n: '/skills', None, 200, None),
+    'list_students': ('GET', lambda f, n: '/students', None, 200, None),
+    'list_sessions': ('GET', lambda f, n: '/sessions', None, 200, None),
+    'list_feedback': ('GET', lambda f, n: '/feedback', None, 200, None),
+    'list_feedback_by_alumni': ('GET', lambda f, n: f'/feedback?alumni_id={f.pick(f.alumni, n)}', None, 200, None),
+    'connections': ('GET', lambda f, n: '/connections', None, 200, None),
+    'add_alumni': ('POST', lambda f, n: '/alumni/add', alumni_form, 302,
+                   f"SELECT COUNT(*) FROM Alumni WHERE Alumni_ID LIKE '{PREFIX}NA%'"),
+    'add_student': ('POST', lambda f, n: '/students/add', student_form, 302,
+                    f"SELECT COUNT(*) FROM Student WHERE Student_ID LIKE '{PREFIX}NS%'"),
+    'add_session': ('POST', lambda f, n: '/sessions/add', session_form, 302,
+                    f"SELECT COUNT(*) FROM MentorshipSession WHERE Session_ID LIKE '{PREFIX}NM%'"),
+    'add_feedback': ('POST', lambda f, n: '/feedback/add', feedback_form, 302,
+                     f"SELECT COUNT(*) FROM Feedback WHERE Feedback_ID LIKE '{PREFIX}NF%'"),
+    'edit_alumni': ('POST', lambda f, n: f'/alumni/edit/{f.pick(f.alumni, n)}',
+                    lambda f, n: alumni_form(f, n % len(f.alumni), f.pick(f.alumni, n)), 302, None),
+    'edit_student': ('POST', lambda f, n: f'/students/edit/{f.pick(f.students, n)}',
+                     lambda f, n: student_form(f, n % len(f.students), f.pick(f.students, n)), 302, None),
+    'edit_session': ('POST', lambda f, n: f'/sessions/edit/{f.pick(f.sessions, n)}',
+                     lambda f, n: session_form(f, n % len(f.sessions), f.pick(f.sessions, n)), 302, None),
+    'edit_feedback': ('POST', lambda f, n: f'/feedback/edit/{f.pick(f.feedback, n)}',
+                      lambda f, n: feedback_form(f, n % len(f.feedback), f.pick(f.feedback, n)), 302, None),
+    # The route calls the procedure with fixed arguments, so after the first call it
+    # returns the duplicate-ID error; the full CALL round trip is still timed
+    'api_procedure': ('POST', lambda f, n: '/api/procedures/RegisterStudent', None, 200, None),
+}
+
+# Rows the api_procedure scenario may create (its arguments are fixed in app.py)
+PROCEDURE_STUDENT = 'STU999'
+
+
+def cleanup(cursor, remove_procedure_student=False):
+    like = PREFIX + '%'
+    for sql in (
+        "DELETE FROM Feedback WHERE Alumni_ID LIKE %s",
+        "DELETE FROM Feedback_Log WHERE Alumni_ID LIKE %s",
+        "DELETE FROM MentorshipSession WHERE Alumni_ID LIKE %s",
+        "DELETE FROM Provides WHERE Alumni_ID LIKE %s",
+        "DELETE FROM Alumni WHERE Alumni_ID LIKE %s",
+        "DELETE FROM Student WHERE Student_ID LIKE %s",
+    ):
+        cursor.execute(sql, (like,))
+    if remove_procedure_student:
+        cursor.execute("DELETE FROM Student WHERE Student_ID = %s", (PROCEDURE_STUDENT,))
+
+
+def seed(cursor, fixture):
+    """Mentors and students for the forms, plus one session and feedback row per mentor to edit"""
+    cursor.executemany(
+        "INSERT INTO Alumni (Alumni_ID, Name, Email, Graduation_Year, Years_of_Experience) VALUES (%s, %s, %s, 2015, 10)",
+        [(alumni_id, f'Bench Mentor {n}', f'{alumni_id.lower()}@example.invalid')
+         for n, alumni_id in enumerate(fixture.alumni)])
+    cursor.executemany(
+        "INSERT INTO Student (Student_ID, Name, Email, Department, Year_of_Study) VALUES (%s, %s, %s, 'CSE', 1)",
+        [(student_id, f'Bench Student {n}', f'{student_id.lower()}@example.invalid')
+         for n, student_id in enumerate(fixture.students)])
+    # Seeded sessions use the last day, which the add_session scenario never reaches
+    cursor.executemany(
+        "INSERT INTO MentorshipSession (Session_ID, Alumni_ID, Student_ID, Session_Date, Duration_Minutes, Topic) "
+        "VALUES (%s, %s, %s, %s, 60, 'Benchmark')",
+        [(session_id, fixture.alumni[n], fixture.students[n], fixture.today + timedelta(days=SESSION_DAYS + 1))
+         for n, session_id in enumerate(fixture.sessions)])
+    cursor.executemany(
+        "INSERT INTO Feedback (Feedback_ID, Alumni_ID, Student_ID, Rating, Date, Comments) "
+        "VALUES (%s, %s, %s, 4, %s, 'Benchmark')",
+        [(feedback_id, fixture.alumni[n], fixture.students[n], fixture.today)
+         for n, feedback_id in enumerate(fixture.feedback)])
+
+
+class Client:
+    """One keep-alive HTTP connection with the logged-in session cookie"""
+
+    def __init__(self, url, cookie, timeout):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.base = parts.path.rstrip('/')
+        self.cookie = cookie
+        self.timeout = timeout
+        self.connection = None
+
+    def request(self, method, path, form=None):
+        """(status, headers, body) of one request; redirects are not followed"""
+        headers = {'Cookie': self.cookie} if self.cookie else {}
+        body = None
+        if form is not None:
+            body = urlencode(form)
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        if self.connection is None:
+            self.connection = HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            self.connection.request(method, self.base + path, body=body, headers=headers)
+            response = self.connection.getresponse()
+            data = response.read()
+        except (HTTPException, OSError):
+            self.close()
+            raise
+        if response.will_close:
+            self.close()
+        return response.status, response.headers, data
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def login(args):
+    """Session cookie for the app, or exit if the login is refused"""
+    client = Client(args.url, None, args.timeout)
+    try:
+        status, headers, _ = client.request('POST', '/login', {'username': args.user, 'password': args.password})
+    except (HTTPException, OSError) as e:
+        sys.exit(f'Could not reach {args.url}: {e}')
+    finally:
+        client.close()
+    cookies = [value.split(';', 1)[0] for value in headers.get_all('Set-Cookie') or ()]
+    if status != 302 or not any(cookie.startswith('session=') for cookie in cookies):
+        sys.exit(f'Login as {args.user} failed (HTTP {status})')
+    return '; '.join(cookies)
+
+
+def send(client, scenario, fixture, n):
+    """(seconds, ok, statements, db seconds) for request n of a scenario"""
+    method, path, form, expected, _ = scenario
+    started = time.perf_counter()
+    try:
+        status, headers, _ = client.request(method, path(fixture, n), form(fixture, n) if form else None)
+    except (HTTPException, OSError):
+        return time.perf_counter() - started, False, None, None
+    elapsed = time.perf_counter() - started
+    ok = status == expected
+    match = SERVER_TIMING_RE.search(headers.get('Server-Timing') or '')
+    if match:
+        return elapsed, ok, int(match.group(2)), float(match.group(1)) / 1000
+    return elapsed, ok, None, None
+
+
+def run_phase(args, cookie, scenario, fixture, start, count):
+    """Send requests start..start+count-1 from --concurrency threads; returns samples and wall time"""
+    counter = itertools.count(start)
+    limit = start + count
+
+    def worker():
+        client = Client(args.url, cookie, args.timeout)
+        samples = []
+        try:
+            while True:
+                n = next(counter)
+                if n >= limit:
+                    return samples
+                samples.append(send(client, scenario, fixture, n))
+        finally:
+            client.close()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [pool.submit(worker) for _ in range(args.concurrency)]
+        samples = [sample for future in futures for sample in future.result()]
+    return samples, time.perf_counter() - started
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a sorted list"""
+    return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+
+def summarize(samples, wall_seconds):
+    latencies = sorted(seconds * 1000 for seconds, _, _, _ in samples)
+    queries = [count for _, _, count, _ in samples if count is not None]
+    db_ms = sorted(seconds * 1000 for _, _, _, seconds in samples if seconds is not None)
+    return {
+        'requests': len(samples),
+        'errors': sum(1 for _, ok, _, _ in samples if not ok),
+        'throughput_rps': round(len(samples) / wall_seconds, 1) if wall_seconds else None,
+        'p50_ms': round(percentile(latencies, 0.50), 2),
+        'p95_ms': round(percentile(latencies, 0.95), 2),
+        'p99_ms': round(percentile(latencies, 0.99), 2),
+        'max_ms': round(latencies[-1], 2),
+        'queries_per_request': round(sum(queries) / len(queries), 2) if queries else None,
+        'max_queries': max(queries) if queries else None,
+        'db_p50_ms': round(percentile(db_ms, 0.50), 2) if db_ms else None,
+    }
+
+
+def count_rows(cursor, sql):
+    cursor.execute(sql)
+    return cursor.fetchone()[0]
+
+
+def dataset_sizes(cursor):
+    return {table: count_rows(cursor, f"SELECT COUNT(*) FROM {table}") for table in SIZE_TABLES}
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def regressions(results, baseline, max_regression):
+    """Scenarios that are slower, send more statements or fail more than in the baseline"""
+    problems = []
+    for name, result in results.items():
+        before = baseline.get('scenarios', {}).get(name)
+        if before is None:
+            continue
+        if result['p95_ms'] > before['p95_ms'] * (1 + max_regression):
+            problems.append(f"{name}: p95 {before['p95_ms']} -> {result['p95_ms']} ms")
+        if before['throughput_rps'] and result['throughput_rps'] < before['throughput_rps'] * (1 - max_regression):
+            problems.append(f"{name}: throughput {before['throughput_rps']} -> {result['throughput_rps']} req/s")
+        if (before['queries_per_request'] is not None and result['queries_per_request'] is not None
+                and result['queries_per_request'] > before['queries_per_request'] + 0.5):
+            problems.append(f"{name}: statements/request {before['queries_per_request']} -> "
+                            f"{result['queries_per_request']}")
+        if result['errors'] > before['errors']:
+            problems.append(f"{name}: errors {before['errors']} -> {result['errors']}")
+    return problems
+
+
+def main():
+    args = parse_args()
+    names = args.only.split(',') if args.only else list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        sys.exit(f"Unknown scenarios: {', '.join(unknown)} (choose from {', '.join(SCENARIOS)})")
+    if (args.requests + args.warmup) > args.mentors * 3 * SESSION_DAYS:
+        sys.exit(f'add_session needs --mentors of at least {math.ceil((args.requests + args.warmup) / (3 * SESSION_DAYS))}')
+
+    try:
+        connection = mysql.connector.connect(host=args.host, port=args.port, user=args.user,
+                                             password=args.password, database=args.database, autocommit=True)
+    except Error as e:
+        sys.exit(f'Could not connect: {e}')
+
+    cursor = connection.cursor()
+    fixture = Fixture(args.mentors)
+    results = {}
+    try:
+        cursor.execute("SELECT COUNT(*) FROM Student WHERE Student_ID = %s", (PROCEDURE_STUDENT,))
+        procedure_student_existed = cursor.fetchone()[0] > 0
+        cleanup(cursor)
+        seed(cursor, fixture)
+        sizes = dataset_sizes(cursor)
+        cookie = login(args)
+
+        for name in names:
+            scenario = SCENARIOS[name]
+            run_phase(args, cookie, scenario, fixture, 0, args.warmup)
+            samples, wall_seconds = run_phase(args, cookie, scenario, fixture, args.warmup, args.requests)
+            result = summarize(samples, wall_seconds)
+            check = scenario[4]
+            if check:
+                # Failed inserts redirect like successful ones; count what actually landed
+                written = count_rows(cursor, check)
+                result['rows_written'] = written
+                result['errors'] += max(0, args.warmup + args.requests - written)
+            results[name] = result
+    finally:
+        if not args.keep:
+            cleanup(cursor, remove_procedure_student=not procedure_student_existed)
+        cursor.close()
+        connection.close()
+
+    report = {
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'url': args.url,
+        'concurrency': args.concurrency,
+        'requests': args.requests,
+        'warmup': args.warmup,
+        'dataset': sizes,
+        'scenarios': results,
+    }
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{'scenario':<24} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8} {'errors':>7}")
+        for name, result in results.items():
+            queries = result['queries_per_request'] if result['queries_per_request'] is not None else '-'
+            print(f"{name:<24} {result['throughput_rps']:>8} {result['p50_ms']:>8} {result['p95_ms']:>8} "
+                  f"{result['p99_ms']:>8} {queries:>8} {result['errors']:>7}")
+
+    failed = False
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as handle:
+            problems = regressions(results, json.load(handle), args.max_regression)
+        for problem in problems:
+            print(f'REGRESSION {problem}', file=sys.stderr)
+        failed = bool(problems)
+    if failed:
+        sys.exit(f'{len(problems)} regressions against {args.baseline}')
+
+
+if __name__ == '__main__':
+    main()
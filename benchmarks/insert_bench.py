@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Single-row insert throughput with the old lookup triggers vs. declarative constraints.
+
+Fills benchmark alumni and students, then times autocommitted form-style
+inserts into Student, Alumni and MentorshipSession twice: with the original
+insert triggers (email COUNT(*)s and alumni/student existence COUNT(*)s) and
+with the trimmed ones from declarative_constraints.sql, where UNIQUE, CHECK
+and the foreign keys do that work. The web forms' own checks run against
+in-memory sets (validation.py) and add no queries. The triggers that were
+installed are put back afterwards; the benchmark needs the TRIGGER privilege.
+
+    python benchmarks/insert_bench.py --password root
+    python benchmarks/insert_bench.py --rows 1000000 --samples 1000
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import date, timedelta
+
+import mysql.connector
+from mysql.connector import Error
+
+PREFIX = 'BI'
+FILL_BATCH = 1000
+DELETE_BATCH = 10000
+
+# The insert triggers before declarative_constraints.sql
+OLD_TRIGGERS = {
+    'tr_student_before_insert': """
+        CREATE TRIGGER tr_student_before_insert
+        BEFORE INSERT ON Student
+        FOR EACH ROW
+        BEGIN
+            DECLARE email_count INT;
+            SELECT COUNT(*) INTO email_count FROM Student WHERE Email = NEW.Email;
+            IF email_count > 0 THEN
+                SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Email already registered for another student';
+            END IF;
+            IF NEW.Phone_Number IS NOT NULL AND (NEW.Phone_Number < 1000000000 OR NEW.Phone_Number > 9999999999) THEN
+                SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Phone number must be 10 digits';
+            END IF;
+            IF NEW.Year_of_Study IS NOT NULL AND (NEW.Year_of_Study < 1 OR NEW.Year_of_Study > 4) THEN
+                SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Year of study must be between 1 and 4';
+            END IF;
+        END
+    """,
+    'tr_alumni_before_insert': """
+        CREATE TRIGGER tr_alumni_before_insert
+        BEFORE INSERT ON Alumni
+        FOR EACH ROW
+        BEGIN
+            DECLARE email_count INT;
+            SELECT COUNT(*) INTO email_count FROM Alumni WHERE Email = NEW.Email;
+            IF email_count > 0 THEN
+                SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Email already registered for another alumni';
+            END IF;
+            IF NEW.Graduation_Year > YEAR(CURDATE()) THEN
+                SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Graduation year cannot be in the future';
+            END IF;
+            IF NEW.Years_of_Experience IS NULL THEN
+                SET NEW.Years_of_Experience = YEAR(CURDATE()) - NEW.Graduation_Year;
+            END IF;
+        END
+    """,
+    'tr_mentorship_session_before_insert': """
+        CREATE TRIGGER tr_mentorship_session_before_insert
+        BEFORE INSERT ON MentorshipSession
+        FOR EACH ROW
+        BEGIN
+            DECLARE alumni_exists INT;
+            DECLARE student_exists INT;
+            SELECT COUNT(*) INTO alumni_exists FROM Alumni WHERE Alumni_ID = NEW.Alumni_ID;
+            SELECT COUNT(*) INTO student_exists FROM Student WHERE Student_ID = NEW.Student_ID;
+            IF alumni_exists = 0 THEN
+                SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Alumni does not exist';
+            END IF;
+            IF student_exists = 0 THEN
+                SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Student does not exist';
+            END IF;
+            IF NEW.Duration_Minutes IS NOT NULL AND NEW.Duration_Minutes <= 0 THEN
+                SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Duration must be positive';
+            END IF;
+        END
+    """,
+}
+
+# The same triggers as declarative_constraints.sql leaves them (None: dropped)
+NEW_TRIGGERS = {
+    'tr_student_before_insert': """
+        CREATE TRIGGER tr_student_before_insert
+        BEFORE INSERT ON Student
+        FOR EACH ROW
+        BEGIN
+            IF NEW.Year_of_Study IS NOT NULL AND (NEW.Year_of_Study < 1 OR NEW.Year_of_Study > 4) THEN
+                SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Year of study must be between 1 and 4';
+            END IF;
+        END
+    """,
+    'tr_alumni_before_insert': """
+        CREATE TRIGGER tr_alumni_before_insert
+        BEFORE INSERT ON Alumni
+        FOR EACH ROW
+        BEGIN
+            IF NEW.Graduation_Year > YEAR(CURDATE()) THEN
+                SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Graduation year cannot be in the future';
+            END IF;
+            IF NEW.Years_of_Experience IS NULL THEN
+                SET NEW.Years_of_Experience = YEAR(CURDATE()) - NEW.Graduation_Year;
+            END IF;
+        END
+    """,
+    'tr_mentorship_session_before_insert': None,
+}
+
+TRIGGER_SETS = {'old': OLD_TRIGGERS, 'new': NEW_TRIGGERS}
+
+INSERTS = {
+    'Student': ("INSERT INTO Student (Student_ID, Name, Email, Department, Year_of_Study) "
+                "VALUES (%s, 'Bench Student', %s, 'Benchmark', 2)"),
+    'Alumni': ("INSERT INTO Alumni (Alumni_ID, Name, Email, Graduation_Year, Company) "
+               "VALUES (%s, 'Bench Alumni', %s, 2015, 'Benchmark')"),
+    'MentorshipSession': ("INSERT INTO MentorshipSession (Session_ID, Alumni_ID, Student_ID, Session_Date, "
+                          "Duration_Minutes, Topic) VALUES (%s, %s, %s, %s, 60, 'Benchmark')"),
+}
+
+# Benchmark rows, children first
+CLEANUP = (
+    ('MentorshipSession', 'Session_ID', PREFIX + 'M'),
+    ('Activity_Log', 'Alumni_ID', PREFIX + 'A'),
+    ('Provides', 'Alumni_ID', PREFIX + 'A'),
+    ('Student', 'Student_ID', PREFIX + 'S'),
+    ('Alumni', 'Alumni_ID', PREFIX + 'A'),
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=3306)
+    parser.add_argument('--user', default='root')
+    parser.add_argument('--password', default='root')
+    parser.add_argument('--database', default='mentor_alumni_portal')
+    parser.add_argument('--rows', type=int, default=100000,
+                        help='benchmark alumni and students each present before timing')
+    parser.add_argument('--samples', type=int, default=500,
+                        help='single-row inserts timed per table and trigger set')
+    parser.add_argument('--min-speedup', type=float, default=1.0,
+                        help='fail if any table inserts slower than this times the old rate')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    parser.add_argument('--keep', action='store_true', help='leave the benchmark rows in place')
+    return parser.parse_args()
+
+
+def row_id(kind, n):
+    return f'{PREFIX}{kind}{n:08d}'
+
+
+def email(kind, n):
+    return f'bench.{kind.lower()}{n}@example.invalid'
+
+
+def installed_set(cursor):
+    """'old' if the session existence trigger is installed, else 'new'"""
+    cursor.execute("SELECT COUNT(*) FROM information_schema.TRIGGERS "
+                   "WHERE TRIGGER_SCHEMA = DATABASE() AND TRIGGER_NAME = 'tr_mentorship_session_before_insert'")
+    return 'old' if cursor.fetchone()[0] else 'new'
+
+
+def install(cursor, name):
+    for trigger, sql in TRIGGER_SETS[name].items():
+        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        if sql:
+            cursor.execute(sql)
+
+
+def cleanup(connection, cursor):
+    # Deleting through the tables fires the delete triggers, keeping the counters exact
+    for table, column, prefix in CLEANUP:
+        while True:
+            cursor.execute(f"DELETE FROM {table} WHERE {column} LIKE %s LIMIT {DELETE_BATCH}", (prefix + '%',))
+            connection.commit()
+            if cursor.rowcount < DELETE_BATCH:
+                break
+
+
+def fill(connection, cursor, rows):
+    """Bulk-insert the untimed alumni and students the timed inserts are checked against"""
+    for kind in ('S', 'A'):
+        table = 'Student' if kind == 'S' else 'Alumni'
+        for start in range(0, rows, FILL_BATCH):
+            batch = [(row_id(kind, n), email(kind, n)) for n in range(start, min(start + FILL_BATCH, rows))]
+            cursor.executemany(INSERTS[table], batch)
+            connection.commit()
+
+
+def measure(connection, cursor, table, first, samples, rows):
+    """Time single-row autocommitted inserts, like the add forms"""
+    tomorrow = date.today() + timedelta(days=1)
+    started = time.perf_counter()
+    for n in range(first, first + samples):
+        if table == 'MentorshipSession':
+            # A different filled mentor each time stays under the daily session cap
+            params = (row_id('M', n), row_id('A', n % rows), row_id('S', n % rows), tomorrow)
+        else:
+            kind = 'S' if table == 'Student' else 'A'
+            params = (row_id(kind, n), email(kind, n))
+        cursor.execute(INSERTS[table], params)
+        connection.commit()
+    elapsed = time.perf_counter() - started
+    return samples / elapsed, elapsed / samples * 1000
+
+
+def main():
+    args = parse_args()
+    if args.samples * 2 > args.rows:
+        sys.exit('--rows must be at least twice --samples (each session needs its own mentor)')
+    try:
+        connection = mysql.connector.connect(host=args.host, port=args.port, user=args.user,
+                                             password=args.password, database=args.database)
+    except Error as e:
+        sys.exit(f'Could not connect: {e}')
+
+    cursor = connection.cursor()
+    results = {}
+    original = None
+    try:
+        connection.autocommit = True
+        original = installed_set(cursor)
+        cleanup(connection, cursor)
+        connection.autocommit = False
+        fill(connection, cursor, args.rows)
+
+        first = args.rows
+        for name in ('old', 'new'):
+            connection.autocommit = True
+            install(cursor, name)
+            connection.autocommit = False
+            for table in INSERTS:
+                per_sec, ms = measure(connection, cursor, table, first, args.samples, args.rows)
+                results.setdefault(table, {})[name] = {'inserts_per_sec': round(per_sec, 1),
+                                                       'ms_per_insert': round(ms, 3)}
+            first += args.samples
+    finally:
+        connection.autocommit = True
+        if original is not None:
+            install(cursor, original)
+        if not args.keep:
+            cleanup(connection, cursor)
+        cursor.close()
+        connection.close()
+
+    for result in results.values():
+        result['speedup'] = round(result['new']['inserts_per_sec'] / result['old']['inserts_per_sec'], 2)
+    if args.json:
+        print(json.dumps({'rows': args.rows, 'samples': args.samples, 'tables': results}, indent=2))
+    else:
+        print(f"{'table':<18} {'old/sec':>10} {'new/sec':>10} {'old ms':>8} {'new ms':>8} {'speedup':>8}")
+        for table, result in results.items():
+            print(f"{table:<18} {result['old']['inserts_per_sec']:>10} {result['new']['inserts_per_sec']:>10} "
+                  f"{result['old']['ms_per_insert']:>8} {result['new']['ms_per_insert']:>8} "
+                  f"{result['speedup']:>7}x")
+    slower = [table for table, result in results.items() if result['speedup'] < args.min_speedup]
+    if slower:
+        sys.exit(f"Inserts slower than {args.min_speedup}x the old rate: {', '.join(slower)}")
+
+
+if __name__ == '__main__':
+    main()
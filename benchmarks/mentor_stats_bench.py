@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Feedback insert throughput as one mentor's review count grows.
+
+With mentor_stats.sql installed each Feedback insert updates one Mentor_Stats
+row, so inserts/sec should stay flat from 10 to 100k reviews. With the old
+re-aggregating triggers it falls roughly in proportion to the review count.
+
+    python benchmarks/mentor_stats_bench.py --password root
+    python benchmarks/mentor_stats_bench.py --levels 10,1000,100000 --samples 500
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import date
+
+import mysql.connector
+from mysql.connector import Error
+
+ALUMNI_ID = 'BENCHALU01'
+STUDENT_ID = 'BENCHSTU01'
+FILL_BATCH = 1000
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=3306)
+    parser.add_argument('--user', default='root')
+    parser.add_argument('--password', default='root')
+    parser.add_argument('--database', default='mentor_alumni_portal')
+    parser.add_argument('--levels', default='10,100,1000,10000,100000',
+                        help='review counts at which throughput is measured')
+    parser.add_argument('--samples', type=int, default=200,
+                        help='single-row inserts timed at each level')
+    parser.add_argument('--max-slowdown', type=float, default=2.0,
+                        help='fail if the last level is this many times slower than the first')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    parser.add_argument('--keep', action='store_true', help='leave the benchmark rows in place')
+    return parser.parse_args()
+
+
+def feedback_id(n):
+    return f'BF{n:08d}'
+
+
+def setup(cursor):
+    cleanup(cursor)
+    cursor.execute("""
+        INSERT INTO Alumni (Alumni_ID, Name, Email, Graduation_Year, Years_of_Experience)
+        VALUES (%s, 'Benchmark Mentor', 'bench.mentor@example.invalid', 2015, 10)
+    """, (ALUMNI_ID,))
+    cursor.execute("""
+        INSERT INTO Student (Student_ID, Name, Email, Department, Year_of_Study)
+        VALUES (%s, 'Benchmark Student', 'bench.student@example.invalid', 'Benchmark', 1)
+    """, (STUDENT_ID,))
+
+
+def cleanup(cursor):
+    # Deleting through the table fires the delete triggers, keeping the counters exact
+    cursor.execute("DELETE FROM Feedback WHERE Alumni_ID = %s", (ALUMNI_ID,))
+    cursor.execute("DELETE FROM Feedback_Log WHERE Alumni_ID = %s", (ALUMNI_ID,))
+    cursor.execute("DELETE FROM Provides WHERE Alumni_ID = %s", (ALUMNI_ID,))
+    cursor.execute("DELETE FROM Student WHERE Student_ID = %s", (STUDENT_ID,))
+    cursor.execute("DELETE FROM Alumni WHERE Alumni_ID = %s", (ALUMNI_ID,))
+
+
+def insert_sql():
+    return """
+        INSERT INTO Feedback (Feedback_ID, Alumni_ID, Student_ID, Rating, Date, Comments)
+        VALUES (%s, %s, %s, %s, %s, 'benchmark')
+    """
+
+
+def fill(connection, cursor, start, stop):
+    """Bulk-insert reviews start..stop-1 (untimed) to reach the next level"""
+    today = date.today()
+    for batch_start in range(start, stop, FILL_BATCH):
+        rows = [(feedback_id(n), ALUMNI_ID, STUDENT_ID, n % 5 + 1, today)
+                for n in range(batch_start, min(batch_start + FILL_BATCH, stop))]
+        cursor.executemany(insert_sql(), rows)
+        connection.commit()
+
+
+def measure(connection, cursor, start, samples):
+    """Time single-row autocommitted inserts, like the feedback form"""
+    today = date.today()
+    started = time.perf_counter()
+    for n in range(start, start + samples):
+        cursor.execute(insert_sql(), (feedback_id(n), ALUMNI_ID, STUDENT_ID, n % 5 + 1, today))
+        connection.commit()
+    elapsed = time.perf_counter() - started
+    return samples / elapsed, elapsed / samples * 1000
+
+
+def main():
+    args = parse_args()
+    levels = sorted(int(level) for level in args.levels.split(','))
+    try:
+        connection = mysql.connector.connect(host=args.host, port=args.port, user=args.user,
+                                             password=args.password, database=args.database)
+    except Error as e:
+        sys.exit(f'Could not connect: {e}')
+
+    cursor = connection.cursor()
+    results = []
+    try:
+        connection.autocommit = True
+        setup(cursor)
+        connection.autocommit = False
+
+        count = 0
+        for level in levels:
+            if level > count:
+                fill(connection, cursor, count, level)
+                count = level
+            per_sec, ms = measure(connection, cursor, count, args.samples)
+            count += args.samples
+            results.append({'reviews': level, 'inserts_per_sec': round(per_sec, 1), 'ms_per_insert': round(ms, 3)})
+            if not args.json:
+                print(f'{level:>8} reviews: {per_sec:9.1f} inserts/sec  {ms:7.3f} ms/insert')
+    finally:
+        if not args.keep:
+            connection.autocommit = True
+            cleanup(cursor)
+        cursor.close()
+        connection.close()
+
+    slowdown = results[0]['inserts_per_sec'] / results[-1]['inserts_per_sec']
+    if args.json:
+        print(json.dumps({'levels': results, 'slowdown': round(slowdown, 2)}, indent=2))
+    else:
+        print(f'slowdown from {levels[0]} to {levels[-1]} reviews: {slowdown:.2f}x')
+    if slowdown > args.max_slowdown:
+        sys.exit(f'Insert throughput fell {slowdown:.2f}x (limit {args.max_slowdown}x)')
+
+
+if __name__ == '__main__':
+    main()
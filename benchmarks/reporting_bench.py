@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Old (fan-out) vs. new (pre-aggregated) reporting queries: runtime and results.
+
+Seeds benchmark mentors with sessions, feedback and achievements, runs the
+original join-everything versions of the mentor dashboard, v_top_mentors and
+v_mentorship_summary next to the installed rewrites, and checks both against
+totals computed in Python from the raw rows.
+
+    python benchmarks/reporting_bench.py --password root
+    python benchmarks/reporting_bench.py --mentors 500 --sessions 60 --feedback 60 --achievements 10
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+import mysql.connector
+from mysql.connector import Error
+
+PREFIX = 'BR'
+
+# The original definitions, with Current_Position corrected so they run
+OLD_QUERIES = {
+    'mentor_dashboard': """
+        SELECT a.Alumni_ID,
+               COUNT(DISTINCT ms.Student_ID) AS Total_Mentees,
+               COUNT(ms.Session_ID) AS Total_Sessions,
+               COALESCE(AVG(f.Rating), 0) AS Average_Rating,
+               COUNT(DISTINCT ach.Achievement_ID) AS Total_Achievements
+        FROM Alumni a
+        LEFT JOIN MentorshipSession ms ON a.Alumni_ID = ms.Alumni_ID
+        LEFT JOIN Feedback f ON a.Alumni_ID = f.Alumni_ID
+        LEFT JOIN Achievement ach ON a.Alumni_ID = ach.Alumni_ID
+        GROUP BY a.Alumni_ID, a.Name, a.Current_Designation, a.Years_of_Experience
+        ORDER BY Total_Sessions DESC, Average_Rating DESC
+    """,
+    'top_mentors': """
+        SELECT a.Alumni_ID,
+               COUNT(DISTINCT ms.Student_ID) AS Total_Mentees,
+               COUNT(ms.Session_ID) AS Total_Sessions,
+               COALESCE(AVG(f.Rating), 0) AS Average_Rating,
+               COUNT(DISTINCT ach.Achievement_ID) AS Achievements
+        FROM Alumni a
+        LEFT JOIN MentorshipSession ms ON a.Alumni_ID = ms.Alumni_ID
+        LEFT JOIN Feedback f ON a.Alumni_ID = f.Alumni_ID
+        LEFT JOIN Industry i ON a.Alumni_ID = i.Alumni_ID
+        LEFT JOIN Achievement ach ON a.Alumni_ID = ach.Alumni_ID
+        GROUP BY a.Alumni_ID, a.Name, a.Current_Designation, i.Industry_Name
+        HAVING Total_Sessions >= 3
+        ORDER BY Average_Rating DESC, Total_Sessions DESC
+    """,
+    'mentorship_summary': """
+        SELECT a.Alumni_ID, s.Student_ID,
+               COUNT(ms.Session_ID) AS Session_Count,
+               AVG(f.Rating) AS Average_Rating
+        FROM Alumni a
+        JOIN Provides p ON a.Alumni_ID = p.Alumni_ID
+        JOIN Student s ON p.Student_ID = s.Student_ID
+        LEFT JOIN MentorshipSession ms ON a.Alumni_ID = ms.Alumni_ID AND s.Student_ID = ms.Student_ID
+        LEFT JOIN Feedback f ON a.Alumni_ID = f.Alumni_ID AND s.Student_ID = f.Student_ID
+        GROUP BY a.Alumni_ID, a.Name, a.Current_Designation, s.Student_ID, s.Name, s.Department, p.Status
+    """,
+}
+
+NEW_QUERIES = {
+    'mentor_dashboard': "CALL sp_alumni_performance_dashboard()",
+    'top_mentors': "SELECT * FROM v_top_mentors",
+    'mentorship_summary': "SELECT * FROM v_mentorship_summary",
+}
+
+# Columns compared per report and the key that identifies a row
+COMPARED = {
+    'mentor_dashboard': (('Alumni_ID',), ('Total_Mentees', 'Total_Sessions', 'Average_Rating', 'Total_Achievements')),
+    'top_mentors': (('Alumni_ID',), ('Total_Mentees', 'Total_Sessions', 'Average_Rating', 'Achievements')),
+    'mentorship_summary': (('Alumni_ID', 'Student_ID'), ('Session_Count', 'Average_Rating')),
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=3306)
+    parser.add_argument('--user', default='root')
+    parser.add_argument('--password', default='root')
+    parser.add_argument('--database', default='mentor_alumni_portal')
+    parser.add_argument('--mentors', type=int, default=200)
+    parser.add_argument('--students', type=int, default=100)
+    parser.add_argument('--sessions', type=int, default=40, help='sessions per mentor (max 270)')
+    parser.add_argument('--feedback', type=int, default=40, help='feedback rows per mentor')
+    parser.add_argument('--achievements', type=int, default=8, help='achievements per mentor')
+    parser.add_argument('--runs', type=int, default=3, help='timed runs per query (best is reported)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    parser.add_argument('--keep', action='store_true', help='leave the benchmark rows in place')
+    return parser.parse_args()
+
+
+def cleanup(cursor):
+    like = PREFIX + '%'
+    for sql in (
+        "DELETE FROM Feedback WHERE Alumni_ID LIKE %s",
+        "DELETE FROM Feedback_Log WHERE Alumni_ID LIKE %s",
+        "DELETE FROM MentorshipSession WHERE Alumni_ID LIKE %s",
+        "DELETE FROM Achievement WHERE Alumni_ID LIKE %s",
+        "DELETE FROM Provides WHERE Alumni_ID LIKE %s",
+        "DELETE FROM Alumni WHERE Alumni_ID LIKE %s",
+        "DELETE FROM Student WHERE Student_ID LIKE %s",
+    ):
+        cursor.execute(sql, (like,))
+
+
+def seed(connection, cursor, args):
+    """Insert benchmark rows and return them for the expected totals"""
+    rng = random.Random(args.seed)
+    today = date.today()
+    alumni = [f'{PREFIX}A{n:06d}' for n in range(args.mentors)]
+    students = [f'{PREFIX}S{n:06d}' for n in range(args.students)]
+
+    cursor.executemany(
+        "INSERT INTO Alumni (Alumni_ID, Name, Email, Graduation_Year, Years_of_Experience) "
+        "VALUES (%s, %s, %s, 2015, 10)",
+        [(alumni_id, f'Bench Mentor {n}', f'{alumni_id.lower()}@example.invalid') for n, alumni_id in enumerate(alumni)]
+    )
+    cursor.executemany(
+        "INSERT INTO Student (Student_ID, Name, Email, Department, Year_of_Study) VALUES (%s, %s, %s, 'Benchmark', 1)",
+        [(student_id, f'Bench Student {n}', f'{student_id.lower()}@example.invalid') for n, student_id in enumerate(students)]
+    )
+
+    sessions, feedback, achievements = [], [], []
+    for a, alumni_id in enumerate(alumni):
+        for n in range(min(args.sessions, 270)):
+            # Sessions must be in the next 3 months, at most 3 per mentor per day
+            sessions.append((f'{PREFIX}M{a:05d}{n:03d}', alumni_id, rng.choice(students),
+                             today + timedelta(days=1 + n // 3), 30, 'Benchmark'))
+        for n in range(args.feedback):
+            feedback.append((f'{PREFIX}F{a:05d}{n:04d}', alumni_id, rng.choice(students),
+                             rng.randint(1, 5), today - timedelta(days=rng.randint(0, 365)), 'benchmark'))
+        for n in range(args.achievements):
+            achievements.append((f'{PREFIX}H{a:05d}{n:03d}', alumni_id, 'Benchmark', f'Award {n}', '',
+                                 rng.randint(2000, today.year)))
+
+    for sql, rows in (
+        ("INSERT INTO MentorshipSession (Session_ID, Alumni_ID, Student_ID, Session_Date, Duration_Minutes, Topic) "
+         "VALUES (%s, %s, %s, %s, %s, %s)", sessions),
+        ("INSERT INTO Feedback (Feedback_ID, Alumni_ID, Student_ID, Rating, Date, Comments) "
+         "VALUES (%s, %s, %s, %s, %s, %s)", feedback),
+    ):
+        for start in range(0, len(rows), 1000):
+            cursor.executemany(sql, rows[start:start + 1000])
+            connection.commit()
+    try:
+        for start in range(0, len(achievements), 1000):
+            cursor.executemany(
+                "INSERT INTO Achievement (Achievement_ID, Alumni_ID, Awarding_Body, Title, Description, Year) "
+                "VALUES (%s, %s, %s, %s, %s, %s)", achievements[start:start + 1000])
+            connection.commit()
+    except Error as e:
+        connection.rollback()
+        cursor.execute("DELETE FROM Achievement WHERE Alumni_ID LIKE %s", (PREFIX + '%',))
+        connection.commit()
+        print(f'warning: achievements not seeded ({e.msg}); continuing without them', file=sys.stderr)
+        achievements = []
+    return sessions, feedback, achievements
+
+
+def expected_totals(sessions, feedback, achievements):
+    """Ground truth per mentor and per pair, computed from the raw rows"""
+    mentors = {}
+    pairs = {}
+    for _, alumni_id, student_id, *_ in sessions:
+        stats = mentors.setdefault(alumni_id, {'sessions': 0, 'mentees': set(), 'ratings': [], 'achievements': 0})
+        stats['sessions'] += 1
+        stats['mentees'].add(student_id)
+        pair = pairs.setdefault((alumni_id, student_id), {'sessions': 0, 'ratings': []})
+        pair['sessions'] += 1
+    for _, alumni_id, student_id, rating, *_ in feedback:
+        mentors.setdefault(alumni_id, {'sessions': 0, 'mentees': set(), 'ratings': [], 'achievements': 0})
+        mentors[alumni_id]['ratings'].append(rating)
+        if (alumni_id, student_id) in pairs:
+            pairs[(alumni_id, student_id)]['ratings'].append(rating)
+    for _, alumni_id, *_ in achievements:
+        mentors.setdefault(alumni_id, {'sessions': 0, 'mentees': set(), 'ratings': [], 'achievements': 0})
+        mentors[alumni_id]['achievements'] += 1
+
+    def average(ratings):
+        return sum(ratings) / len(ratings) if ratings else None
+
+    mentor_rows = {
+        (alumni_id,): {
+            'Total_Mentees': len(stats['mentees']),
+            'Total_Sessions': stats['sessions'],
+            'Average_Rating': average(stats['ratings']) or 0,
+            'Total_Achievements': stats['achievements'],
+            'Achievements': stats['achievements'],
+        }
+        for alumni_id, stats in mentors.items()
+    }
+    pair_rows = {
+        key: {'Session_Count': pair['sessions'], 'Average_Rating': average(pair['ratings'])}
+        for key, pair in pairs.items()
+    }
+    return {
+        'mentor_dashboard': mentor_rows,
+        'top_mentors': {key: row for key, row in mentor_rows.items() if row['Total_Sessions'] >= 3},
+        'mentorship_summary': pair_rows,
+    }
+
+
+def run(connection, sql, runs):
+    """Best wall time over runs and the rows of the last run"""
+    best = None
+    rows = []
+    for _ in range(runs):
+        cursor = connection.cursor(dictionary=True)
+        started = time.perf_counter()
+        if sql.startswith('CALL'):
+            # CALL through execute() needs multi=True; callproc reads the result sets like the app
+            cursor.callproc(sql[len('CALL '):].split('(')[0])
+            rows = [row for dataset in cursor.stored_results() for row in dataset.fetchall()]
+        else:
+            cursor.execute(sql)
+            rows = cursor.fetchall()
+        elapsed = time.perf_counter() - started
+        cursor.close()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, rows
+
+
+def _same(actual, expected):
+    if expected is None or actual is None:
+        return actual is None and expected is None
+    return abs(float(actual) - float(expected)) < 0.0001 if isinstance(actual, (float, Decimal)) else actual == expected
+
+
+def mismatches(report, rows, expected):
+    """Benchmark rows whose compared columns differ from the ground truth"""
+    key_columns, columns = COMPARED[report]
+    seen = {}
+    for row in rows:
+        key = tuple(row[column] for column in key_columns)
+        if key[0].startswith(PREFIX):
+            seen[key] = row
+    wrong = sum(1 for key, row in expected[report].items()
+                if key not in seen or not all(_same(seen[key][column], row[column]) for column in columns))
+    extra = sum(1 for key in seen if key not in expected[report])
+    return wrong + extra
+
+
+def main():
+    args = parse_args()
+    try:
+        connection = mysql.connector.connect(host=args.host, port=args.port, user=args.user,
+                                             password=args.password, database=args.database)
+    except Error as e:
+        sys.exit(f'Could not connect: {e}')
+
+    cursor = connection.cursor()
+    results = {}
+    try:
+        connection.autocommit = True
+        cleanup(cursor)
+        connection.autocommit = False
+        sessions, feedback, achievements = seed(connection, cursor, args)
+        expected = expected_totals(sessions, feedback, achievements)
+        connection.autocommit = True
+
+        for report in OLD_QUERIES:
+            old_time, old_rows = run(connection, OLD_QUERIES[report], args.runs)
+            new_time, new_rows = run(connection, NEW_QUERIES[report], args.runs)
+            results[report] = {
+                'old_seconds': round(old_time, 4),
+                'new_seconds': round(new_time, 4),
+                'speedup': round(old_time / new_time, 1) if new_time else None,
+                'old_wrong_rows': mismatches(report, old_rows, expected),
+                'new_wrong_rows': mismatches(report, new_rows, expected),
+                'expected_rows': len(expected[report]),
+            }
+    finally:
+        if not args.keep:
+            connection.autocommit = True
+            cleanup(cursor)
+        cursor.close()
+        connection.close()
+
+    if args.json:
+        print(json.dumps({'mentors': args.mentors, 'sessions_per_mentor': args.sessions,
+                          'feedback_per_mentor': args.feedback, 'achievements_per_mentor': args.achievements,
+                          'reports': results}, indent=2))
+    else:
+        print(f"{'report':<20} {'old s':>9} {'new s':>9} {'speedup':>8} {'old wrong':>10} {'new wrong':>10}")
+        for report, result in results.items():
+            print(f"{report:<20} {result['old_seconds']:>9} {result['new_seconds']:>9} {result['speedup']:>8} "
+                  f"{result['old_wrong_rows']:>10} {result['new_wrong_rows']:>10}  (of {result['expected_rows']})")
+    if any(result['new_wrong_rows'] for result in results.values()):
+        sys.exit('The rewritten reports disagree with the expected totals')
+
+
+if __name__ == '__main__':
+    main()
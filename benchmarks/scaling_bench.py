@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Requests/sec of the production server (gunicorn.conf.py) as worker processes are added.
+
+Starts gunicorn with 1, 2, 4, ... workers, each run pinned to that many CPU
+cores where the OS allows it, and loads it from client processes pinned to the
+remaining cores for --duration seconds. Reports throughput, p50/p95 latency,
+and speedup and efficiency against one worker. By default it goes up to half
+the cores, leaving the rest to the clients.
+
+Without --login only the login page is requested: routing, sessions and
+template rendering with no database, which measures the app's own scaling.
+With --login the --paths pages run their queries too, so MySQL's capacity
+becomes part of the result.
+
+    python benchmarks/scaling_bench.py
+    python benchmarks/scaling_bench.py --workers 1,2,4,8 --threads 4 --duration 20 --json
+    python benchmarks/scaling_bench.py --login --password root --paths /,/alumni,/api/lookup/alumni?q=a
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from http.client import HTTPConnection, HTTPException
+from urllib.parse import urlencode
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    cores = os.cpu_count() or 1
+    default_workers = [1]
+    while default_workers[-1] * 2 <= max(1, cores // 2):
+        default_workers.append(default_workers[-1] * 2)
+    parser.add_argument('--workers', default=','.join(map(str, default_workers)),
+                        help='comma-separated worker counts to measure')
+    parser.add_argument('--threads', type=int, default=4, help='threads per worker')
+    parser.add_argument('--clients', type=int, default=None,
+                        help='client processes (default: 2 per worker of the largest run, at least 2)')
+    parser.add_argument('--duration', type=float, default=10.0, help='timed seconds per worker count')
+    parser.add_argument('--warmup', type=float, default=2.0, help='untimed seconds per worker count')
+    parser.add_argument('--login', action='store_true', help='log in and request --paths')
+    parser.add_argument('--user', default='root', help='database user to log in as')
+    parser.add_argument('--password', default='root')
+    parser.add_argument('--paths', default='/,/alumni,/students,/api/lookup/alumni?q=a',
+                        help='comma-separated pages requested round-robin with --login')
+    parser.add_argument('--no-pin', action='store_true', help='do not pin the server and clients to cores')
+    parser.add_argument('--min-efficiency', type=float, default=None,
+                        help='fail if any run reaches less than this fraction of linear scaling')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    return parser.parse_args()
+
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+def pinning(cores):
+    """preexec_fn limiting a process to the given cores, or None where that is unsupported"""
+    if not cores or not hasattr(os, 'sched_setaffinity'):
+        return None
+    return lambda: os.sched_setaffinity(0, cores)
+
+
+def start_server(port, workers, threads, cores):
+    env = dict(os.environ, PORTAL_BIND=f'127.0.0.1:{port}', PORTAL_WORKERS=str(workers),
+               PORTAL_THREADS=str(threads), PORTAL_MAX_REQUESTS='0')
+    return subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'],
+                            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            preexec_fn=pinning(cores))
+
+
+def wait_ready(server, port, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            sys.exit(f'gunicorn exited: {server.stderr.read().decode(errors="replace")[-2000:]}')
+        try:
+            status, _, _ = request(HTTPConnection('127.0.0.1', port, timeout=2), 'GET', '/login')
+            if status == 200:
+                return
+        except (HTTPException, OSError):
+            pass
+        time.sleep(0.2)
+    sys.exit('gunicorn did not answer within 30s')
+
+
+def stop_server(server):
+    server.send_signal(signal.SIGTERM)
+    try:
+        server.wait(30)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+def request(connection, method, path, cookie=None, form=None):
+    headers = {'Cookie': cookie} if cookie else {}
+    body = None
+    if form is not None:
+        body = urlencode(form)
+        headers['Content-Type'] = 'application/x-www-form-urlencoded'
+    connection.request(method, path, body, headers)
+    response = connection.getresponse()
+    response.read()
+    return response.status, response.headers, response
+
+
+def login(port, user, password):
+    status, headers, _ = request(HTTPConnection('127.0.0.1', port, timeout=10), 'POST', '/login',
+                                 form={'username': user, 'password': password})
+    cookies = [value.split(';', 1)[0] for value in headers.get_all('Set-Cookie') or ()]
+    if status != 302 or not any(cookie.startswith('session=') for cookie in cookies):
+        sys.exit(f'Login as {user} failed (HTTP {status})')
+    return '; '.join(cookies)
+
+
+def client(port, paths, cookie, warmup, duration, cores, offset):
+    """One load process: sequential keep-alive requests; returns (latencies, errors) of the timed part"""
+    if cores and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, cores)
+    connection = HTTPConnection('127.0.0.1', port, timeout=30)
+    latencies = []
+    errors = 0
+    n = offset
+    started = time.perf_counter()
+    timed_from = started + warmup
+    ends = timed_from + duration
+    while True:
+        now = time.perf_counter()
+        if now >= ends:
+            break
+        try:
+            status, _, _ = request(connection, 'GET', paths[n % len(paths)], cookie)
+            ok = status == 200
+        except (HTTPException, OSError):
+            connection.close()
+            connection = HTTPConnection('127.0.0.1', port, timeout=30)
+            ok = False
+        n += 1
+        if now >= timed_from:
+            latencies.append(time.perf_counter() - now)
+            errors += not ok
+    connection.close()
+    return latencies, errors
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a sorted list"""
+    return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+
+def measure(args, workers, paths, clients, server_cores, client_cores):
+    port = free_port()
+    server = start_server(port, workers, args.threads, server_cores)
+    try:
+        wait_ready(server, port)
+        cookie = login(port, args.user, args.password) if args.login else None
+        with multiprocessing.Pool(clients) as pool:
+            parts = pool.starmap(client, [(port, paths, cookie, args.warmup, args.duration, client_cores, n)
+                                          for n in range(clients)])
+    finally:
+        stop_server(server)
+    latencies = sorted(seconds * 1000 for part, _ in parts for seconds in part)
+    errors = sum(part_errors for _, part_errors in parts)
+    if not latencies:
+        sys.exit(f'No requests completed with {workers} workers')
+    return {
+        'workers': workers,
+        'cores': len(server_cores) if server_cores else None,
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput_rps': round(len(latencies) / args.duration, 1),
+        'p50_ms': round(percentile(latencies, 0.50), 2),
+        'p95_ms': round(percentile(latencies, 0.95), 2),
+    }
+
+
+def main():
+    args = parse_args()
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        sys.exit('gunicorn is not installed (pip install -r requirements.txt)')
+    counts = sorted({int(count) for count in args.workers.split(',') if count.strip()})
+    paths = [path for path in args.paths.split(',') if path] if args.login else ['/login']
+    clients = args.clients or max(2, 2 * counts[-1])
+
+    available = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else []
+    pin = not args.no_pin and len(available) > counts[-1]
+    if not pin and not args.no_pin:
+        print('Not pinning: fewer cores than the largest run needs plus one for clients', file=sys.stderr)
+
+    results = []
+    for workers in counts:
+        server_cores = set(available[:workers]) if pin else None
+        client_cores = set(available[counts[-1]:]) if pin else None
+        results.append(measure(args, workers, paths, clients, server_cores, client_cores))
+
+    base = results[0]['throughput_rps'] / results[0]['workers']
+    for result in results:
+        result['speedup'] = round(result['throughput_rps'] / results[0]['throughput_rps'], 2)
+        result['efficiency'] = round(result['throughput_rps'] / (base * result['workers']), 2)
+
+    if args.json:
+        print(json.dumps({'threads': args.threads, 'clients': clients, 'paths': paths, 'pinned': pin,
+                          'results': results}, indent=2))
+    else:
+        print(f"{args.threads} threads per worker, {clients} client processes, paths: {', '.join(paths)}")
+        print(f"{'workers':>7} {'req/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'speedup':>8} {'effic.':>7} {'errors':>7}")
+        for result in results:
+            print(f"{result['workers']:>7} {result['throughput_rps']:>10} {result['p50_ms']:>8} "
+                  f"{result['p95_ms']:>8} {result['speedup']:>7}x {result['efficiency']:>7} {result['errors']:>7}")
+    if any(result['errors'] for result in results):
+        sys.exit('Some requests failed')
+    if args.min_efficiency is not None:
+        low = [str(result['workers']) for result in results if result['efficiency'] < args.min_efficiency]
+        if low:
+            sys.exit(f"Below {args.min_efficiency} scaling efficiency with {', '.join(low)} workers")
+
+
+if __name__ == '__main__':
+    main()
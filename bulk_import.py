@@ -0,0 +1,329 @@
+"""
+Alumni Mentor Portal - Bulk CSV Import
+Validates uploaded rows in memory, then loads them with multi-row inserts
+in chunked transactions
+"""
+
+import csv
+import io
+import logging
+import time
+from calendar import monthrange
+from datetime import date
+
+from mysql.connector import Error
+
+logger = logging.getLogger(__name__)
+
+# Rows per multi-row INSERT and per transaction
+INSERT_BATCH_ROWS = 1000
+COMMIT_BATCH_ROWS = 10000
+
+# Per-mentor daily session cap (tr_mentorship_session_daily_limit)
+MAX_SESSIONS_PER_DAY = 3
+
+
+class ImportSpec:
+    """One importable table: its columns (CSV header = column name) and row checks"""
+
+    def __init__(self, table, columns, id_column, required):
+        self.table = table
+        self.columns = columns
+        self.id_column = id_column
+        self.required = required
+
+    @property
+    def insert_sql(self):
+        placeholders = ', '.join(['%s'] * len(self.columns))
+        return f"INSERT INTO {self.table} ({', '.join(self.columns)}) VALUES ({placeholders})"
+
+
+IMPORT_SPECS = {
+    'alumni': ImportSpec(
+        'Alumni',
+        ('Alumni_ID', 'Name', 'Phone_Number', 'Email', 'Graduation_Year',
+         'Current_Designation', 'Company', 'Location', 'Years_of_Experience'),
+        'Alumni_ID', ('Alumni_ID', 'Name', 'Email')
+    ),
+    'students': ImportSpec(
+        'Student',
+        ('Student_ID', 'Name', 'Phone_Number', 'Email', 'Department', 'Year_of_Study'),
+        'Student_ID', ('Student_ID', 'Name', 'Email')
+    ),
+    'sessions': ImportSpec(
+        'MentorshipSession',
+        ('Session_ID', 'Alumni_ID', 'Student_ID', 'Session_Date', 'Duration_Minutes', 'Topic'),
+        'Session_ID', ('Session_ID', 'Alumni_ID', 'Student_ID', 'Session_Date')
+    ),
+    'feedback': ImportSpec(
+        'Feedback',
+        ('Feedback_ID', 'Alumni_ID', 'Student_ID', 'Rating', 'Date', 'Comments'),
+        'Feedback_ID', ('Feedback_ID', 'Alumni_ID', 'Student_ID', 'Rating', 'Date')
+    ),
+}
+
+
+def add_months(day, months):
+    """Same as MySQL DATE_ADD(day, INTERVAL months MONTH)"""
+    month = day.month - 1 + months
+    year = day.year + month // 12
+    month = month % 12 + 1
+    return date(year, month, min(day.day, monthrange(year, month)[1]))
+
+
+def _column_set(cursor, sql):
+    cursor.execute(sql)
+    return {row[0] for row in cursor.fetchall() if row[0] is not None}
+
+
+def load_lookups(connection, spec):
+    """Read the existing keys the validator checks against into in-memory sets"""
+    cursor = connection.cursor()
+    try:
+        lookups = {'ids': _column_set(cursor, f"SELECT {spec.id_column} FROM {spec.table}")}
+        if spec.table in ('Alumni', 'Student'):
+            lookups['emails'] = _column_set(cursor, f"SELECT Email FROM {spec.table}")
+            lookups['phones'] = _column_set(cursor, f"SELECT Phone_Number FROM {spec.table}")
+        else:
+            lookups['alumni'] = _column_set(cursor, "SELECT Alumni_ID FROM Alumni")
+            lookups['students'] = _column_set(cursor, "SELECT Student_ID FROM Student")
+        if spec.table == 'MentorshipSession':
+            cursor.execute("""
+                SELECT Alumni_ID, Session_Date, COUNT(*) FROM MentorshipSession
+                WHERE Session_Date >= CURDATE()
+                GROUP BY Alumni_ID, Session_Date
+            """)
+            lookups['daily'] = {(alumni_id, day): count for alumni_id, day, count in cursor.fetchall()}
+        return lookups
+    finally:
+        cursor.close()
+
+
+def _int(value, errors, name, low=None, high=None):
+    try:
+        number = int(value)
+    except ValueError:
+        errors.append(f'{name} must be a whole number')
+        return None
+    if (low is not None and number < low) or (high is not None and number > high):
+        errors.append(f'{name} must be between {low} and {high}' if high is not None
+                      else f'{name} must be at least {low}')
+    return number
+
+
+def _date(value, errors, name):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        errors.append(f'{name} must be a YYYY-MM-DD date')
+        return None
+
+
+def _phone(value, errors, lookups):
+    phone = _int(value, errors, 'Phone_Number')
+    if phone is None:
+        return None
+    if not 1000000000 <= phone <= 9999999999:
+        errors.append('Phone number must be 10 digits')
+    elif phone in lookups['phones']:
+        errors.append('Phone number already registered')
+    return phone
+
+
+def validate_row(spec, row, lookups, today):
+    """Return (values, errors) for one CSV row; mirrors the table's insert triggers"""
+    errors = []
+    data = {column: (row.get(column) or '').strip() for column in spec.columns}
+    for column in spec.required:
+        if not data[column]:
+            errors.append(f'{column} is required')
+
+    row_id = data[spec.id_column]
+    if row_id and row_id in lookups['ids']:
+        errors.append(f'{spec.id_column} {row_id} already exists')
+
+    values = {column: data[column] or None for column in spec.columns}
+
+    if spec.table in ('Alumni', 'Student'):
+        if data['Email'] and data['Email'].lower() in lookups['emails']:
+            errors.append(f"Email already registered for another {spec.table.lower()}")
+        if data['Phone_Number']:
+            values['Phone_Number'] = _phone(data['Phone_Number'], errors, lookups)
+
+    if spec.table == 'Alumni':
+        if data['Graduation_Year']:
+            values['Graduation_Year'] = _int(data['Graduation_Year'], errors, 'Graduation_Year',
+                                             1900, today.year)
+        if data['Years_of_Experience']:
+            values['Years_of_Experience'] = _int(data['Years_of_Experience'], errors,
+                                                 'Years_of_Experience', 0)
+        elif values['Graduation_Year'] is not None:
+            # tr_alumni_before_insert derives it the same way
+            values['Years_of_Experience'] = today.year - values['Graduation_Year']
+
+    elif spec.table == 'Student':
+        if data['Year_of_Study']:
+            values['Year_of_Study'] = _int(data['Year_of_Study'], errors, 'Year_of_Study', 1, 4)
+
+    else:
+        if data['Alumni_ID'] and data['Alumni_ID'] not in lookups['alumni']:
+            errors.append('Alumni does not exist')
+        if data['Student_ID'] and data['Student_ID'] not in lookups['students']:
+            errors.append('Student does not exist')
+
+    if spec.table == 'MentorshipSession':
+        if data['Session_Date']:
+            day = _date(data['Session_Date'], errors, 'Session_Date')
+            values['Session_Date'] = day
+            if day is not None:
+                if day < today:
+                    errors.append('Cannot schedule sessions in the past')
+                elif day > add_months(today, 3):
+                    errors.append('Cannot schedule sessions more than 3 months in advance')
+                elif lookups['daily'].get((data['Alumni_ID'], day), 0) >= MAX_SESSIONS_PER_DAY:
+                    errors.append(f'Alumni cannot have more than {MAX_SESSIONS_PER_DAY} sessions per day')
+        if data['Duration_Minutes']:
+            values['Duration_Minutes'] = _int(data['Duration_Minutes'], errors, 'Duration_Minutes', 1)
+
+    elif spec.table == 'Feedback':
+        if data['Rating']:
+            values['Rating'] = _int(data['Rating'], errors, 'Rating', 1, 5)
+        if data['Date']:
+            day = _date(data['Date'], errors, 'Date')
+            values['Date'] = day
+            if day is not None and day > today:
+                errors.append('Feedback date cannot be in the future')
+
+    return tuple(values[column] for column in spec.columns), errors
+
+
+def _remember(spec, values, lookups):
+    """Add an accepted row to the lookups so later rows in the file are checked against it"""
+    row = dict(zip(spec.columns, values))
+    lookups['ids'].add(row[spec.id_column])
+    if 'emails' in lookups:
+        lookups['emails'].add(row['Email'].lower())
+        if row['Phone_Number'] is not None:
+            lookups['phones'].add(row['Phone_Number'])
+    if 'daily' in lookups:
+        key = (row['Alumni_ID'], row['Session_Date'])
+        lookups['daily'][key] = lookups['daily'].get(key, 0) + 1
+
+
+def validate_csv(spec, text, lookups, today=None):
+    """Return (rows, errors): accepted (line, values) pairs and per-line error lists"""
+    today = today or date.today()
+    # Email uniqueness is case-insensitive under the default collation
+    if 'emails' in lookups:
+        lookups['emails'] = {email.lower() for email in lookups['emails']}
+
+    reader = csv.DictReader(io.StringIO(text))
+    try:
+        missing = [column for column in spec.required if column not in (reader.fieldnames or ())]
+    except csv.Error as e:
+        return [], [{'line': 1, 'errors': [f'Unreadable CSV: {e}']}]
+    if missing:
+        return [], [{'line': 1, 'errors': [f"Missing column(s): {', '.join(missing)}"]}]
+
+    rows = []
+    errors = []
+    try:
+        for row in reader:
+            values, row_errors = validate_row(spec, row, lookups, today)
+            if row_errors:
+                errors.append({'line': reader.line_num, 'errors': row_errors})
+            else:
+                _remember(spec, values, lookups)
+                rows.append((reader.line_num, values))
+    except csv.Error as e:
+        # A malformed file (a NUL byte, an unclosed quote) loads nothing
+        errors.append({'line': reader.line_num + 1, 'errors': [f'Unreadable CSV: {e}']})
+        return [], errors
+    return rows, errors
+
+
+def decode_upload(data):
+    """(text, errors) for uploaded bytes; errors names the first line that is not UTF-8"""
+    try:
+        return data.decode('utf-8-sig'), []
+    except UnicodeDecodeError as e:
+        line = data.count(b'\n', 0, e.start) + 1
+        return None, [{'line': line, 'errors': ["Not UTF-8 text; save the file as 'CSV UTF-8'"]}]
+
+
+def _insert_rows_individually(connection, spec, rows, errors):
+    """Re-run a failed chunk row by row so the report names the offending lines"""
+    inserted = 0
+    cursor = connection.cursor()
+    try:
+        for line, values in rows:
+            try:
+                cursor.execute(spec.insert_sql, values)
+                connection.commit()
+                inserted += 1
+            except Error as e:
+                connection.rollback()
+                errors.append({'line': line, 'errors': [e.msg or str(e)]})
+    finally:
+        cursor.close()
+    return inserted
+
+
+def load_rows(connection, spec, rows, errors,
+              batch_rows=INSERT_BATCH_ROWS, commit_rows=COMMIT_BATCH_ROWS):
+    """Insert validated rows; returns the number inserted.
+
+    executemany() on an INSERT ... VALUES statement is sent as one multi-row
+    INSERT per batch. Batches are committed every commit_rows rows; a chunk
+    that fails (e.g. a concurrent insert took an email) is rolled back and
+    retried row by row so only the bad rows are reported.
+    """
+    inserted = 0
+    cursor = connection.cursor()
+    try:
+        for start in range(0, len(rows), commit_rows):
+            chunk = rows[start:start + commit_rows]
+            try:
+                connection.start_transaction()
+                for offset in range(0, len(chunk), batch_rows):
+                    batch = chunk[offset:offset + batch_rows]
+                    cursor.executemany(spec.insert_sql, [values for _, values in batch])
+                connection.commit()
+                inserted += len(chunk)
+            except Error as e:
+                logger.warning(f"Import chunk at row {chunk[0][0]} failed, retrying row by row: {e}")
+                connection.rollback()
+                inserted += _insert_rows_individually(connection, spec, chunk, errors)
+    finally:
+        cursor.close()
+    return inserted
+
+
+def import_csv(connection, dataset, text):
+    """Validate and load a CSV upload; returns the import report"""
+    spec = IMPORT_SPECS[dataset]
+    started = time.perf_counter()
+
+    lookups = load_lookups(connection, spec)
+    rows, errors = validate_csv(spec, text, lookups)
+    total = len(rows) + len(errors)
+    validated = time.perf_counter()
+
+    inserted = load_rows(connection, spec, rows, errors)
+    finished = time.perf_counter()
+
+    errors.sort(key=lambda error: error['line'])
+    elapsed = finished - started
+    load_time = finished - validated
+    return {
+        'table': spec.table,
+        'total': total,
+        'inserted': inserted,
+        'failed': len(errors),
+        'errors': errors,
+        'validate_seconds': round(validated - started, 3),
+        'load_seconds': round(load_time, 3),
+        'elapsed_seconds': round(elapsed, 3),
+        'rows_per_sec': round(inserted / elapsed, 1) if elapsed else 0.0,
+        'load_rows_per_sec': round(inserted / load_time, 1) if load_time else 0.0,
+    }
@@ -0,0 +1,407 @@
+"""
+Alumni Mentor Portal - Synthetic Data Generator
+Builds referentially consistent rows for every table at a chosen scale (1k to
+10M rows) from a fixed seed, within the insert triggers' rules, and loads them
+with multi-row inserts in chunked transactions
+"""
+
+import bisect
+import itertools
+import logging
+import random
+import re
+import time
+from datetime import date, timedelta
+
+from mysql.connector import Error
+
+from bulk_import import INSERT_BATCH_ROWS, COMMIT_BATCH_ROWS, MAX_SESSIONS_PER_DAY
+
+logger = logging.getLogger(__name__)
+
+# Generated IDs start with G (GA alumni, GS students, GM sessions, ...) so --reset can find them
+ID_PREFIXES = {
+    'Alumni': 'GA', 'Student': 'GS', 'Skill': 'GK', 'Industry': 'GI',
+    'Achievement': 'GH', 'MentorshipSession': 'GM', 'Feedback': 'GF',
+}
+
+# Sessions fall on days 1..88 from today: after today and inside the 3-month
+# window even when it spans February (tr_mentorship_session_before_insert_date)
+SESSION_DAYS = 88
+MAX_SESSIONS_PER_MENTOR = SESSION_DAYS * MAX_SESSIONS_PER_DAY
+
+# Share of the requested row total per table; Provides follows from the sessions
+TABLE_SHARES = {
+    'Alumni': 0.02,
+    'Industry': 0.02,
+    'Achievement': 0.02,
+    'Student': 0.06,
+    'Alumni_Skills': 0.08,
+    'Student_Skills': 0.12,
+    'MentorshipSession': 0.38,
+    'Feedback': 0.25,
+}
+
+# Popularity skew: the mentor (or skill) at rank r gets weight 1 / r**ZIPF_EXPONENT
+ZIPF_EXPONENT = 1.1
+
+MIN_ROWS = 1000
+MAX_ROWS = 10_000_000
+
+COLUMNS = {
+    'Skill': ('Skill_ID', 'Skill_Name', 'Proficiency_Level', 'Category'),
+    'Alumni': ('Alumni_ID', 'Name', 'Phone_Number', 'Email', 'Graduation_Year', 'Current_Designation',
+               'Company', 'Location', 'Years_of_Experience'),
+    'Industry': ('Industry_ID', 'Alumni_ID', 'Sector', 'Location', 'Size', 'Industry_Name'),
+    'Achievement': ('Achievement_ID', 'Alumni_ID', 'Awarding_Body', 'Title', 'Description', 'Year'),
+    'Student': ('Student_ID', 'Name', 'Phone_Number', 'Email', 'Department', 'Year_of_Study'),
+    'Alumni_Skills': ('Alumni_ID', 'Skill_ID', 'Acquired_Date', 'Proficiency_Level'),
+    'Student_Skills': ('Student_ID', 'Skill_ID', 'Priority_Level', 'Status'),
+    'Provides': ('Alumni_ID', 'Student_ID', 'Mentorship_Start_Date', 'Status'),
+    'MentorshipSession': ('Session_ID', 'Alumni_ID', 'Student_ID', 'Session_Date', 'Duration_Minutes', 'Topic'),
+    'Feedback': ('Feedback_ID', 'Alumni_ID', 'Student_ID', 'Rating', 'Date', 'Comments'),
+}
+
+# Parents before children, so a flush never inserts a row ahead of what it references
+TABLE_ORDER = tuple(COLUMNS)
+
+# Generated rows, children first, for --reset; (table, column, prefix)
+RESET_ORDER = (
+    ('Feedback', 'Feedback_ID', 'GF'),
+    ('Feedback_Log', 'Alumni_ID', 'GA'),
+    ('MentorshipSession', 'Session_ID', 'GM'),
+    ('Activity_Log', 'Alumni_ID', 'GA'),
+    ('Mentorship_Request', 'Alumni_ID', 'GA'),
+    ('Skill_Match_Log', 'Student_ID', 'GS'),
+    ('Provides', 'Alumni_ID', 'GA'),
+    ('Student_Skills', 'Student_ID', 'GS'),
+    ('Alumni_Skills', 'Alumni_ID', 'GA'),
+    ('Achievement', 'Achievement_ID', 'GH'),
+    ('Industry', 'Industry_ID', 'GI'),
+    ('Skill', 'Skill_ID', 'GK'),
+    ('Alumni', 'Alumni_ID', 'GA'),
+    ('Student', 'Student_ID', 'GS'),
+)
+RESET_BATCH_ROWS = 10000
+
+FIRST_NAMES = ('Aarav', 'Aditi', 'Akash', 'Ananya', 'Arjun', 'Divya', 'Farhan', 'Gauri', 'Harsh', 'Isha',
+               'Karan', 'Kavya', 'Lakshmi', 'Manish', 'Meera', 'Nikhil', 'Nisha', 'Pooja', 'Rahul', 'Riya',
+               'Rohan', 'Sanjay', 'Shreya', 'Siddharth', 'Sneha', 'Tanvi', 'Varun', 'Vikram', 'Yash', 'Zoya')
+LAST_NAMES = ('Agarwal', 'Bhat', 'Chopra', 'Das', 'Gupta', 'Iyer', 'Joshi', 'Kapoor', 'Kumar', 'Menon',
+              'Mishra', 'Nair', 'Patel', 'Rao', 'Reddy', 'Shah', 'Sharma', 'Singh', 'Verma', 'Yadav')
+COMPANIES = ('Google', 'Microsoft', 'Amazon', 'Infosys', 'TCS', 'Wipro', 'Flipkart', 'Adobe', 'Oracle',
+             'Intel', 'Cisco', 'Zoho', 'Swiggy', 'Razorpay', 'Atlassian', 'SAP', 'IBM', 'Accenture')
+DESIGNATIONS = ('Software Engineer', 'Senior Software Engineer', 'Staff Engineer', 'Engineering Manager',
+                'Data Scientist', 'Product Manager', 'DevOps Engineer', 'Architect', 'Director', 'Consultant')
+LOCATIONS = ('Bangalore', 'Hyderabad', 'Pune', 'Chennai', 'Mumbai', 'Delhi', 'Seattle', 'London', 'Singapore')
+SECTORS = ('Technology', 'Finance', 'Healthcare', 'E-commerce', 'Consulting', 'Semiconductors')
+SIZES = ('Startup', 'Small', 'Medium', 'Large', 'Enterprise')
+DEPARTMENTS = (('CSE', 35), ('ECE', 20), ('EEE', 12), ('ME', 12), ('CE', 8), ('BT', 6), ('AIML', 7))
+SKILLS = (('Python', 'Programming'), ('Java', 'Programming'), ('C++', 'Programming'), ('JavaScript', 'Programming'),
+          ('Go', 'Programming'), ('Rust', 'Programming'), ('SQL', 'Data'), ('Machine Learning', 'Data'),
+          ('Deep Learning', 'Data'), ('Data Analysis', 'Data'), ('Statistics', 'Data'), ('React', 'Web'),
+          ('Node.js', 'Web'), ('Django', 'Web'), ('AWS', 'Cloud'), ('Azure', 'Cloud'), ('Kubernetes', 'Cloud'),
+          ('Docker', 'Cloud'), ('System Design', 'Engineering'), ('Embedded Systems', 'Engineering'),
+          ('VLSI', 'Engineering'), ('Cybersecurity', 'Security'), ('Product Management', 'Management'),
+          ('Public Speaking', 'Soft Skills'), ('Leadership', 'Soft Skills'))
+PROFICIENCY = ('Beginner', 'Intermediate', 'Advanced', 'Expert')
+TOPICS = ('Career guidance', 'Resume review', 'Interview preparation', 'Project discussion', 'Higher studies',
+          'Internship search', 'System design practice', 'Research directions', 'Startup advice')
+AWARDS = (('Best Employee Award', 'Company'), ('Innovation Award', 'Company'), ('Patent Granted', 'Patent Office'),
+          ('Best Paper Award', 'IEEE'), ('Distinguished Alumni', 'University'), ('Hackathon Winner', 'Industry'))
+COMMENTS = {1: 'Not helpful', 2: 'Could be better prepared', 3: 'Useful session', 4: 'Very helpful advice',
+            5: 'Excellent mentor, highly recommended'}
+
+
+def parse_rows(text):
+    """'10k', '2.5m', '1000000' -> row count between MIN_ROWS and MAX_ROWS"""
+    match = re.fullmatch(r'\s*([\d.]+)\s*([km]?)\s*', str(text).lower())
+    if not match:
+        raise ValueError(f'Invalid row count: {text}')
+    rows = int(float(match.group(1)) * {'': 1, 'k': 1000, 'm': 1_000_000}[match.group(2)])
+    if not MIN_ROWS <= rows <= MAX_ROWS:
+        raise ValueError(f'Row count must be between {MIN_ROWS} and {MAX_ROWS}')
+    return rows
+
+
+def plan_counts(total_rows):
+    """Target rows per table for a requested total"""
+    counts = {table: max(1, int(total_rows * share)) for table, share in TABLE_SHARES.items()}
+    counts['Alumni'] = max(counts['Alumni'], 5)
+    counts['Student'] = max(counts['Student'], 10)
+    counts['Skill'] = min(2000, max(len(SKILLS), total_rows // 500))
+    counts['MentorshipSession'] = min(counts['MentorshipSession'], counts['Alumni'] * MAX_SESSIONS_PER_MENTOR)
+    return counts
+
+
+def zipf_weights(n, rng):
+    """Skewed weights in random rank order: a few items get most of the weight"""
+    ranks = list(range(1, n + 1))
+    rng.shuffle(ranks)
+    return [1.0 / rank ** ZIPF_EXPONENT for rank in ranks]
+
+
+def allocate(total, weights, rng, cap=None):
+    """Split total across items in proportion to weights, at most cap each"""
+    weight_sum = sum(weights)
+    counts = [int(total * weight / weight_sum) for weight in weights]
+    if cap is not None:
+        counts = [min(count, cap) for count in counts]
+    remaining = total - sum(counts)
+    if cap is None:
+        for index in rng.choices(range(len(weights)), weights=weights, k=remaining):
+            counts[index] += 1
+        return counts
+    # Overflow from capped items goes to random items that still have room
+    open_items = [index for index, count in enumerate(counts) if count < cap]
+    while remaining > 0 and open_items:
+        pick = rng.randrange(len(open_items))
+        index = open_items[pick]
+        counts[index] += 1
+        remaining -= 1
+        if counts[index] == cap:
+            open_items[pick] = open_items[-1]
+            open_items.pop()
+    return counts
+
+
+def weighted_sample(cumulative, k, rng):
+    """k distinct indexes drawn by cumulative weights"""
+    total = cumulative[-1]
+    picked = set()
+    while len(picked) < min(k, len(cumulative)):
+        picked.add(bisect.bisect_left(cumulative, rng.random() * total))
+    return picked
+
+
+def person_name(rng):
+    return f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+
+
+class _Writer:
+    """Buffers rows per table and writes them with multi-row inserts.
+
+    Every flush writes the tables in TABLE_ORDER, so rows added in parent-first
+    order are always inserted after the rows they reference. A transaction is
+    committed every commit_rows rows.
+    """
+
+    def __init__(self, connection, batch_rows=INSERT_BATCH_ROWS, commit_rows=COMMIT_BATCH_ROWS):
+        self.connection = connection
+        self.batch_rows = batch_rows
+        self.commit_rows = commit_rows
+        self.cursor = connection.cursor()
+        self.buffers = {table: [] for table in TABLE_ORDER}
+        self.counts = dict.fromkeys(TABLE_ORDER, 0)
+        self.uncommitted = 0
+        self.in_transaction = False
+
+    def add(self, table, row):
+        buffer = self.buffers[table]
+        buffer.append(row)
+        if len(buffer) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.in_transaction:
+            self.connection.start_transaction()
+            self.in_transaction = True
+        for table in TABLE_ORDER:
+            rows = self.buffers[table]
+            if rows:
+                columns = COLUMNS[table]
+                self.cursor.executemany(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})",
+                    rows)
+                self.counts[table] += len(rows)
+                self.uncommitted += len(rows)
+                self.buffers[table] = []
+        if self.uncommitted >= self.commit_rows:
+            self.commit()
+
+    def commit(self):
+        if self.in_transaction:
+            self.connection.commit()
+            self.in_transaction = False
+        self.uncommitted = 0
+
+    def finish(self):
+        """Write everything buffered and commit"""
+        self.flush()
+        self.commit()
+
+    def abandon(self, table):
+        """Roll back the open transaction after a failed flush; returns the rows lost from table"""
+        self.connection.rollback()
+        self.in_transaction = False
+        lost = self.uncommitted
+        self.counts[table] -= min(lost, self.counts[table])
+        self.uncommitted = 0
+        self.buffers = {name: [] for name in TABLE_ORDER}
+        return lost
+
+    def close(self):
+        self.cursor.close()
+
+
+def _ids(table, count):
+    prefix = ID_PREFIXES[table]
+    return [f'{prefix}{n:08d}' for n in range(1, count + 1)]
+
+
+def generate(connection, total_rows, seed=42, today=None):
+    """Generate and load about total_rows rows; returns the load report"""
+    rng = random.Random(seed)
+    today = today or date.today()
+    counts = plan_counts(total_rows)
+    started = time.perf_counter()
+    skipped = {}
+
+    alumni_ids = _ids('Alumni', counts['Alumni'])
+    student_ids = _ids('Student', counts['Student'])
+    skill_ids = _ids('Skill', counts['Skill'])
+    skill_cumulative = list(itertools.accumulate(zipf_weights(len(skill_ids), rng)))
+    mentor_weights = zipf_weights(len(alumni_ids), rng)
+    graduation_years = []
+
+    writer = _Writer(connection)
+    try:
+        # tr_skill_before_insert rejects a Skill_Name that already exists
+        writer.cursor.execute("SELECT Skill_Name FROM Skill")
+        taken = {name for (name,) in writer.cursor.fetchall()}
+        for n, skill_id in enumerate(skill_ids):
+            base, category = SKILLS[n % len(SKILLS)]
+            name, suffix = base, n // len(SKILLS) + 1
+            while name in taken:
+                suffix += 1
+                name = f'{base} {suffix}'
+            taken.add(name)
+            writer.add('Skill', (skill_id, name, rng.choice(PROFICIENCY), category))
+
+        for n, alumni_id in enumerate(alumni_ids):
+            graduation_year = today.year - rng.randint(1, 30)
+            graduation_years.append(graduation_year)
+            company = rng.choice(COMPANIES)
+            writer.add('Alumni', (
+                alumni_id, person_name(rng), 6000000000 + n, f'{alumni_id.lower()}@alumni.example.edu',
+                graduation_year, rng.choice(DESIGNATIONS), company, rng.choice(LOCATIONS),
+                max(0, today.year - graduation_year - rng.randint(0, 1)),
+            ))
+            writer.add('Industry', (
+                f"{ID_PREFIXES['Industry']}{n + 1:08d}", alumni_id, rng.choice(SECTORS),
+                rng.choice(LOCATIONS), rng.choice(SIZES), company,
+            ))
+        writer.finish()
+
+        # Achievement inserts fail while tr_achievement_after_insert (additional_triggers.sql)
+        # references columns Achievement does not have; load them on their own so that
+        # failure only skips this table
+        try:
+            achievement_id = itertools.count(1)
+            per_alumnus = allocate(counts['Achievement'], mentor_weights, rng)
+            for n, (alumni_id, count) in enumerate(zip(alumni_ids, per_alumnus)):
+                for _ in range(count):
+                    title, body = rng.choice(AWARDS)
+                    writer.add('Achievement', (
+                        f"{ID_PREFIXES['Achievement']}{next(achievement_id):08d}", alumni_id, body, title,
+                        f'{title} ({body})', rng.randint(graduation_years[n], today.year),
+                    ))
+            writer.finish()
+        except Error as e:
+            writer.abandon('Achievement')
+            skipped['Achievement'] = e.msg
+            logger.warning(f"Skipping achievements: {e}")
+
+        departments = [name for name, _ in DEPARTMENTS]
+        department_weights = [weight for _, weight in DEPARTMENTS]
+        for n, student_id in enumerate(student_ids):
+            writer.add('Student', (
+                student_id, person_name(rng), 7000000000 + n, f'{student_id.lower()}@student.example.edu',
+                rng.choices(departments, department_weights)[0], rng.randint(1, 4),
+            ))
+        writer.finish()
+
+        per_alumnus = max(1, round(counts['Alumni_Skills'] / len(alumni_ids)))
+        for alumni_id in alumni_ids:
+            for index in weighted_sample(skill_cumulative, rng.randint(1, 2 * per_alumnus - 1), rng):
+                writer.add('Alumni_Skills', (
+                    alumni_id, skill_ids[index], today - timedelta(days=rng.randint(30, 3650)),
+                    rng.choice(PROFICIENCY),
+                ))
+        per_student = max(1, round(counts['Student_Skills'] / len(student_ids)))
+        for student_id in student_ids:
+            for priority, index in enumerate(weighted_sample(skill_cumulative, rng.randint(1, 2 * per_student - 1),
+                                                             rng), 1):
+                writer.add('Student_Skills', (student_id, skill_ids[index], priority, 'Wanted'))
+        writer.finish()
+
+        # Sessions follow mentor popularity but stop at the per-mentor daily cap;
+        # feedback follows it uncapped, so the popular mentors collect most reviews
+        sessions = allocate(counts['MentorshipSession'], mentor_weights, rng, cap=MAX_SESSIONS_PER_MENTOR)
+        feedback = allocate(counts['Feedback'], mentor_weights, rng)
+        session_id = itertools.count(1)
+        feedback_id = itertools.count(1)
+        for alumni_id, session_count, feedback_count in zip(alumni_ids, sessions, feedback):
+            if not session_count and not feedback_count:
+                continue
+            mentee_count = max(1, min(len(student_ids), round(max(session_count, 1) / rng.uniform(2, 5))))
+            mentees = [student_ids[index] for index in rng.sample(range(len(student_ids)), mentee_count)]
+            for student_id in mentees:
+                writer.add('Provides', (
+                    alumni_id, student_id, today - timedelta(days=rng.randint(0, 720)),
+                    'Active' if rng.random() < 0.85 else 'Completed',
+                ))
+            # Distinct (day, slot) pairs keep every mentor within 3 sessions per day
+            for slot in rng.sample(range(MAX_SESSIONS_PER_MENTOR), session_count):
+                writer.add('MentorshipSession', (
+                    f"{ID_PREFIXES['MentorshipSession']}{next(session_id):08d}", alumni_id, rng.choice(mentees),
+                    today + timedelta(days=1 + slot // MAX_SESSIONS_PER_DAY), rng.choice((30, 45, 60, 90)),
+                    rng.choice(TOPICS),
+                ))
+            quality = min(5.0, max(1.5, rng.gauss(4.0, 0.6)))
+            for _ in range(feedback_count):
+                rating = min(5, max(1, round(rng.gauss(quality, 0.8))))
+                writer.add('Feedback', (
+                    f"{ID_PREFIXES['Feedback']}{next(feedback_id):08d}", alumni_id, rng.choice(mentees), rating,
+                    today - timedelta(days=rng.randint(0, 365)), COMMENTS[rating],
+                ))
+        writer.finish()
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    inserted = sum(writer.counts.values())
+    return {
+        'requested_rows': total_rows,
+        'seed': seed,
+        'tables': dict(writer.counts),
+        'inserted': inserted,
+        'skipped': skipped,
+        'elapsed_seconds': round(elapsed, 2),
+        'rows_per_sec': round(inserted / elapsed, 1) if elapsed else None,
+    }
+
+
+def reset(connection):
+    """Delete every generated row (IDs with the generator's prefixes), children first"""
+    deleted = {}
+    cursor = connection.cursor()
+    try:
+        for table, column, prefix in RESET_ORDER:
+            total = 0
+            while True:
+                try:
+                    cursor.execute(f"DELETE FROM {table} WHERE {column} LIKE %s LIMIT {RESET_BATCH_ROWS}",
+                                   (prefix + '%',))
+                except Error as e:
+                    if e.errno == 1146:  # optional table not installed
+                        break
+                    raise
+                connection.commit()
+                total += cursor.rowcount
+                if cursor.rowcount < RESET_BATCH_ROWS:
+                    break
+            deleted[table] = total
+    finally:
+        cursor.close()
+    return deleted
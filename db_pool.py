@@ -0,0 +1,295 @@
+"""
+Alumni Mentor Portal - Database Connection Pool
+Keeps a bounded set of reusable MySQL connections for each database user
+"""
+
+import threading
+import time
+import logging
+
+import mysql.connector
+from mysql.connector import Error
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Error):
+    """Raised when no pooled connection becomes free within the acquire timeout"""
+
+
+class PooledConnection:
+    """Wrapper around a pooled connection; close() hands it back to the pool"""
+
+    def __init__(self, pool, connection):
+        self._pool = pool
+        self._connection = connection
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def close(self):
+        """Return the connection to its pool instead of closing it"""
+        if self._connection is not None:
+            self._pool.release(self._connection)
+            self._connection = None
+
+    def discard(self):
+        """Close the underlying connection and drop it from the pool"""
+        if self._connection is not None:
+            self._pool.discard(self._connection)
+            self._connection = None
+
+
+class ConnectionPool:
+    """Bounded MySQL connection pool with checkout health checks and idle eviction"""
+
+    def __init__(self, config, max_size=10, acquire_timeout=5.0, max_idle_time=300, ping_after=30, name='request'):
+        self.config = dict(config)
+        self.name = name
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.max_idle_time = max_idle_time
+        self.ping_after = ping_after
+
+        self._lock = threading.Condition()
+        self._idle = []  # (connection, returned_at), most recently used last
+        self._size = 0
+        self._in_use = 0
+        self._waiters = 0
+        self._closed = False
+
+        self._acquired = 0
+        self._created = 0
+        self._discarded = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _connect(self):
+        """Open a new physical connection"""
+        connection = mysql.connector.connect(**self.config)
+        logger.info(f"Opened pooled connection for {self.config.get('user')}")
+        return connection
+
+    def _close_quietly(self, connection):
+        try:
+            connection.close()
+        except Error:
+            pass
+
+    def _evict_idle_locked(self, now):
+        """Drop idle connections older than max_idle_time; caller holds the lock"""
+        expired = [conn for conn, returned_at in self._idle if now - returned_at > self.max_idle_time]
+        if expired:
+            self._idle = [(conn, t) for conn, t in self._idle if now - t <= self.max_idle_time]
+            self._size -= len(expired)
+            self._discarded += len(expired)
+        return expired
+
+    def evict_idle(self):
+        """Close connections that have been idle for longer than max_idle_time"""
+        with self._lock:
+            expired = self._evict_idle_locked(time.monotonic())
+            if expired:
+                self._lock.notify_all()
+        for connection in expired:
+            self._close_quietly(connection)
+        return len(expired)
+
+    def acquire(self, timeout=None):
+        """Check out a healthy connection, waiting up to timeout seconds for a free slot"""
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            connection = None
+            idle_for = 0.0
+            create = False
+
+            with self._lock:
+                if self._closed:
+                    raise Error(msg="Connection pool is closed")
+
+                expired = self._evict_idle_locked(time.monotonic())
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(
+                            msg=f"Timed out after {timeout}s waiting for a database connection"
+                        )
+                    self._waiters += 1
+                    try:
+                        self._lock.wait(remaining)
+                    finally:
+                        self._waiters -= 1
+
+                if self._idle:
+                    connection, returned_at = self._idle.pop()
+                    idle_for = time.monotonic() - returned_at
+                else:
+                    create = True
+                    self._size += 1
+                self._in_use += 1
+
+            for stale in expired:
+                self._close_quietly(stale)
+
+            if create:
+                try:
+                    connection = self._connect()
+                except Error:
+                    with self._lock:
+                        self._size -= 1
+                        self._in_use -= 1
+                        self._lock.notify()
+                    raise
+                with self._lock:
+                    self._created += 1
+            elif idle_for > self.ping_after and not self._is_healthy(connection):
+                logger.warning("Discarding broken pooled connection")
+                self.discard(connection)
+                continue
+
+            waited = time.monotonic() - started
+            with self._lock:
+                self._acquired += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+            return PooledConnection(self, connection)
+
+    def _is_healthy(self, connection):
+        """Ping a connection that has sat idle long enough to have been dropped by the server"""
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Error:
+            return False
+
+    def release(self, connection):
+        """Return a connection to the idle list"""
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+        except Error:
+            self.discard(connection)
+            return
+
+        with self._lock:
+            self._in_use -= 1
+            if self._closed:
+                self._size -= 1
+                close_now = True
+            else:
+                self._idle.append((connection, time.monotonic()))
+                close_now = False
+            self._lock.notify()
+        if close_now:
+            self._close_quietly(connection)
+
+    def discard(self, connection):
+        """Close a checked-out connection and free its slot"""
+        with self._lock:
+            self._in_use -= 1
+            self._size -= 1
+            self._discarded += 1
+            self._lock.notify()
+        self._close_quietly(connection)
+
+    def close(self):
+        """Close all idle connections; in-use ones are closed when released"""
+        with self._lock:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle = []
+            self._size -= len(idle)
+            self._lock.notify_all()
+        for connection in idle:
+            self._close_quietly(connection)
+
+    def stats(self):
+        """Snapshot of pool usage for sizing under load"""
+        with self._lock:
+            return {
+                'user': self.config.get('user'),
+                'name': self.name,
+                'max_size': self.max_size,
+                'size': self._size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'waiters': self._waiters,
+                'acquired': self._acquired,
+                'created': self._created,
+                'discarded': self._discarded,
+                'timeouts': self._timeouts,
+                'total_wait_ms': round(self._total_wait * 1000, 3),
+                'avg_wait_ms': round(self._total_wait * 1000 / self._acquired, 3) if self._acquired else 0.0,
+                'max_wait_ms': round(self._max_wait * 1000, 3),
+            }
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+_inherited = []  # pools of the parent process, after a fork
+
+
+def _pool_key(config):
+    # The password is part of the key so a failed login never disturbs a working pool
+    return (config.get('host'), config.get('port', 3306), config.get('database'),
+            config.get('user'), config.get('password'))
+
+
+def get_pool(config, name='request', **pool_options):
+    """Return the named pool for the config's database credentials, creating it on first use"""
+    key = _pool_key(config) + (name,)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(config, name=name, **pool_options)
+            _pools[key] = pool
+    return pool
+
+
+def remove_pool(config):
+    """Close and forget every pool for the config's database credentials"""
+    credentials = _pool_key(config)
+    with _pools_lock:
+        pools = [_pools.pop(key) for key in list(_pools) if key[:-1] == credentials]
+    for pool in pools:
+        pool.close()
+
+
+def evict_idle_pools():
+    """Close connections idle past max_idle_time in every pool; returns how many were closed"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return sum(pool.evict_idle() for pool in pools)
+
+
+def close_all_pools():
+    """Close every pool (used on shutdown)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def forget_all_pools():
+    """Stop using every pool without closing it (in a forked child, whose connections belong to the parent).
+
+    The pools stay referenced: a collected connection shuts its socket down,
+    which would cut the parent's connection too.
+    """
+    global _pools_lock
+    _pools_lock = threading.Lock()
+    _inherited.extend(_pools.values())
+    _pools.clear()
+
+
+def pool_stats():
+    """Stats for every live pool"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [pool.stats() for pool in pools]
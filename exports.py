@@ -0,0 +1,132 @@
+"""
+Alumni Mentor Portal - Streaming Exports
+Streams full table extracts as CSV or NDJSON from an unbuffered cursor
+"""
+
+import csv
+import io
+import json
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+
+from mysql.connector import Error
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched from the server and flushed to the client per chunk
+EXPORT_CHUNK_ROWS = 1000
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+# Alumni-student pairs with their session totals (also rendered by /connections)
+CONNECTIONS_QUERY = """
+    SELECT 
+        a.Name as Alumni_Name,
+        a.Company,
+        a.Current_Designation,
+        s.Name as Student_Name,
+        s.Department,
+        s.Year_of_Study,
+        COUNT(ms.Session_ID) as Total_Sessions,
+        MAX(ms.Session_Date) as Last_Session
+    FROM Alumni a
+    INNER JOIN MentorshipSession ms ON a.Alumni_ID = ms.Alumni_ID
+    INNER JOIN Student s ON ms.Student_ID = s.Student_ID
+    GROUP BY a.Alumni_ID, a.Name, a.Company, a.Current_Designation,
+             s.Student_ID, s.Name, s.Department, s.Year_of_Study
+    ORDER BY Total_Sessions DESC, Last_Session DESC
+"""
+
+# Table extracts are read in primary key order so MySQL streams them without a filesort
+EXPORT_QUERIES = {
+    'alumni': """
+        SELECT Alumni_ID, Name, Phone_Number, Email, Graduation_Year,
+               Current_Designation, Company, Location, Years_of_Experience
+        FROM Alumni
+        ORDER BY Alumni_ID
+    """,
+    'students': """
+        SELECT Student_ID, Name, Phone_Number, Email, Department, Year_of_Study
+        FROM Student
+        ORDER BY Student_ID
+    """,
+    'sessions': """
+        SELECT Session_ID, Alumni_ID, Student_ID, Session_Date, Duration_Minutes, Topic
+        FROM MentorshipSession
+        ORDER BY Session_ID
+    """,
+    'feedback': """
+        SELECT Feedback_ID, Alumni_ID, Student_ID, Rating, Date, Comments
+        FROM Feedback
+        ORDER BY Feedback_ID
+    """,
+    'connections': CONNECTIONS_QUERY,
+}
+
+
+def _json_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def _csv_chunk(rows, columns, header=False):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    writer.writerows([row[column] for column in columns] for row in rows)
+    return buffer.getvalue()
+
+
+def _ndjson_chunk(rows):
+    return ''.join(json.dumps(row, default=_json_value) + '\n' for row in rows)
+
+
+def stream_export(connection, query, fmt, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Yield the query's rows as CSV or NDJSON text, one chunk at a time.
+
+    The cursor is unbuffered, so only one chunk of rows is held in memory. The
+    connection is returned to the pool, with its write timeout reset, when the
+    export completes, and discarded if the client disconnects with rows still
+    unread. A database error is re-raised so the server drops the transfer
+    instead of ending a truncated file as if it were complete.
+    """
+    finished = False
+    try:
+        # A slow client can stall the server's writes; allow for that on this session
+        setup = connection.cursor()
+        setup.execute("SET SESSION net_write_timeout = 600")
+        setup.close()
+
+        cursor = connection.cursor(dictionary=True, buffered=False)
+        cursor.execute(query)
+        columns = list(cursor.column_names)
+
+        if fmt == 'csv':
+            yield _csv_chunk([], columns, header=True)
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            yield _csv_chunk(rows, columns) if fmt == 'csv' else _ndjson_chunk(rows)
+
+        cursor.close()
+        reset = connection.cursor()
+        reset.execute("SET SESSION net_write_timeout = DEFAULT")
+        reset.close()
+        finished = True
+    except Error as e:
+        logger.error(f"Error streaming export: {e}")
+        raise
+    finally:
+        if finished:
+            connection.close()
+        else:
+            connection.discard()
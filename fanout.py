@@ -0,0 +1,128 @@
+"""
+Alumni Mentor Portal - Parallel Query Fan-out
+Runs independent read statements at the same time, each on its own pooled
+connection, so a page waits for its slowest query rather than the sum
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+
+import mysql.connector
+from mysql.connector import Error
+
+
+class FanoutTimeoutError(Error):
+    """Raised when a fan-out does not finish in time; its running statements are killed"""
+
+
+class _FanoutState:
+    """Connections running a statement for one fan-out, and whether it was abandoned"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cancelled = False
+        self.running = {}  # index -> MySQL connection id
+        self.killed = set()
+
+
+class QueryFanout:
+    """Thread pool shared by all requests for concurrent reads.
+
+    Workers check connections out of the pool passed to run(), never the
+    request's own connection. When the deadline passes, statements not yet
+    started are cancelled and running ones are stopped with KILL QUERY from a
+    separate connection; killed connections are discarded, not pooled.
+    """
+
+    def __init__(self, max_workers=16):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fanout')
+
+    def run(self, pool, statements, timeout, on_acquire=None, on_statement=None):
+        """Execute (sql, params) reads concurrently and return their rows in order.
+
+        on_acquire(seconds, error) and on_statement(sql, params, seconds, rows, error,
+        connection) are called from the worker threads. Raises FanoutTimeoutError
+        after timeout seconds, or the first statement's Error.
+        """
+        state = _FanoutState()
+        futures = [self._executor.submit(self._execute, pool, state, index, sql, params, on_acquire, on_statement)
+                   for index, (sql, params) in enumerate(statements)]
+        done, not_done = wait(futures, timeout=timeout, return_when=FIRST_EXCEPTION)
+        failed = next((future for future in futures if future in done and future.exception()), None)
+        if not_done:
+            self._abandon(pool, state, not_done)
+        if failed is not None:
+            raise failed.exception()
+        if not_done:
+            raise FanoutTimeoutError(msg=f"{len(not_done)} of {len(futures)} parallel reads "
+                                         f"did not finish within {timeout}s")
+        return [future.result() for future in futures]
+
+    def _execute(self, pool, state, index, sql, params, on_acquire, on_statement):
+        if state.cancelled:
+            return None
+        started = time.perf_counter()
+        try:
+            connection = pool.acquire()
+        except Error:
+            if on_acquire:
+                on_acquire(time.perf_counter() - started, True)
+            raise
+        if on_acquire:
+            on_acquire(time.perf_counter() - started, False)
+
+        started = time.perf_counter()
+        try:
+            with state.lock:
+                if state.cancelled:
+                    return None
+                state.running[index] = connection.connection_id
+            cursor = connection.cursor(dictionary=True)
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+            cursor.close()
+            if on_statement:
+                on_statement(sql, params, time.perf_counter() - started, len(rows), False, connection)
+            return rows
+        except Error:
+            if on_statement:
+                on_statement(sql, params, time.perf_counter() - started, 0, True, None)
+            raise
+        finally:
+            # Waits for an in-progress KILL, so a killed connection is never handed back to the pool
+            with state.lock:
+                state.running.pop(index, None)
+                killed = index in state.killed
+            if killed:
+                connection.discard()
+            else:
+                connection.close()
+
+    def _abandon(self, pool, state, futures):
+        """Cancel queued statements and KILL QUERY the ones still running"""
+        for future in futures:
+            future.cancel()
+        with state.lock:
+            state.cancelled = True
+            if not state.running:
+                return
+            state.killed.update(state.running)
+            # A fresh connection, since the pool may be exhausted by the stalled statements
+            try:
+                killer = mysql.connector.connect(**pool.config)
+            except Error:
+                return
+            try:
+                cursor = killer.cursor()
+                for connection_id in state.running.values():
+                    try:
+                        cursor.execute(f"KILL QUERY {int(connection_id)}")
+                    except Error:
+                        pass
+                cursor.close()
+            finally:
+                killer.close()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,66 @@
+"""
+Alumni Mentor Portal - Gunicorn Settings
+PORTAL_WORKERS processes (default: one per CPU core) x PORTAL_THREADS threads,
+forked from one preloaded copy of the app and recycled after a few thousand
+requests. Database settings come from PORTAL_DB_* and PORTAL_SECRET_KEY (see
+DB_CONFIG in app.py).
+
+    pip install -r requirements.txt
+    PORTAL_SECRET_KEY=... gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import multiprocessing
+import os
+import tempfile
+
+bind = os.environ.get('PORTAL_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('PORTAL_WORKERS', multiprocessing.cpu_count()))
+# Requests mostly wait on MySQL, so each worker serves several at once
+worker_class = 'gthread'
+threads = int(os.environ.get('PORTAL_THREADS', 4))
+
+# Import app.py (templates, config, SQL constants) once in the master; workers start as forks of it
+preload_app = True
+
+# Recycle each worker after this many requests, staggered so they do not all restart together;
+# a stopping worker finishes its requests within graceful_timeout
+max_requests = int(os.environ.get('PORTAL_MAX_REQUESTS', 5000))
+max_requests_jitter = max_requests // 10
+graceful_timeout = 30
+timeout = 60
+keepalive = 5
+
+accesslog = os.environ.get('PORTAL_ACCESS_LOG')  # '-' for stdout
+
+
+def on_starting(server):
+    """Master, before any worker: check the audit writer's login, put audit rows of
+    workers that died mid-replay back in the spill file, and set up shared metrics"""
+    import app
+    from metrics import reset_shared
+    app.check_audit_writer()
+    app.AUDIT_LOG.recover()
+    # Workers write their metrics here, so a scrape of any one reports the whole server
+    shared = os.environ.get('PORTAL_METRICS_DIR') or tempfile.mkdtemp(prefix='portal-metrics-')
+    reset_shared(shared)
+    app.METRICS_CONFIG['shared_dir'] = shared
+
+
+def post_fork(server, worker):
+    """Worker: drop the master's pools and background threads before serving"""
+    import app
+    app.reinit_after_fork(server.cfg.threads)
+
+
+def worker_exit(server, worker):
+    """Worker: pause the archive job and write or spill queued audit rows before exiting"""
+    import app
+    app.shutdown_worker()
+
+
+def on_exit(server):
+    """Master, after the last worker: remove the metrics directory it created"""
+    import shutil
+    import app
+    if not os.environ.get('PORTAL_METRICS_DIR'):
+        shutil.rmtree(app.METRICS_CONFIG['shared_dir'], ignore_errors=True)
@@ -0,0 +1,92 @@
+"""
+Alumni Mentor Portal - Typeahead Lookup
+Keeps alumni and student names in memory as sorted prefix indexes, so the form
+pickers fetch the top matches for what was typed instead of every row
+"""
+
+import time
+from bisect import bisect_left
+
+from snapshots import Snapshot
+
+# kind -> (table, query); each row gives the id, the name and a detail shown beside it
+LOOKUP_SOURCES = {
+    'alumni': ('Alumni', "SELECT Alumni_ID AS Id, Name, Company AS Detail FROM Alumni"),
+    'students': ('Student', "SELECT Student_ID AS Id, Name, Department AS Detail FROM Student"),
+}
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+
+def normalize(text):
+    """Case-folded text with runs of whitespace collapsed"""
+    return ' '.join((text or '').casefold().split())
+
+
+class PrefixIndex(Snapshot):
+    """Sorted prefix index over one table's (id, name) rows.
+
+    Two sorted key lists point at row positions: whole names, and every later
+    word of a name plus the id. A prefix is a bisect to the first key at or
+    after it, then a walk while keys still start with it, so a lookup costs
+    O(log n + limit) whatever the table size. Whole-name matches come first.
+    The index reloads after writes to its table (see Snapshot).
+    """
+
+    def __init__(self, table, query, max_age=300):
+        super().__init__((table,), max_age)
+        self.table = table
+        self.query = query
+        # _data: (rows, name_keys, name_positions, word_keys, word_positions)
+
+    def _build(self, fetch):
+        results = fetch([self.query])
+        if results is None:
+            return None
+        rows = [(str(row['Id']), row['Name'] or '', row['Detail']) for row in results[0]]
+        names = []
+        words = []
+        for pos, (row_id, name, _) in enumerate(rows):
+            folded = normalize(name)
+            names.append((folded, row_id, pos))
+            for word in folded.split()[1:]:
+                words.append((word, folded, pos))
+            words.append((row_id.casefold(), folded, pos))
+        names.sort()
+        words.sort()
+        return (rows,
+                [key for key, _, _ in names], [pos for _, _, pos in names],
+                [key for key, _, _ in words], [pos for _, _, pos in words])
+
+    def search(self, text, limit=DEFAULT_LIMIT, skip=frozenset()):
+        """Up to limit rows whose name, a word of the name, or id starts with text, leaving out ids in skip"""
+        data = self._data
+        if data is None:
+            return []
+        rows, name_keys, name_positions, word_keys, word_positions = data
+        prefix = normalize(text)
+        found = []
+        seen = set()
+        for keys, positions in ((name_keys, name_positions), (word_keys, word_positions)):
+            index = bisect_left(keys, prefix)
+            while index < len(keys) and len(found) < limit and keys[index].startswith(prefix):
+                pos = positions[index]
+                if pos not in seen:
+                    seen.add(pos)
+                    if rows[pos][0] not in skip:
+                        found.append(pos)
+                index += 1
+            if len(found) >= limit or ' ' in prefix:
+                break
+        return [{'id': rows[pos][0], 'name': rows[pos][1], 'detail': rows[pos][2]} for pos in found]
+
+    def stats(self):
+        data = self._data
+        return {
+            'table': self.table,
+            'rows': len(data[0]) if data else 0,
+            'keys': len(data[1]) + len(data[3]) if data else 0,
+            'loads': self._loads,
+            'age_seconds': round(self.age, 1) if data else None,
+        }
@@ -0,0 +1,317 @@
+"""
+Alumni Mentor Portal - Mentor Matching Engine
+Keeps the alumni/student skill graph in memory as integer bitsets and scores
+every alumnus for a student in one pass (same result as fn_calculate_skill_match)
+"""
+
+import heapq
+import threading
+import time
+
+# Tables each part of the engine is built from; a version change reloads only that part
+MATCH_GROUPS = {
+    'graph': ('Skill', 'Alumni', 'Student', 'Alumni_Skills', 'Student_Skills', 'Industry'),
+    'stats': ('Feedback', 'MentorshipSession'),
+    'active': ('Provides',),
+}
+
+MATCH_QUERIES = {
+    'graph': (
+        "SELECT Alumni_ID, Name, Current_Designation FROM Alumni ORDER BY Alumni_ID",
+        "SELECT Alumni_ID, Industry_Name FROM Industry ORDER BY Industry_ID",
+        "SELECT Student_ID, Name, Department FROM Student ORDER BY Student_ID",
+        "SELECT Alumni_ID, Skill_ID FROM Alumni_Skills",
+        "SELECT Student_ID, Skill_ID FROM Student_Skills",
+    ),
+    'stats': (
+        "SELECT Alumni_ID, AVG(Rating) AS Avg_Rating FROM Feedback GROUP BY Alumni_ID",
+        "SELECT Alumni_ID, COUNT(*) AS Total_Sessions FROM MentorshipSession GROUP BY Alumni_ID",
+    ),
+    'active': (
+        "SELECT Alumni_ID, Student_ID FROM Provides WHERE Status = 'Active'",
+    ),
+}
+
+
+def _bits(mask):
+    """Positions of the set bits in mask, lowest first"""
+    # Scanning the binary string is far cheaper than peeling bits off a large int
+    digits = bin(mask)[:1:-1]
+    pos = digits.find('1')
+    while pos != -1:
+        yield pos
+        pos = digits.find('1', pos + 1)
+
+
+class MatchEngine:
+    """In-memory skill graph for one database user.
+
+    Each skill gets a bit; an alumnus or student is the int of their skill
+    bits, so the number of shared skills is (alumni & student).bit_count().
+    Each skill also keeps a bitset of the alumni (by position) who have it;
+    adding those bitsets for a student's skills scores every alumnus at once.
+    """
+
+    def __init__(self, max_age=300):
+        self.max_age = max_age  # reload everything at least this often (writes made outside the app)
+
+        self._lock = threading.RLock()
+        self._versions = {}
+        self._loaded_at = {}
+
+        self._skill_bits = {}       # Skill_ID -> bit
+        self._alumni_ids = []       # position -> Alumni_ID
+        self._alumni_pos = {}       # Alumni_ID -> position
+        self._alumni_info = []      # position -> (Name, Current_Designation, Industry_Name) or None if deleted
+        self._alumni_masks = []     # position -> skill bitset
+        self._skill_alumni = []     # bit -> bitset of alumni positions
+        self._alive = 0             # bitset of alumni positions that still exist
+        self._students = {}         # Student_ID -> (Name, Department)
+        self._student_masks = {}    # Student_ID -> skill bitset
+        self._stats = {}            # Alumni_ID -> (Avg_Rating, Total_Sessions)
+        self._active = {}           # Student_ID -> set of Alumni_ID with an active relationship
+
+        self._full_loads = 0
+        self._partial_loads = 0
+
+    # ----- loading -----
+
+    def stale_groups(self, versions):
+        """Groups whose tables changed (or aged out) since they were loaded"""
+        now = time.monotonic()
+        return [group for group, tables in MATCH_GROUPS.items()
+                if self._versions.get(group) != versions(tables)
+                or now - self._loaded_at.get(group, float('-inf')) > self.max_age]
+
+    def refresh(self, fetch, versions):
+        """Reload the stale groups; fetch(queries) returns one row list per query or None"""
+        with self._lock:
+            groups = self.stale_groups(versions)
+            if not groups:
+                return True
+            snapshot = {group: versions(MATCH_GROUPS[group]) for group in groups}
+            queries = [query for group in groups for query in MATCH_QUERIES[group]]
+            results = fetch(queries)
+            if results is None:
+                return False
+
+            results = iter(results)
+            for group in groups:
+                getattr(self, f'_load_{group}')(*[next(results) for _ in MATCH_QUERIES[group]])
+                self._versions[group] = snapshot[group]
+                self._loaded_at[group] = time.monotonic()
+            if len(groups) == len(MATCH_GROUPS):
+                self._full_loads += 1
+            else:
+                self._partial_loads += 1
+            return True
+
+    def invalidate(self):
+        """Force a full reload on the next refresh"""
+        with self._lock:
+            self._versions.clear()
+            self._loaded_at.clear()
+
+    def _skill_bit(self, skill_id):
+        bit = self._skill_bits.get(skill_id)
+        if bit is None:
+            bit = self._skill_bits[skill_id] = len(self._skill_bits)
+            self._skill_alumni.append(0)
+        return bit
+
+    def _load_graph(self, alumni, industries, students, alumni_skills, student_skills):
+        self._skill_bits = {}
+        self._skill_alumni = []
+
+        industry_names = {}
+        for row in industries:
+            if row['Industry_Name']:
+                industry_names.setdefault(row['Alumni_ID'], []).append(row['Industry_Name'])
+
+        self._alumni_ids = [row['Alumni_ID'] for row in alumni]
+        self._alumni_pos = {alumni_id: pos for pos, alumni_id in enumerate(self._alumni_ids)}
+        self._alumni_info = [
+            (row['Name'], row['Current_Designation'], ', '.join(industry_names.get(row['Alumni_ID'], ())) or None)
+            for row in alumni
+        ]
+        self._alumni_masks = [0] * len(self._alumni_ids)
+        self._alive = (1 << len(self._alumni_ids)) - 1
+        for row in alumni_skills:
+            pos = self._alumni_pos.get(row['Alumni_ID'])
+            if pos is not None:
+                bit = self._skill_bit(row['Skill_ID'])
+                self._alumni_masks[pos] |= 1 << bit
+                self._skill_alumni[bit] |= 1 << pos
+
+        self._students = {row['Student_ID']: (row['Name'], row['Department']) for row in students}
+        self._student_masks = dict.fromkeys(self._students, 0)
+        for row in student_skills:
+            if row['Student_ID'] in self._students:
+                self._student_masks[row['Student_ID']] |= 1 << self._skill_bit(row['Skill_ID'])
+
+    def _load_stats(self, ratings, sessions):
+        stats = {row['Alumni_ID']: (float(row['Avg_Rating']) if row['Avg_Rating'] is not None else None, 0)
+                 for row in ratings}
+        for row in sessions:
+            rating = stats.get(row['Alumni_ID'], (None, 0))[0]
+            stats[row['Alumni_ID']] = (rating, row['Total_Sessions'])
+        self._stats = stats
+
+    def _load_active(self, provides):
+        active = {}
+        for row in provides:
+            active.setdefault(row['Student_ID'], set()).add(row['Alumni_ID'])
+        self._active = active
+
+    def refresh_alumni(self, fetch, alumni_id):
+        """Reload one alumnus's details and skills without rebuilding the graph"""
+        results = fetch([
+            ("SELECT Alumni_ID, Name, Current_Designation FROM Alumni WHERE Alumni_ID = %s", (alumni_id,)),
+            ("SELECT Industry_Name FROM Industry WHERE Alumni_ID = %s ORDER BY Industry_ID", (alumni_id,)),
+            ("SELECT Skill_ID FROM Alumni_Skills WHERE Alumni_ID = %s", (alumni_id,)),
+        ])
+        if results is None:
+            return False
+        alumni, industries, skills = results
+        with self._lock:
+            pos = self._alumni_pos.get(alumni_id)
+            if pos is None:
+                if not alumni:
+                    return True
+                pos = self._alumni_pos[alumni_id] = len(self._alumni_ids)
+                self._alumni_ids.append(alumni_id)
+                self._alumni_info.append(None)
+                self._alumni_masks.append(0)
+
+            for bit in _bits(self._alumni_masks[pos]):
+                self._skill_alumni[bit] &= ~(1 << pos)
+            mask = 0
+            if alumni:
+                names = ', '.join(row['Industry_Name'] for row in industries if row['Industry_Name'])
+                self._alumni_info[pos] = (alumni[0]['Name'], alumni[0]['Current_Designation'], names or None)
+                self._alive |= 1 << pos
+                for row in skills:
+                    bit = self._skill_bit(row['Skill_ID'])
+                    mask |= 1 << bit
+                    self._skill_alumni[bit] |= 1 << pos
+            else:
+                self._alumni_info[pos] = None
+                self._alive &= ~(1 << pos)
+            self._alumni_masks[pos] = mask
+            self._partial_loads += 1
+        return True
+
+    def refresh_student(self, fetch, student_id):
+        """Reload one student's details, wanted skills and active mentors"""
+        results = fetch([
+            ("SELECT Student_ID, Name, Department FROM Student WHERE Student_ID = %s", (student_id,)),
+            ("SELECT Skill_ID FROM Student_Skills WHERE Student_ID = %s", (student_id,)),
+            ("SELECT Alumni_ID FROM Provides WHERE Student_ID = %s AND Status = 'Active'", (student_id,)),
+        ])
+        if results is None:
+            return False
+        students, skills, provides = results
+        with self._lock:
+            if not students:
+                self._students.pop(student_id, None)
+                self._student_masks.pop(student_id, None)
+                self._active.pop(student_id, None)
+            else:
+                self._students[student_id] = (students[0]['Name'], students[0]['Department'])
+                mask = 0
+                for row in skills:
+                    mask |= 1 << self._skill_bit(row['Skill_ID'])
+                self._student_masks[student_id] = mask
+                self._active[student_id] = {row['Alumni_ID'] for row in provides}
+            self._partial_loads += 1
+        return True
+
+    # ----- matching -----
+
+    def _rank(self, student_id, k, min_match):
+        wanted = self._student_masks.get(student_id, 0)
+        total = wanted.bit_count()
+        eligible = self._alive
+        for alumni_id in self._active.get(student_id, ()):
+            pos = self._alumni_pos.get(alumni_id)
+            if pos is not None:
+                eligible &= ~(1 << pos)
+
+        # Bit-sliced counters: planes[i] holds bit i of every alumnus's shared-skill
+        # count, built by adding each wanted skill's alumni bitset with a ripple carry
+        planes = []
+        for bit in _bits(wanted):
+            carry = self._skill_alumni[bit]
+            for i, plane in enumerate(planes):
+                planes[i], carry = plane ^ carry, plane & carry
+                if not carry:
+                    break
+            if carry:
+                planes.append(carry)
+
+        rows = []
+        for count in range(total, -1, -1):
+            percentage = round(count * 100.0 / total, 2) if total else 0.0
+            if percentage < min_match:
+                break
+            if count >> len(planes):
+                continue
+            # Alumni whose count equals this level
+            level = eligible
+            for i, plane in enumerate(planes):
+                level &= plane if count >> i & 1 else ~plane
+            if not level:
+                continue
+            # sp_find_mentor_matches order: Match_Percentage DESC, Avg_Rating DESC (NULLs last)
+            keyed = ((self._rating(pos), -pos, pos) for pos in _bits(level))
+            ranked = heapq.nlargest(k - len(rows), keyed) if k else sorted(keyed, reverse=True)
+            rows.extend(self._match_row(pos, percentage) for _, _, pos in ranked)
+            if k and len(rows) >= k:
+                break
+        return rows[:k] if k else rows
+
+    def _rating(self, pos):
+        rating = self._stats.get(self._alumni_ids[pos], (None, 0))[0]
+        return rating if rating is not None else -1.0
+
+    def _match_row(self, pos, percentage):
+        alumni_id = self._alumni_ids[pos]
+        name, designation, industry = self._alumni_info[pos]
+        rating, sessions = self._stats.get(alumni_id, (None, 0))
+        return {
+            'Alumni_ID': alumni_id,
+            'Name': name,
+            'Current_Designation': designation,
+            'Industry_Name': industry,
+            'Match_Percentage': percentage,
+            'Avg_Rating': round(rating, 2) if rating is not None else None,
+            'Total_Sessions': sessions,
+        }
+
+    def has_student(self, student_id):
+        with self._lock:
+            return student_id in self._students
+
+    def top_matches(self, student_id, k=10, min_match=0):
+        """Best k mentors for a student (k=0 returns every match), like sp_find_mentor_matches"""
+        with self._lock:
+            return self._rank(student_id, k, min_match)
+
+    def match_department(self, department, k=5, min_match=0):
+        """Top k mentors for every student in a department, keyed by Student_ID"""
+        with self._lock:
+            return {
+                student_id: self._rank(student_id, k, min_match)
+                for student_id, (_, student_department) in sorted(self._students.items())
+                if student_department == department
+            }
+
+    def stats(self):
+        with self._lock:
+            return {
+                'alumni': sum(1 for info in self._alumni_info if info is not None),
+                'students': len(self._students),
+                'skills': len(self._skill_bits),
+                'full_loads': self._full_loads,
+                'partial_loads': self._partial_loads,
+            }
@@ -0,0 +1,296 @@
+"""
+Alumni Mentor Portal - Request and Query Metrics
+Thread-safe counters and histograms labelled by Flask endpoint, rendered in
+the Prometheus text exposition format for /metrics. Worker processes share
+theirs through snapshot files in one directory, so a scrape of any worker
+reports the whole server
+"""
+
+import fcntl
+import glob
+import json
+import os
+import threading
+
+# Seconds; covers a cached page (sub-millisecond) up to a slow report
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ROW_BUCKETS = (0, 1, 10, 50, 100, 500, 1000, 5000, 10000, 50000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+_INF = 'le="+Inf"'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value):
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+class Counter:
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._values = {}
+
+    def inc(self, label_values, amount=1):
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def dump(self):
+        return [[list(label_values), value] for label_values, value in self._values.items()]
+
+    def render(self, others=(), own=True):
+        """Text lines, adding in the dumps of other processes (own False: only theirs)"""
+        values = dict(self._values) if own else {}
+        for dumped in others:
+            for label_values, value in dumped.get(self.name, ()):
+                values[tuple(label_values)] = values.get(tuple(label_values), 0) + value
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        for label_values, value in sorted(values.items()):
+            lines.append(f'{self.name}{_labels(self.labels, label_values)} {_number(value)}')
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = buckets
+        self._series = {}  # label values -> [bucket counts..., sum, count]
+
+    def observe(self, label_values, value):
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [0] * len(self.buckets) + [0, 0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[i] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def dump(self):
+        return [[list(label_values), series] for label_values, series in self._series.items()]
+
+    def render(self, others=(), own=True):
+        """Text lines, adding in the dumps of other processes (own False: only theirs)"""
+        merged = {label_values: list(series) for label_values, series in self._series.items()} if own else {}
+        for dumped in others:
+            for label_values, series in dumped.get(self.name, ()):
+                total = merged.setdefault(tuple(label_values), [0] * len(series))
+                if len(total) == len(series):
+                    merged[tuple(label_values)] = [a + b for a, b in zip(total, series)]
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        for label_values, series in sorted(merged.items()):
+            for bound, count in zip(self.buckets, series):
+                le = f'le="{_number(float(bound))}"'
+                lines.append(f'{self.name}_bucket{_labels(self.labels, label_values, le)} {count}')
+            lines.append(f'{self.name}_bucket{_labels(self.labels, label_values, _INF)} {series[-1]}')
+            lines.append(f'{self.name}_sum{_labels(self.labels, label_values)} {_number(float(series[-2]))}')
+            lines.append(f'{self.name}_count{_labels(self.labels, label_values)} {series[-1]}')
+        return lines
+
+
+class Metrics:
+    """Statement, connection and request metrics for the whole process"""
+
+    def __init__(self, prefix='portal'):
+        self._lock = threading.Lock()
+        self.statement_seconds = Histogram(
+            f'{prefix}_db_statement_duration_seconds', 'Time spent executing a statement or procedure call.',
+            ('endpoint', 'operation'))
+        self.statement_rows = Histogram(
+            f'{prefix}_db_statement_rows', 'Rows returned (reads) or affected (writes) per statement.',
+            ('endpoint', 'operation'), ROW_BUCKETS)
+        self.statement_errors = Counter(
+            f'{prefix}_db_statement_errors_total', 'Statements that raised a database error.',
+            ('endpoint', 'operation'))
+        self.cache_hits = Counter(
+            f'{prefix}_db_cache_hits_total', 'Statements answered from the query cache.',
+            ('endpoint',))
+        self.acquire_seconds = Histogram(
+            f'{prefix}_db_acquire_duration_seconds', 'Time spent checking a connection out of the pool.',
+            ('endpoint',))
+        self.acquire_errors = Counter(
+            f'{prefix}_db_acquire_errors_total', 'Failed connection checkouts (timeouts and connect errors).',
+            ('endpoint',))
+        self.requests = Counter(
+            f'{prefix}_http_requests_total', 'Requests handled.', ('endpoint', 'method', 'status'))
+        self.request_seconds = Histogram(
+            f'{prefix}_http_request_duration_seconds', 'Time to build the response.', ('endpoint', 'method'))
+        self.request_db_seconds = Histogram(
+            f'{prefix}_http_request_db_seconds', 'Database time (statements plus checkout) per request.',
+            ('endpoint',))
+        self.request_render_seconds = Histogram(
+            f'{prefix}_http_request_render_seconds', 'Template rendering time per request.', ('endpoint',))
+        self.request_queries = Histogram(
+            f'{prefix}_http_request_queries', 'Statements sent to the database per request.',
+            ('endpoint',), QUERY_COUNT_BUCKETS)
+        self._families = (
+            self.statement_seconds, self.statement_rows, self.statement_errors, self.cache_hits,
+            self.acquire_seconds, self.acquire_errors, self.requests, self.request_seconds,
+            self.request_db_seconds, self.request_render_seconds, self.request_queries,
+        )
+
+    def observe_statement(self, endpoint, operation, seconds, rows=0, error=False):
+        with self._lock:
+            self.statement_seconds.observe((endpoint, operation), seconds)
+            if error:
+                self.statement_errors.inc((endpoint, operation))
+            else:
+                self.statement_rows.observe((endpoint, operation), rows)
+
+    def observe_cache_hit(self, endpoint, count=1):
+        with self._lock:
+            self.cache_hits.inc((endpoint,), count)
+
+    def observe_acquire(self, endpoint, seconds, error=False):
+        with self._lock:
+            self.acquire_seconds.observe((endpoint,), seconds)
+            if error:
+                self.acquire_errors.inc((endpoint,))
+
+    def observe_request(self, endpoint, method, status, seconds, totals):
+        """Record one finished request; totals holds its queries, db and render seconds"""
+        with self._lock:
+            self.requests.inc((endpoint, method, str(status)))
+            self.request_seconds.observe((endpoint, method), seconds)
+            self.request_db_seconds.observe((endpoint,), totals['db'] + totals['acquire'])
+            self.request_render_seconds.observe((endpoint,), totals['render'])
+            self.request_queries.observe((endpoint,), totals['queries'])
+
+    def snapshot(self):
+        """Counter and histogram values, as JSON-ready dumps by family name"""
+        with self._lock:
+            return {family.name: family.dump() for family in self._families}
+
+    def render(self, gauges=(), others=(), own=True):
+        """Prometheus text format; gauges is a list of (name, help, labels, [(label values, value)]).
+
+        others are snapshots of other processes (read_shared); their counters
+        and histograms are added in, and so are their gauges if they carry them.
+        With own False only others are rendered (this process's snapshot is among them).
+        """
+        with self._lock:
+            lines = []
+            for family in self._families:
+                lines.extend(family.render(others, own))
+        for name, help_text, labels, samples in gauges:
+            values = {tuple(label_values): value for label_values, value in samples} if own else {}
+            for other in others:
+                for label_values, value in other.get('gauges', {}).get(name, ()):
+                    values[tuple(label_values)] = values.get(tuple(label_values), 0) + value
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} gauge')
+            for label_values, value in sorted(values.items()):
+                lines.append(f'{name}{_labels(labels, label_values)} {_number(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+RETIRED_FILE = 'retired.json'
+LOCK_FILE = 'retired.lock'
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def write_shared(directory, metrics, gauges):
+    """Replace this process's snapshot file, with its current gauge samples"""
+    data = metrics.snapshot()
+    data['gauges'] = {name: [[list(label_values), value] for label_values, value in samples]
+                      for name, _, _, samples in gauges}
+    path = os.path.join(directory, f'worker.{os.getpid()}.json')
+    with open(path + '.tmp', 'w') as f:
+        json.dump(data, f)
+    os.replace(path + '.tmp', path)
+
+
+def read_shared(directory):
+    """Snapshots of the worker files and retired totals; gauges only from processes still running.
+
+    Read under a shared lock, so a retiring worker is never counted twice or not at all.
+    """
+    with open(os.path.join(directory, LOCK_FILE), 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_SH)
+        return _read_shared(directory)
+
+
+def _read_shared(directory):
+    snapshots = []
+    for path in glob.glob(os.path.join(directory, '*.json')):
+        name = os.path.basename(path)
+        pid = int(name.split('.')[1]) if name.startswith('worker.') else None
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if pid is None or not _alive(pid):
+            data.pop('gauges', None)
+        snapshots.append(data)
+    return snapshots
+
+
+def retire_shared(directory, metrics):
+    """Fold an exiting process's counters into the retired totals, so they never go backwards"""
+    retired = os.path.join(directory, RETIRED_FILE)
+    with open(os.path.join(directory, LOCK_FILE), 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            with open(retired) as f:
+                totals = json.load(f)
+        except (OSError, ValueError):
+            totals = {}
+        for name, dumped in metrics.snapshot().items():
+            merged = {tuple(labels): value for labels, value in totals.get(name, ())}
+            for labels, value in dumped:
+                key = tuple(labels)
+                if key not in merged:
+                    merged[key] = value
+                elif isinstance(value, list):
+                    merged[key] = [a + b for a, b in zip(merged[key], value)]
+                else:
+                    merged[key] += value
+            totals[name] = [[list(labels), value] for labels, value in merged.items()]
+        with open(retired + '.tmp', 'w') as f:
+            json.dump(totals, f)
+        os.replace(retired + '.tmp', retired)
+        try:
+            os.remove(os.path.join(directory, f'worker.{os.getpid()}.json'))
+        except FileNotFoundError:
+            pass
+
+
+def reset_shared(directory):
+    """Clear a directory of a previous server run's snapshots"""
+    os.makedirs(directory, exist_ok=True)
+    for path in glob.glob(os.path.join(directory, '*.json')):
+        os.remove(path)
+
+
+def server_timing(totals, total_seconds):
+    """Server-Timing header value for one request's breakdown"""
+    return ', '.join((
+        f'db;dur={totals["db"] * 1000:.2f};desc="{totals["queries"]} queries"',
+        f'acquire;dur={totals["acquire"] * 1000:.2f}',
+        f'render;dur={totals["render"] * 1000:.2f}',
+        f'total;dur={total_seconds * 1000:.2f}',
+    ))
@@ -0,0 +1,282 @@
+"""
+Alumni Mentor Portal - Schema Migrations
+Applies the sql/ install scripts in order (handling DELIMITER blocks like the
+mysql client), records each applied version in Schema_Migrations, and checks
+with EXPLAIN that the hot queries are served by an index
+"""
+
+import hashlib
+import os
+import re
+import time
+
+from mysql.connector import Error
+
+SQL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sql')
+
+# Install order; append new scripts with the next version and never renumber
+MIGRATIONS = (
+    (1, 'database_schema.sql'),
+    (2, 'database_triggers.sql'),
+    (3, 'database_functions.sql'),
+    (4, 'database_procedures.sql'),
+    (5, 'database_procedures_functions.sql'),
+    (6, 'additional_triggers.sql'),
+    (7, 'simple_procedures.sql'),
+    (8, 'database_indexes.sql'),
+    (9, 'dashboard_counters.sql'),
+    (10, 'mentor_stats.sql'),
+    (11, 'table_versions.sql'),
+    (12, 'search_indexes.sql'),
+    (13, 'session_archive.sql'),
+    (14, 'async_audit.sql'),
+    (15, 'declarative_constraints.sql'),
+)
+
+MIGRATIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS Schema_Migrations (
+        Version INT PRIMARY KEY,
+        Script VARCHAR(100) NOT NULL,
+        Checksum CHAR(64) NOT NULL,
+        Statements INT NOT NULL,
+        Duration_Ms INT NOT NULL,
+        Applied_At TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+_DELIMITER_RE = re.compile(r'^\s*DELIMITER\s+(\S+)\s*$', re.IGNORECASE)
+
+# ER_BAD_DB_ERROR, ER_NO_SUCH_TABLE
+_MISSING_ERRNOS = (1049, 1146)
+
+
+class MigrationError(Exception):
+    """A migration could not be applied; later versions were not attempted"""
+
+
+def script_path(script):
+    return os.path.join(SQL_DIR, script)
+
+
+def checksum(script):
+    with open(script_path(script), 'rb') as handle:
+        return hashlib.sha256(handle.read()).hexdigest()
+
+
+def split_statements(text):
+    """Yield (line_number, statement) for a script, honouring DELIMITER lines.
+
+    Comments are dropped; quoted strings and identifiers are kept intact, so a
+    delimiter or comment marker inside them does not end the statement.
+    """
+    delimiter = ';'
+    buffer = []
+    start = None
+    quote = None
+    in_comment = False
+
+    for number, line in enumerate(text.splitlines(), 1):
+        if not quote and not in_comment and not ''.join(buffer).strip():
+            match = _DELIMITER_RE.match(line)
+            if match:
+                delimiter = match.group(1)
+                buffer, start = [], None
+                continue
+
+        i = 0
+        while i < len(line):
+            ch = line[i]
+            if in_comment:
+                end = line.find('*/', i)
+                if end == -1:
+                    break
+                in_comment = False
+                i = end + 2
+            elif quote:
+                if ch == '\\' and quote != '`':
+                    buffer.append(line[i:i + 2])
+                    i += 2
+                    continue
+                if ch == quote:
+                    quote = None
+                buffer.append(ch)
+                i += 1
+            elif line.startswith(delimiter, i):
+                statement = ''.join(buffer).strip()
+                if statement:
+                    yield start, statement
+                buffer, start = [], None
+                i += len(delimiter)
+            elif ch == '#' or (line.startswith('--', i) and line[i + 2:i + 3] in ('', ' ', '\t')):
+                break
+            elif line.startswith('/*', i):
+                in_comment = True
+                i += 2
+            else:
+                if ch in ('\'', '"', '`'):
+                    quote = ch
+                if start is None and not ch.isspace():
+                    start = number
+                buffer.append(ch)
+                i += 1
+        buffer.append('\n')
+
+    statement = ''.join(buffer).strip()
+    if statement:
+        yield start, statement
+
+
+def applied_versions(cursor, database):
+    """{Version: Checksum} already applied, or None if nothing has been recorded"""
+    try:
+        cursor.execute(f"SELECT Version, Checksum FROM `{database}`.Schema_Migrations")
+        return {version: digest for version, digest in cursor.fetchall()}
+    except Error as e:
+        if e.errno in _MISSING_ERRNOS:
+            return None
+        raise
+
+
+def _has_tables(cursor, database):
+    cursor.execute("SELECT COUNT(*) FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s", (database,))
+    return cursor.fetchone()[0] > 0
+
+
+def _record(cursor, database, version, script, digest, statements, duration_ms):
+    cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{database}`")
+    cursor.execute(f"USE `{database}`")
+    cursor.execute(MIGRATIONS_TABLE)
+    cursor.execute("""
+        REPLACE INTO Schema_Migrations (Version, Script, Checksum, Statements, Duration_Ms)
+        VALUES (%s, %s, %s, %s, %s)
+    """, (version, script, digest, statements, duration_ms))
+
+
+def migration_status(connection, database):
+    """Every known migration with its state: applied, changed (file edited since) or pending"""
+    cursor = connection.cursor()
+    try:
+        applied = applied_versions(cursor, database) or {}
+    finally:
+        cursor.close()
+    rows = []
+    for version, script in MIGRATIONS:
+        if version not in applied:
+            state = 'pending'
+        elif applied[version] != checksum(script):
+            state = 'changed'
+        else:
+            state = 'applied'
+        rows.append({'version': version, 'script': script, 'state': state})
+    return rows
+
+
+def baseline(connection, database, version):
+    """Record versions up to version as applied without running them (existing installs)"""
+    cursor = connection.cursor()
+    try:
+        for number, script in MIGRATIONS:
+            if number <= version:
+                _record(cursor, database, number, script, checksum(script), 0, 0)
+    finally:
+        cursor.close()
+
+
+def run_script(cursor, script):
+    """Execute one script statement by statement; returns the statement count"""
+    with open(script_path(script), encoding='utf-8') as handle:
+        text = handle.read()
+    count = 0
+    for line, statement in split_statements(text):
+        try:
+            # multi=True drains every result set (SHOW, SELECT, CALL) before the next statement
+            for result in cursor.execute(statement, multi=True):
+                if result.with_rows:
+                    result.fetchall()
+        except Error as e:
+            raise MigrationError(f"{script} line {line}: {e.msg}") from e
+        count += 1
+    return count
+
+
+def apply_migrations(connection, database, target=None):
+    """Apply pending migrations in order (up to target); returns what was applied"""
+    cursor = connection.cursor()
+    try:
+        applied = applied_versions(cursor, database)
+        if applied is None and _has_tables(cursor, database):
+            # Version 1 drops and recreates the database
+            raise MigrationError(f"{database} has tables but no Schema_Migrations; "
+                                 "record the scripts already installed with --baseline VERSION")
+        applied = applied or {}
+
+        results = []
+        for version, script in MIGRATIONS:
+            if version in applied or (target is not None and version > target):
+                continue
+            digest = checksum(script)
+            if version > 1:
+                cursor.execute(f"USE `{database}`")
+            started = time.perf_counter()
+            statements = run_script(cursor, script)
+            duration_ms = int((time.perf_counter() - started) * 1000)
+            _record(cursor, database, version, script, digest, statements, duration_ms)
+            connection.commit()
+            results.append({'version': version, 'script': script, 'statements': statements,
+                            'duration_ms': duration_ms})
+        return results
+    finally:
+        cursor.close()
+
+
+def plan_problems(plan):
+    """Full scans, filesorts and temporary tables in EXPLAIN output"""
+    problems = []
+    for row in plan:
+        extra = row.get('Extra') or ''
+        if row.get('type') == 'ALL':
+            problems.append(f"full scan of {row['table']}")
+        if 'Using filesort' in extra:
+            problems.append(f"filesort on {row['table']}")
+        if 'Using temporary' in extra:
+            problems.append(f"temporary table for {row['table']}")
+    return problems
+
+
+def check_indexes(connection, checks, min_rows=1000):
+    """EXPLAIN each (name, sql, params, tables) check and report the index it uses.
+
+    On tables smaller than min_rows MySQL rightly prefers a scan and sort, so
+    a plan with problems there is reported as skipped rather than failed.
+    """
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute("SET SESSION information_schema_stats_expiry = 0")
+        cursor.execute("""
+            SELECT TABLE_NAME AS Table_Name, TABLE_ROWS AS Row_Estimate
+            FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE()
+        """)
+        sizes = {row['Table_Name'].lower(): row['Row_Estimate'] or 0 for row in cursor.fetchall()}
+
+        results = []
+        for name, sql, params, tables in checks:
+            cursor.execute('EXPLAIN ' + sql, params)
+            plan = cursor.fetchall()
+            problems = plan_problems(plan)
+            rows = max((sizes.get(table.lower(), 0) for table in tables), default=0)
+            if not problems:
+                status = 'ok'
+            elif rows < min_rows:
+                status = 'skipped'
+            else:
+                status = 'fail'
+            results.append({
+                'name': name,
+                'status': status,
+                'keys': [row['key'] for row in plan if row.get('key')],
+                'problems': problems,
+                'rows': rows,
+            })
+        return results
+    finally:
+        cursor.close()
@@ -0,0 +1,164 @@
+"""
+Alumni Mentor Portal - Keyset Pagination
+Builds cursor-based page queries, sorting and column filters for the list pages
+"""
+
+import base64
+import json
+from datetime import date, datetime
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class ListSpec:
+    """Describes one list page: its base query, sortable columns and filters.
+
+    sorts maps a sort name to (column, row_key, default_order, nullable).
+    filters maps a query-string argument to (sql_condition, converter).
+    """
+
+    def __init__(self, select, id_column, id_key, sorts, default_sort, filters=None):
+        self.select = select
+        self.id_column = id_column
+        self.id_key = id_key
+        self.sorts = sorts
+        self.default_sort = default_sort
+        self.filters = filters or {}
+
+
+def prefix(value):
+    """LIKE pattern matching values that start with value (index friendly)"""
+    escaped = value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return escaped + '%'
+
+
+def parse_date(value):
+    return date.fromisoformat(value)
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(sort_value, row_id):
+    """Opaque, URL-safe cursor for the last row of a page"""
+    raw = json.dumps([sort_value, row_id], default=_json_default)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Return (sort_value, row_id) or None for a missing or malformed cursor"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        sort_value, row_id = json.loads(raw)
+        return sort_value, row_id
+    except (ValueError, TypeError):
+        return None
+
+
+def page_size(args):
+    """Requested page size clamped to 1..MAX_PAGE_SIZE"""
+    try:
+        size = int(args.get('per_page', DEFAULT_PAGE_SIZE))
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def _keyset_condition(column, id_column, descending, nullable, sort_value, last_id):
+    """WHERE fragment selecting rows after (sort_value, last_id) in the page order"""
+    op = '<' if descending else '>'
+    # MySQL sorts NULLs first ascending and last descending
+    if sort_value is None:
+        if descending:
+            return f"({column} IS NULL AND {id_column} {op} %s)", [last_id]
+        return f"({column} IS NOT NULL OR {id_column} {op} %s)", [last_id]
+
+    condition = f"{column} {op} %s OR ({column} = %s AND {id_column} {op} %s)"
+    if nullable and descending:
+        condition += f" OR {column} IS NULL"
+    return f"({condition})", [sort_value, sort_value, last_id]
+
+
+def build_page_query(spec, args):
+    """Build (sql, params, state) for the page described by the request args"""
+    sort = args.get('sort') if args.get('sort') in spec.sorts else spec.default_sort
+    column, row_key, default_order, nullable = spec.sorts[sort]
+    order = args.get('order', default_order)
+    if order not in ('asc', 'desc'):
+        order = default_order
+    descending = order == 'desc'
+    per_page = page_size(args)
+
+    conditions = []
+    params = []
+    active_filters = {}
+    for name, (condition, convert) in spec.filters.items():
+        raw = (args.get(name) or '').strip()
+        if not raw:
+            continue
+        try:
+            value = convert(raw)
+        except ValueError:
+            continue
+        conditions.append(condition)
+        params.append(value)
+        active_filters[name] = raw
+
+    cursor = decode_cursor(args.get('cursor'))
+    if cursor is not None:
+        fragment, fragment_params = _keyset_condition(
+            column, spec.id_column, descending, nullable, *cursor
+        )
+        conditions.append(fragment)
+        params.extend(fragment_params)
+
+    sql = spec.select
+    if conditions:
+        sql += "\nWHERE " + " AND ".join(conditions)
+    direction = 'DESC' if descending else 'ASC'
+    sql += f"\nORDER BY {column} {direction}, {spec.id_column} {direction}"
+    # One extra row tells us whether there is a next page
+    sql += f"\nLIMIT {per_page + 1}"
+
+    state = {
+        'sort': sort,
+        'order': order,
+        'per_page': per_page,
+        'row_key': row_key,
+        'filters': active_filters,
+        'is_first': cursor is None,
+    }
+    return sql, tuple(params), state
+
+
+def finish_page(rows, state, spec):
+    """Trim the look-ahead row and describe the page for the templates"""
+    rows = list(rows or [])
+    has_next = len(rows) > state['per_page']
+    rows = rows[:state['per_page']]
+
+    next_cursor = None
+    if has_next and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(last[state['row_key']], last[spec.id_key])
+
+    args = dict(state['filters'])
+    args.update(sort=state['sort'], order=state['order'], per_page=state['per_page'])
+    page = {
+        'sort': state['sort'],
+        'order': state['order'],
+        'per_page': state['per_page'],
+        'filters': state['filters'],
+        'has_next': has_next,
+        'next_cursor': next_cursor,
+        'is_first': state['is_first'],
+        'args': args,
+        'sorts': list(spec.sorts),
+    }
+    return rows, page
@@ -0,0 +1,317 @@
+"""
+Alumni Mentor Portal - Monthly Partitioning and Retention
+Converts the date-ordered history tables to monthly RANGE partitions and keeps
+them maintained: future months are split off ahead of time, and expired months
+are dropped or exchanged into standalone archive tables as metadata operations
+"""
+
+import re
+from datetime import date
+
+# table -> (partition column, column kind); DATE columns use RANGE COLUMNS,
+# TIMESTAMP columns RANGE over UNIX_TIMESTAMP (the only function allowed for them)
+PARTITION_SPECS = {
+    'MentorshipSession': ('Session_Date', 'date'),
+    'Feedback': ('Date', 'date'),
+    'Activity_Log': ('Logged_At', 'timestamp'),
+    'Feedback_Log': ('Logged_At', 'timestamp'),
+}
+
+MAX_PARTITION = 'pmax'
+_MONTH_PARTITION_RE = re.compile(r'^p(\d{4})(\d{2})$')
+
+
+class PartitionError(Exception):
+    """A table cannot be partitioned (or maintained) as requested"""
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def shift_month(month, count):
+    """The month start count months from a month start (bulk_import.add_months shifts any date)"""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f'p{month:%Y%m}'
+
+
+def partition_month(name):
+    """The month a pYYYYMM partition holds, or None for pmax and other names"""
+    match = _MONTH_PARTITION_RE.match(name or '')
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+def _bound(kind, month):
+    if kind == 'date':
+        return f"'{month.isoformat()}'"
+    return f"UNIX_TIMESTAMP('{month.isoformat()} 00:00:00')"
+
+
+def _partition_defs(kind, months):
+    """One partition per month (values before the next month) plus the MAXVALUE catch-all"""
+    defs = [f"PARTITION {partition_name(month)} VALUES LESS THAN ({_bound(kind, shift_month(month, 1))})"
+            for month in months]
+    defs.append(f"PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    return ',\n    '.join(defs)
+
+
+def _rows(connection, sql, params=()):
+    cursor = connection.cursor(dictionary=True)
+    cursor.execute(sql, params)
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def existing_partitions(connection, table):
+    """[(name, estimated rows)] in order; empty for a table that is not partitioned"""
+    rows = _rows(connection, """
+        SELECT PARTITION_NAME AS Name, TABLE_ROWS AS Row_Estimate
+        FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL
+        ORDER BY PARTITION_ORDINAL_POSITION
+    """, (table,))
+    return [(row['Name'], row['Row_Estimate'] or 0) for row in rows]
+
+
+def _foreign_keys(connection, table):
+    """Foreign keys declared on table, with their delete rule"""
+    return _rows(connection, """
+        SELECT k.CONSTRAINT_NAME AS Name, k.COLUMN_NAME AS Column_Name,
+               k.REFERENCED_TABLE_NAME AS Parent, k.REFERENCED_COLUMN_NAME AS Parent_Column,
+               r.DELETE_RULE AS Delete_Rule
+        FROM information_schema.KEY_COLUMN_USAGE k
+        JOIN information_schema.REFERENTIAL_CONSTRAINTS r
+          ON r.CONSTRAINT_SCHEMA = k.CONSTRAINT_SCHEMA AND r.CONSTRAINT_NAME = k.CONSTRAINT_NAME
+        WHERE k.TABLE_SCHEMA = DATABASE() AND k.TABLE_NAME = %s AND k.REFERENCED_TABLE_NAME IS NOT NULL
+        ORDER BY k.CONSTRAINT_NAME
+    """, (table,))
+
+
+def _problems(connection, table, column):
+    """Reasons InnoDB would refuse to partition table on column"""
+    problems = []
+    for row in _rows(connection, """
+        SELECT DISTINCT TABLE_NAME AS Child FROM information_schema.KEY_COLUMN_USAGE
+        WHERE REFERENCED_TABLE_SCHEMA = DATABASE() AND REFERENCED_TABLE_NAME = %s
+    """, (table,)):
+        problems.append(f"{row['Child']} has a foreign key to it")
+
+    indexes = {}
+    for row in _rows(connection, """
+        SELECT INDEX_NAME AS Name, COLUMN_NAME AS Column_Name, NON_UNIQUE AS Non_Unique, INDEX_TYPE AS Type
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    """, (table,)):
+        indexes.setdefault(row['Name'], []).append(row)
+    for name, columns in indexes.items():
+        if columns[0]['Type'] == 'FULLTEXT':
+            problems.append(f"FULLTEXT index {name} (partitioned tables cannot have one; "
+                            f"/search needs it, so dropping it disables that scope)")
+        elif name != 'PRIMARY' and not columns[0]['Non_Unique'] \
+                and column not in [row['Column_Name'] for row in columns]:
+            problems.append(f"unique index {name} does not include {column}")
+
+    nulls = _rows(connection, f"SELECT COUNT(*) AS Nulls FROM {table} WHERE {column} IS NULL")[0]['Nulls']
+    if nulls:
+        problems.append(f"{nulls} rows have no {column}")
+    return problems
+
+
+def _not_null_definition(connection, table, column):
+    """MODIFY clause making column NOT NULL with its type, default and ON UPDATE kept"""
+    row = _rows(connection, """
+        SELECT COLUMN_TYPE AS Type, COLUMN_DEFAULT AS Default_Value, EXTRA AS Extra
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+    """, (table, column))[0]
+    clause = f"MODIFY {column} {row['Type']} NOT NULL"
+    extra = (row['Extra'] or '').lower()
+    if row['Default_Value'] is not None:
+        default = row['Default_Value']
+        clause += f" DEFAULT {default}" if 'default_generated' in extra else " DEFAULT '" + default.replace("'", "''") + "'"
+    if 'on update current_timestamp' in extra:
+        clause += ' ON UPDATE CURRENT_TIMESTAMP'
+    return clause
+
+
+def _trigger_statements(table, foreign_keys, primary_key, auto_increment):
+    """Triggers doing the work of the dropped foreign keys and of the narrowed primary key"""
+    statements = []
+    for event in ('INSERT', 'UPDATE'):
+        checks = []
+        for fk in foreign_keys:
+            column = fk['Column_Name']
+            changed = '' if event == 'INSERT' else f" AND NOT (NEW.{column} <=> OLD.{column})"
+            checks.append(
+                f"    IF NEW.{column} IS NOT NULL{changed} AND NOT EXISTS "
+                f"(SELECT 1 FROM {fk['Parent']} WHERE {fk['Parent_Column']} = NEW.{column}) THEN\n"
+                f"        SIGNAL SQLSTATE '23000' SET MYSQL_ERRNO = 1452,\n"
+                f"            MESSAGE_TEXT = 'Cannot add or update a child row: {table}.{column} "
+                f"has no matching {fk['Parent']} row';\n"
+                f"    END IF;"
+            )
+        if checks:
+            statements.append((
+                f"tr_{table}_parent_check_{event.lower()}",
+                f"CREATE TRIGGER tr_{table}_parent_check_{event.lower()}\n"
+                f"BEFORE {event} ON {table}\nFOR EACH ROW\nBEGIN\n" + '\n'.join(checks) + "\nEND"
+            ))
+
+    for fk in foreign_keys:
+        column, parent, parent_column = fk['Column_Name'], fk['Parent'], fk['Parent_Column']
+        name = f"tr_{table}_{column}_parent_delete"
+        if fk['Delete_Rule'] == 'CASCADE':
+            body = f"    DELETE FROM {table} WHERE {column} = OLD.{parent_column};"
+        elif fk['Delete_Rule'] == 'SET NULL':
+            body = f"    UPDATE {table} SET {column} = NULL WHERE {column} = OLD.{parent_column};"
+        else:
+            body = (f"    IF EXISTS (SELECT 1 FROM {table} WHERE {column} = OLD.{parent_column}) THEN\n"
+                    f"        SIGNAL SQLSTATE '23000' SET MYSQL_ERRNO = 1451,\n"
+                    f"            MESSAGE_TEXT = 'Cannot delete or update a parent row: "
+                    f"{table}.{column} still references it';\n"
+                    f"    END IF;")
+        statements.append((name, f"CREATE TRIGGER {name}\nBEFORE DELETE ON {parent}\nFOR EACH ROW\nBEGIN\n{body}\nEND"))
+
+    # The primary key now includes the date, so an ID could repeat in another month
+    if len(primary_key) == 1 and not auto_increment:
+        key = primary_key[0]
+        for event, changed in (('INSERT', ''), ('UPDATE', f"NEW.{key} <> OLD.{key} AND ")):
+            name = f"tr_{table}_unique_id_{event.lower()}"
+            statements.append((name, (
+                f"CREATE TRIGGER {name}\nBEFORE {event} ON {table}\nFOR EACH ROW\nBEGIN\n"
+                f"    DECLARE v_message VARCHAR(128);\n"
+                f"    IF {changed}EXISTS (SELECT 1 FROM {table} WHERE {key} = NEW.{key}) THEN\n"
+                f"        SET v_message = CONCAT('Duplicate entry ''', NEW.{key}, ''' for key ''{table}.PRIMARY''');\n"
+                f"        SIGNAL SQLSTATE '23000' SET MYSQL_ERRNO = 1062, MESSAGE_TEXT = v_message;\n"
+                f"    END IF;\nEND"
+            )))
+    return statements
+
+
+def partition_plan(connection, table, ahead_months=3, today=None):
+    """The statements converting table to monthly partitions, oldest row's month to ahead_months out.
+
+    Raises PartitionError if the table is already partitioned or InnoDB would refuse.
+    """
+    if table not in PARTITION_SPECS:
+        raise PartitionError(f'{table} has no partition spec')
+    column, kind = PARTITION_SPECS[table]
+    if existing_partitions(connection, table):
+        raise PartitionError(f'{table} is already partitioned')
+    problems = _problems(connection, table, column)
+    if problems:
+        raise PartitionError(f"Cannot partition {table}: {'; '.join(problems)}")
+
+    foreign_keys = _foreign_keys(connection, table)
+    key_rows = _rows(connection, """
+        SELECT s.COLUMN_NAME AS Column_Name, c.EXTRA AS Extra
+        FROM information_schema.STATISTICS s
+        JOIN information_schema.COLUMNS c
+          ON c.TABLE_SCHEMA = s.TABLE_SCHEMA AND c.TABLE_NAME = s.TABLE_NAME AND c.COLUMN_NAME = s.COLUMN_NAME
+        WHERE s.TABLE_SCHEMA = DATABASE() AND s.TABLE_NAME = %s AND s.INDEX_NAME = 'PRIMARY'
+        ORDER BY s.SEQ_IN_INDEX
+    """, (table,))
+    primary_key = [row['Column_Name'] for row in key_rows]
+    auto_increment = any('auto_increment' in (row['Extra'] or '') for row in key_rows)
+
+    oldest = _rows(connection, f"SELECT MIN({column}) AS Oldest FROM {table}")[0]['Oldest']
+    this_month = month_start(today or date.today())
+    first = month_start(oldest.date() if hasattr(oldest, 'date') else oldest) if oldest else this_month
+    months = []
+    month = min(first, this_month)
+    while month <= shift_month(this_month, ahead_months):
+        months.append(month)
+        month = shift_month(month, 1)
+
+    statements = []
+    if foreign_keys:
+        statements.append(f"ALTER TABLE {table} " + ', '.join(f"DROP FOREIGN KEY {fk['Name']}" for fk in foreign_keys))
+    key_change = [_not_null_definition(connection, table, column)]
+    if column not in primary_key:
+        key_change += ['DROP PRIMARY KEY', f"ADD PRIMARY KEY ({', '.join(primary_key + [column])})"]
+    statements.append(f"ALTER TABLE {table} " + ', '.join(key_change))
+    scheme = f"RANGE COLUMNS({column})" if kind == 'date' else f"RANGE (UNIX_TIMESTAMP({column}))"
+    statements.append(f"ALTER TABLE {table} PARTITION BY {scheme} (\n    {_partition_defs(kind, months)}\n)")
+    triggers = _trigger_statements(table, foreign_keys, primary_key, auto_increment)
+    for name, _ in triggers:
+        statements.append(f"DROP TRIGGER IF EXISTS {name}")
+    statements.extend(sql for _, sql in triggers)
+    return {
+        'table': table,
+        'partitions': [partition_name(month) for month in months] + [MAX_PARTITION],
+        'dropped_foreign_keys': [fk['Name'] for fk in foreign_keys],
+        'primary_key': primary_key if column in primary_key else primary_key + [column],
+        'triggers': [name for name, _ in triggers],
+        'statements': statements,
+    }
+
+
+def maintenance_plan(connection, table, ahead_months=3, retention_months=None, archive=True, today=None):
+    """Statements adding partitions up to ahead_months out and removing months older than retention.
+
+    An expired month is exchanged into an empty copy named <table>_pYYYYMM and the
+    then-empty partition dropped (archive=True), or just dropped; both are
+    metadata operations whatever the month holds.
+    """
+    column, kind = PARTITION_SPECS[table]
+    partitions = existing_partitions(connection, table)
+    if not partitions:
+        raise PartitionError(f'{table} is not partitioned; run partition-table first')
+    names = [name for name, _ in partitions]
+    if MAX_PARTITION not in names:
+        raise PartitionError(f'{table} has no {MAX_PARTITION} partition to split new months from')
+    months = sorted(month for month in map(partition_month, names) if month)
+    this_month = month_start(today or date.today())
+
+    added = []
+    month = shift_month(months[-1], 1) if months else this_month
+    while month <= shift_month(this_month, ahead_months):
+        added.append(month)
+        month = shift_month(month, 1)
+
+    expired = []
+    if retention_months is not None:
+        cutoff = shift_month(this_month, -retention_months)
+        expired = [month for month in months if month < cutoff]
+
+    statements = []
+    if added:
+        statements.append(f"ALTER TABLE {table} REORGANIZE PARTITION {MAX_PARTITION} INTO (\n    "
+                          f"{_partition_defs(kind, added)}\n)")
+    archived = []
+    for month in expired:
+        name = partition_name(month)
+        if archive:
+            copy = f"{table}_{name}"
+            statements += [
+                f"CREATE TABLE {copy} LIKE {table}",
+                f"ALTER TABLE {copy} REMOVE PARTITIONING",
+                f"ALTER TABLE {table} EXCHANGE PARTITION {name} WITH TABLE {copy}",
+            ]
+            archived.append(copy)
+        statements.append(f"ALTER TABLE {table} DROP PARTITION {name}")
+    rows = dict(partitions)
+    return {
+        'table': table,
+        'added': [partition_name(month) for month in added],
+        'expired': [partition_name(month) for month in expired],
+        'expired_rows': sum(rows[partition_name(month)] for month in expired),
+        'archive_tables': archived,
+        'statements': statements,
+    }
+
+
+def apply(connection, plan):
+    """Run a plan's statements in order; DDL commits as it goes, so stop at the first error"""
+    cursor = connection.cursor()
+    try:
+        for sql in plan['statements']:
+            cursor.execute(sql)
+    finally:
+        cursor.close()
+    return plan
@@ -0,0 +1,213 @@
+"""
+Alumni Mentor Portal - Query Result Cache
+LRU cache of read results tagged with the tables they read; writes bump
+per-table version counters so stale entries are never served
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+# Every table the portal knows about, keyed by lower-case name
+KNOWN_TABLES = {name.lower(): name for name in (
+    'Alumni', 'Student', 'Skill', 'Industry', 'Achievement', 'MentorshipSession', 'Feedback',
+    'Provides', 'Alumni_Skills', 'Student_Skills', 'Mentorship_Request', 'Feedback_Log',
+    'Skill_Match_Log', 'Activity_Log', 'Table_Counts', 'Mentor_Stats', 'Mentor_Mentees',
+    'Session_Archive', 'Archive_Jobs'
+)}
+
+# Tables changed as a side effect (triggers, ON DELETE CASCADE / SET NULL) of writing a table
+TABLE_DEPENDENTS = {
+    'Alumni': ('Provides', 'Alumni_Skills', 'Activity_Log', 'Table_Counts', 'Mentor_Stats'),
+    'Student': ('Provides', 'Student_Skills', 'Skill_Match_Log', 'Activity_Log', 'Mentorship_Request',
+                'Table_Counts'),
+    'Skill': ('Alumni_Skills', 'Student_Skills', 'Skill_Match_Log'),
+    'MentorshipSession': ('Provides', 'Mentorship_Request', 'Activity_Log', 'Table_Counts',
+                          'Mentor_Stats', 'Mentor_Mentees'),
+    'Feedback': ('Feedback_Log', 'Provides', 'Table_Counts', 'Mentor_Stats'),
+    'Student_Skills': ('Skill_Match_Log',),
+}
+
+# Tables with a change version in Table_Versions (sql/table_versions.sql)
+VERSIONED_TABLES = (
+    'Alumni', 'Student', 'Skill', 'Industry', 'Achievement', 'MentorshipSession', 'Feedback',
+    'Provides', 'Alumni_Skills', 'Student_Skills', 'Mentorship_Request',
+    'Table_Counts', 'Mentor_Stats', 'Mentor_Mentees'
+)
+
+# Base tables behind the reporting views
+VIEW_READS = {
+    'v_mentorship_summary': ('Provides', 'Alumni', 'Student', 'MentorshipSession', 'Feedback'),
+    'v_top_mentors': ('Alumni', 'MentorshipSession', 'Feedback', 'Achievement', 'Industry'),
+}
+
+# Tables read and written by the stored procedures the app calls
+PROCEDURE_READS = {
+    'sp_alumni_performance_dashboard': ('Alumni', 'MentorshipSession', 'Feedback', 'Achievement'),
+    'GetMentorStats': ('Alumni', 'Mentor_Stats'),
+    'GetStudentSessions': ('MentorshipSession', 'Alumni', 'Feedback', 'Industry'),
+    'GetAlumniByIndustry': ('Alumni', 'Industry'),
+    'GetAlumniBySkill': ('Alumni', 'Alumni_Skills', 'Skill'),
+}
+PROCEDURE_WRITES = {
+    'RegisterStudent': ('Student',),
+    'ScheduleSession': ('MentorshipSession',),
+    'SubmitFeedback': ('Feedback',),
+    'CreateMentorshipRequest': ('Mentorship_Request',),
+    'DeleteOldSessions': ('MentorshipSession',),
+    'sp_reconcile_table_counts': ('Table_Counts',),
+    'sp_rebuild_mentor_stats': ('Mentor_Stats', 'Mentor_Mentees'),
+    'sp_touch_table_version': ('Table_Versions',),
+}
+
+_READ_TABLE_RE = re.compile(r'\b(?:FROM|JOIN)\s+`?(\w+)`?', re.IGNORECASE)
+_WRITE_TABLE_RE = re.compile(
+    r'^\s*(?:INSERT\s+(?:IGNORE\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)\s+`?(\w+)`?',
+    re.IGNORECASE
+)
+
+
+_VIEW_READS_LOWER = {name.lower(): tables for name, tables in VIEW_READS.items()}
+
+
+def tables_read(sql):
+    """Known tables referenced by a SELECT, including the tables behind known views"""
+    tables = set()
+    for name in _READ_TABLE_RE.findall(sql):
+        name = name.lower()
+        if name in KNOWN_TABLES:
+            tables.add(KNOWN_TABLES[name])
+        elif name in _VIEW_READS_LOWER:
+            tables.update(_VIEW_READS_LOWER[name])
+    return tuple(sorted(tables))
+
+
+def tables_written(sql):
+    """Tables changed by an INSERT/UPDATE/DELETE, including trigger and cascade side effects"""
+    match = _WRITE_TABLE_RE.match(sql)
+    if not match or match.group(1).lower() not in KNOWN_TABLES:
+        # Unknown statement shape: assume it may touch anything
+        return tuple(KNOWN_TABLES.values())
+    return with_dependents((KNOWN_TABLES[match.group(1).lower()],))
+
+
+def with_dependents(tables):
+    """Expand written tables with the tables their triggers and cascades touch"""
+    result = set(tables)
+    pending = list(tables)
+    while pending:
+        for dependent in TABLE_DEPENDENTS.get(pending.pop(), ()):
+            if dependent not in result:
+                result.add(dependent)
+                pending.append(dependent)
+    return tuple(sorted(result))
+
+
+def upstream_tables(tables):
+    """Expand read tables with every table whose writes can change them (the reverse of with_dependents)"""
+    result = set(tables)
+    changed = True
+    while changed:
+        changed = False
+        for writer, dependents in TABLE_DEPENDENTS.items():
+            if writer not in result and result.intersection(dependents):
+                result.add(writer)
+                changed = True
+    return tuple(sorted(result))
+
+
+class QueryCache:
+    """Thread-safe LRU of query results, bounded by entry count and total rows"""
+
+    def __init__(self, max_entries=512, max_rows=50000, max_age=300):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.max_age = max_age  # safety net for writes made outside this process
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (tables, versions, rows, stored_at)
+        self._versions = {}
+        self._rows = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def versions(self, tables):
+        """Current version snapshot for the given tables"""
+        with self._lock:
+            return tuple(self._versions.get(table, 0) for table in tables)
+
+    def get(self, key):
+        """Return (hit, rows); entries whose tables changed since they were stored are dropped"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+
+            entry_tables, entry_versions, rows, stored_at = entry
+            current = tuple(self._versions.get(table, 0) for table in entry_tables)
+            if current != entry_versions or time.monotonic() - stored_at > self.max_age:
+                self._remove_locked(key)
+                self._stale += 1
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, rows
+
+    def put(self, key, tables, versions, rows):
+        """Store rows read while the tables were at the given versions"""
+        if len(rows) > self.max_rows:
+            return
+        with self._lock:
+            current = tuple(self._versions.get(table, 0) for table in tables)
+            if current != versions:
+                # A write landed while the query ran; the rows may already be stale
+                return
+            if key in self._entries:
+                self._remove_locked(key)
+            self._entries[key] = (tables, versions, rows, time.monotonic())
+            self._rows += len(rows)
+            while self._entries and (len(self._entries) > self.max_entries or self._rows > self.max_rows):
+                self._remove_locked(next(iter(self._entries)))
+                self._evictions += 1
+
+    def bump(self, tables):
+        """Mark tables as changed; cached results that read them become stale"""
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+            self._invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._rows = 0
+
+    def _remove_locked(self, key):
+        _, _, rows, _ = self._entries.pop(key)
+        self._rows -= len(rows)
+
+    def stats(self):
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'rows': self._rows,
+                'max_entries': self.max_entries,
+                'max_rows': self.max_rows,
+                'hits': self._hits,
+                'misses': self._misses,
+                'stale': self._stale,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'hit_ratio': round(self._hits / lookups, 4) if lookups else 0.0,
+                'table_versions': dict(self._versions),
+            }
@@ -0,0 +1,224 @@
+"""
+Alumni Mentor Portal - Full-Text Search
+Builds relevance-ranked MATCH ... AGAINST queries over the FULLTEXT indexes in
+sql/search_indexes.sql, with paging, facet counts and per-scope match totals
+"""
+
+import re
+
+from pagination import page_size
+
+# InnoDB does not index words shorter than innodb_ft_min_token_size (default 3)
+MIN_TERM_LENGTH = 3
+MAX_TERMS = 8
+MAX_PAGE = 50            # deepest page served; ranking is recomputed for every page
+FACET_SAMPLE = 1000      # facets count the best-ranked matches, up to this many
+FACET_VALUES = 8         # values shown per facet
+
+# Words in INNODB_FT_DEFAULT_STOPWORD long enough to be indexed otherwise; a required
+# stopword would match nothing, so they are dropped from the query
+STOPWORDS = frozenset((
+    'about', 'are', 'com', 'for', 'from', 'how', 'that', 'the', 'this', 'und',
+    'was', 'what', 'when', 'where', 'who', 'will', 'with', 'www',
+))
+
+_TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+
+class SearchScope:
+    """One searchable table.
+
+    columns must be exactly the columns of its FULLTEXT index. source is the FROM
+    clause for result rows (the searched table is aliased t). facets maps a
+    query-string argument to (column, label, converter); a facet argument also
+    filters the results.
+    """
+
+    def __init__(self, label, table, id_column, columns, select, source, facets):
+        self.label = label
+        self.table = table
+        self.id_column = id_column
+        self.columns = columns
+        self.select = select
+        self.source = source
+        self.facets = facets
+
+    @property
+    def match(self):
+        return f"MATCH({', '.join('t.' + column for column in self.columns)}) AGAINST (%s IN BOOLEAN MODE)"
+
+
+SEARCH_SCOPES = {
+    'alumni': SearchScope(
+        'Alumni', 'Alumni', 't.Alumni_ID',
+        ('Name', 'Company', 'Current_Designation', 'Location'),
+        "t.Alumni_ID, t.Name, t.Company, t.Current_Designation, t.Location, t.Years_of_Experience",
+        "Alumni t",
+        {
+            'company': ('t.Company', 'Company', str),
+            'designation': ('t.Current_Designation', 'Designation', str),
+            'location': ('t.Location', 'Location', str),
+        },
+    ),
+    'achievements': SearchScope(
+        'Achievements', 'Achievement', 't.Achievement_ID',
+        ('Title', 'Description'),
+        "t.Achievement_ID, t.Title, t.Description, t.Awarding_Body, t.Year, t.Alumni_ID, a.Name AS Alumni_Name",
+        "Achievement t LEFT JOIN Alumni a ON t.Alumni_ID = a.Alumni_ID",
+        {
+            'year': ('t.Year', 'Year', int),
+            'awarding_body': ('t.Awarding_Body', 'Awarding Body', str),
+        },
+    ),
+    'feedback': SearchScope(
+        'Feedback', 'Feedback', 't.Feedback_ID',
+        ('Comments',),
+        "t.Feedback_ID, t.Rating, t.Date, t.Comments, t.Alumni_ID, a.Name AS Alumni_Name, "
+        "t.Student_ID, s.Name AS Student_Name",
+        "Feedback t LEFT JOIN Alumni a ON t.Alumni_ID = a.Alumni_ID "
+        "LEFT JOIN Student s ON t.Student_ID = s.Student_ID",
+        {
+            'rating': ('t.Rating', 'Rating', int),
+        },
+    ),
+    'skills': SearchScope(
+        'Skills', 'Skill', 't.Skill_ID',
+        ('Skill_Name',),
+        "t.Skill_ID, t.Skill_Name, t.Category, "
+        "(SELECT COUNT(*) FROM Alumni_Skills x WHERE x.Skill_ID = t.Skill_ID) AS Alumni_Count",
+        "Skill t",
+        {
+            'category': ('t.Category', 'Category', str),
+        },
+    ),
+}
+DEFAULT_SCOPE = 'alumni'
+
+
+def boolean_query(text):
+    """BOOLEAN MODE expression requiring every usable word of text as a prefix, or ''.
+
+    Operators typed by the user are discarded; only word characters reach MySQL.
+    """
+    terms = []
+    for term in _TERM_RE.findall(text or ''):
+        term = term.lower()
+        if len(term) >= MIN_TERM_LENGTH and term not in STOPWORDS and term not in terms:
+            terms.append(term)
+    return ' '.join(f'+{term}*' for term in terms[:MAX_TERMS])
+
+
+def scope_sources():
+    """A SELECT over every searchable table, for cache and version bookkeeping"""
+    return [f"SELECT {scope.select} FROM {scope.source}" for scope in SEARCH_SCOPES.values()]
+
+
+def build_search(args):
+    """Build ([(sql, params)], state) for the search described by the request args.
+
+    The statements are independent: the result page, the facet counts, and the
+    match totals. With no usable search words the statement list is empty.
+    """
+    name = args.get('scope') if args.get('scope') in SEARCH_SCOPES else DEFAULT_SCOPE
+    scope = SEARCH_SCOPES[name]
+    text = (args.get('q') or '').strip()
+    against = boolean_query(text)
+    per_page = page_size(args)
+    try:
+        page = max(1, min(int(args.get('page', 1)), MAX_PAGE))
+    except (TypeError, ValueError):
+        page = 1
+
+    conditions = [scope.match]
+    params = [against]
+    active_filters = {}
+    for arg, (column, _, convert) in scope.facets.items():
+        raw = (args.get(arg) or '').strip()
+        if not raw:
+            continue
+        try:
+            value = convert(raw)
+        except ValueError:
+            continue
+        conditions.append(f"{column} = %s")
+        params.append(value)
+        active_filters[arg] = raw
+    where = ' AND '.join(conditions)
+
+    state = {
+        'q': text,
+        'against': against,
+        'scope': name,
+        'page': page,
+        'per_page': per_page,
+        'filters': active_filters,
+    }
+    if not against:
+        return [], state
+
+    # The score is computed once per matching row; one extra row tells us whether there is a next page
+    page_sql = (f"SELECT {scope.select}, {scope.match} AS Score\n"
+                f"FROM {scope.source}\nWHERE {where}\n"
+                f"ORDER BY Score DESC, {scope.id_column}\n"
+                f"LIMIT {per_page + 1} OFFSET {(page - 1) * per_page}")
+    page_params = (against, *params)
+
+    # Facet counts over the best-ranked matches, so a very common word costs at most FACET_SAMPLE rows
+    facet_parts = []
+    facet_params = []
+    for arg, (column, _, _) in scope.facets.items():
+        facet_parts.append(
+            f"(SELECT '{arg}' AS Facet, Value, COUNT(*) AS Matches\n"
+            f" FROM (SELECT {column} AS Value FROM {scope.table} t WHERE {where}\n"
+            f"       ORDER BY {scope.match} DESC LIMIT {FACET_SAMPLE}) ranked\n"
+            f" WHERE Value IS NOT NULL GROUP BY Value ORDER BY Matches DESC, Value LIMIT {FACET_VALUES})"
+        )
+        facet_params.extend(params)
+        facet_params.append(against)
+    facet_sql = '\nUNION ALL\n'.join(facet_parts)
+
+    # Totals come from the FULLTEXT index alone: every scope unfiltered, plus the filtered active scope
+    totals = [f"(SELECT COUNT(*) FROM {other.table} t WHERE {other.match}) AS `{key}`"
+              for key, other in SEARCH_SCOPES.items()]
+    totals.append(f"(SELECT COUNT(*) FROM {scope.table} t WHERE {where}) AS `filtered`")
+    totals_sql = 'SELECT ' + ',\n       '.join(totals)
+    totals_params = (against,) * len(SEARCH_SCOPES) + tuple(params)
+
+    statements = [(page_sql, page_params), (facet_sql, tuple(facet_params)), (totals_sql, totals_params)]
+    return statements, state
+
+
+def finish_search(result_sets, state):
+    """Trim the look-ahead row and describe results, facets and totals for the templates"""
+    scope = SEARCH_SCOPES[state['scope']]
+    page_rows, facet_rows, total_rows = result_sets or ([], [], [])
+    rows = list(page_rows or [])
+    has_next = len(rows) > state['per_page'] and state['page'] < MAX_PAGE
+    rows = rows[:state['per_page']]
+    for row in rows:
+        row['Score'] = round(float(row['Score']), 4)
+
+    facets = {arg: {'label': label, 'active': state['filters'].get(arg), 'values': []}
+              for arg, (_, label, _) in scope.facets.items()}
+    for row in facet_rows or []:
+        facets[row['Facet']]['values'].append({'value': row['Value'], 'count': row['Matches']})
+
+    counts = dict(total_rows[0]) if total_rows else {}
+    total = int(counts.pop('filtered', 0) or 0)
+    args = dict(state['filters'], q=state['q'], scope=state['scope'], per_page=state['per_page'])
+    return {
+        'q': state['q'],
+        'searched': bool(state['against']),
+        'scope': state['scope'],
+        'rows': rows,
+        'total': total,
+        'scopes': {key: {'label': other.label, 'count': int(counts.get(key) or 0)}
+                   for key, other in SEARCH_SCOPES.items()},
+        'facets': facets,
+        'facets_sampled': total > FACET_SAMPLE,
+        'page': state['page'],
+        'per_page': state['per_page'],
+        'has_next': has_next,
+        'filters': state['filters'],
+        'args': args,
+    }
@@ -0,0 +1,179 @@
+"""
+Alumni Mentor Portal - Slow Query Recorder
+Keeps the last N statements that exceeded a latency threshold, with their
+EXPLAIN FORMAT=JSON plan, and groups them by normalized statement fingerprint
+"""
+
+import hashlib
+import json
+import math
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from mysql.connector import Error
+
+# Literal values collapse to ? so the same statement with different arguments groups together
+_FINGERPRINT_RULES = (
+    (re.compile(r"'(?:[^'\\]|\\.|'')*'"), '?'),
+    (re.compile(r'"(?:[^"\\]|\\.|"")*"'), '?'),
+    (re.compile(r'/\*.*?\*/', re.S), ' '),
+    (re.compile(r'(?:--|#)[^\n]*'), ' '),
+    (re.compile(r'%s'), '?'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)'), '(?+)'),
+    (re.compile(r'\s+'), ' '),
+)
+
+_EXPLAINABLE_RE = re.compile(r'^\s*(SELECT|WITH|INSERT|UPDATE|DELETE|REPLACE)\b', re.IGNORECASE)
+
+
+def fingerprint(sql):
+    """Statement text with literals, parameters and IN lists replaced by placeholders"""
+    for pattern, replacement in _FINGERPRINT_RULES:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+def _percentile(values, fraction):
+    """Nearest-rank percentile of a sorted list"""
+    return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+
+def plan_warnings(plan):
+    """Full scans, filesorts and temporary tables found anywhere in an EXPLAIN JSON plan"""
+    warnings = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            if node.get('access_type') == 'ALL':
+                warnings.append(f"full scan of {node.get('table_name', '?')} "
+                                f"({node.get('rows_examined_per_scan', '?')} rows)")
+            if node.get('using_filesort'):
+                warnings.append('filesort')
+            if node.get('using_temporary_table'):
+                warnings.append('temporary table')
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    walk(plan)
+    return warnings
+
+
+def explain_json(connection, sql, params=None):
+    """EXPLAIN FORMAT=JSON for one statement as a dict, or {'error': message}"""
+    if not _EXPLAINABLE_RE.match(sql):
+        return {'error': 'EXPLAIN is not available for this statement'}
+    try:
+        cursor = connection.cursor()
+        cursor.execute('EXPLAIN FORMAT=JSON ' + sql, params)
+        row = cursor.fetchone()
+        cursor.fetchall()
+        cursor.close()
+        return json.loads(row[0])
+    except (Error, ValueError, TypeError) as e:
+        return {'error': str(e)}
+
+
+class SlowQueryLog:
+    """Ring buffer of slow statements.
+
+    Each entry holds the statements sent (one, or several for a batch), their
+    parameters, the duration, the endpoint and the plan. A fingerprint is
+    explained at most once per explain_ttl seconds; later entries reuse that plan.
+    """
+
+    def __init__(self, threshold_ms=200, max_entries=500, explain_ttl=300):
+        self.threshold_ms = threshold_ms
+        self.explain_ttl = explain_ttl
+        self._entries = deque(maxlen=max_entries)
+        self._plans = {}  # fingerprint -> (explained_at, plans)
+        self._lock = threading.Lock()
+        self._recorded = 0
+
+    def is_slow(self, seconds):
+        return seconds * 1000 >= self.threshold_ms
+
+    def record(self, operation, statements, seconds, endpoint, error=False, connection=None):
+        """Store a slow statement; connection (still checked out) is used for EXPLAIN"""
+        key = fingerprint(';\n'.join(sql for sql, _ in statements))
+        now = time.monotonic()
+        with self._lock:
+            cached = self._plans.get(key)
+        if cached and now - cached[0] < self.explain_ttl:
+            plans = cached[1]
+        elif connection is not None and not error:
+            plans = [explain_json(connection, sql, params) for sql, params in statements]
+            with self._lock:
+                self._plans[key] = (now, plans)
+        else:
+            plans = []
+
+        entry = {
+            'fingerprint': key,
+            'operation': operation,
+            'statements': [{'sql': ' '.join(sql.split()), 'params': [str(value) for value in params or ()]}
+                           for sql, params in statements],
+            'duration_ms': round(seconds * 1000, 3),
+            'endpoint': endpoint,
+            'error': error,
+            'at': datetime.now().isoformat(timespec='seconds'),
+            'plans': plans,
+        }
+        with self._lock:
+            self._entries.append(entry)
+            self._recorded += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._plans.clear()
+
+    def entries(self):
+        with self._lock:
+            return list(self._entries)
+
+    def groups(self):
+        """Entries grouped by fingerprint with count, p50/p99/max, slowest first by p99"""
+        grouped = {}
+        for entry in self.entries():
+            grouped.setdefault(entry['fingerprint'], []).append(entry)
+
+        result = []
+        for key, entries in grouped.items():
+            durations = sorted(entry['duration_ms'] for entry in entries)
+            slowest = max(entries, key=lambda entry: entry['duration_ms'])
+            latest = entries[-1]
+            plans = latest['plans'] or slowest['plans']
+            result.append({
+                'id': hashlib.sha1(key.encode()).hexdigest()[:12],
+                'fingerprint': key,
+                'operation': latest['operation'],
+                'count': len(entries),
+                'errors': sum(1 for entry in entries if entry['error']),
+                'p50_ms': _percentile(durations, 0.50),
+                'p99_ms': _percentile(durations, 0.99),
+                'max_ms': durations[-1],
+                'total_ms': round(sum(durations), 3),
+                'endpoints': sorted({entry['endpoint'] for entry in entries}),
+                'last_seen': latest['at'],
+                'slowest': slowest,
+                'plans': plans,
+                'warnings': sorted({warning for plan in plans for warning in plan_warnings(plan)}),
+            })
+        result.sort(key=lambda group: (group['p99_ms'], group['count']), reverse=True)
+        return result
+
+    def stats(self):
+        with self._lock:
+            return {
+                'threshold_ms': self.threshold_ms,
+                'entries': len(self._entries),
+                'max_entries': self._entries.maxlen,
+                'recorded': self._recorded,
+            }
@@ -0,0 +1,103 @@
+"""
+Alumni Mentor Portal - In-Memory Snapshots
+Reload logic shared by the in-memory indexes built from query results
+(typeahead, form validation, mentor availability), and the per-user registry
+that holds them and the matching engines
+"""
+
+import threading
+import time
+
+
+class Snapshot:
+    """Data built from some tables, reloaded when their cache versions change.
+
+    Every write made through the app bumps the versions of the tables it
+    touches, so a version other than the one read before the last load means
+    the data is out of date; max_age bounds the staleness from writes made
+    outside the app. A reload builds new data and swaps it in, so readers keep
+    answering from the old data meanwhile. Subclasses implement _build.
+    """
+
+    def __init__(self, tables, max_age=300):
+        self.tables = tuple(tables)
+        self.max_age = max_age  # reload at least this often (writes made outside the app)
+
+        self._lock = threading.Lock()
+        self._version = None
+        self._loaded_at = float('-inf')
+        self._data = None
+        self._loads = 0
+
+    def _build(self, fetch):
+        """New data from fetch(queries), which returns one row list per query; None if fetch failed"""
+        raise NotImplementedError
+
+    def is_stale(self, versions):
+        return (self._version != versions(self.tables)
+                or time.monotonic() - self._loaded_at > self.max_age)
+
+    def refresh(self, fetch, versions, force=False):
+        """Reload if stale (or forced); False if there is still no data.
+
+        Only the first load and forced ones wait for another thread's reload;
+        otherwise readers answer from the current data while it runs.
+        """
+        if not force and self._data is not None and not self.is_stale(versions):
+            return True
+        if not self._lock.acquire(blocking=force or self._data is None):
+            return True
+        try:
+            if not force and self._data is not None and not self.is_stale(versions):
+                return True
+            version = versions(self.tables)
+            data = self._build(fetch)
+            if data is None:
+                return self._data is not None
+            self._data = data
+            self._version = version
+            self._loaded_at = time.monotonic()
+            self._loads += 1
+            return True
+        finally:
+            self._lock.release()
+
+    def invalidate(self):
+        """Force a reload on the next refresh"""
+        self._version = None
+
+    @property
+    def age(self):
+        return time.monotonic() - self._loaded_at
+
+    def _own_write(self, before, table, versions):
+        """The versions after a write to table by this process, or None if anything else changed.
+
+        before is the versions read ahead of the write. Data that matched them
+        can be updated in place rather than reloaded if the write's own bump is
+        the only change since. The caller holds the lock.
+        """
+        expected = tuple(version + (name == table) for name, version in zip(self.tables, before))
+        if self._data is None or self._version != before or versions(self.tables) != expected:
+            return None
+        return expected
+
+
+class UserRegistry:
+    """One object per database user (and key), made by factory(*key) on first use"""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def get(self, user, *key):
+        with self._lock:
+            item = self._items.get((user,) + key)
+            if item is None:
+                item = self._items[(user,) + key] = self.factory(*key)
+        return item
+
+    def peek(self, user, *key):
+        """The existing object, or None"""
+        return self._items.get((user,) + key)
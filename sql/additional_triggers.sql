@@ -187,6 +187,7 @@ END$$
 -- =====================================================
 
 -- Trigger: Update mentor statistics after feedback
+-- (replaced by tr_feedback_mentor_stats_insert in mentor_stats.sql)
 CREATE TRIGGER tr_feedback_update_mentor_stats
 AFTER INSERT ON Feedback
 FOR EACH ROW
@@ -281,10 +282,10 @@ CREATE TABLE IF NOT EXISTS Activity_Log (
 );
 
 -- Create indexes for performance
+-- (session date and achievement indexes are in database_indexes.sql:
+-- idx_session_date and idx_achievement_alumni_year)
 CREATE INDEX idx_mentorship_request_student ON Mentorship_Request(Student_ID, Status);
 CREATE INDEX idx_feedback_alumni_rating ON Feedback(Alumni_ID, Rating);
-CREATE INDEX idx_mentorship_session_date ON MentorshipSession(Date, Alumni_ID);
-CREATE INDEX idx_alumni_achievements ON Achievement(Alumni_ID, Achievement_Type);
 
 -- Show all triggers
 SHOW TRIGGERS;
\ No newline at end of file
@@ -0,0 +1,46 @@
+-- =====================================================
+-- Alumni Mentor Portal - Asynchronous Audit Log
+-- =====================================================
+-- Recreates the two log triggers the web forms fire on every insert:
+--
+--   tr_feedback_after_insert  Feedback          -> Feedback_Log
+--   tr_log_activity           MentorshipSession -> Activity_Log
+--
+-- so they skip the log row while the inserting connection has
+-- @portal_async_audit set. The app sets it for the insert statement alone
+-- when AUDIT_CONFIG['async'] is on and queues the log row instead; audit.py
+-- writes queued rows in multi-row batches outside the user's transaction.
+-- Every other writer (procedures, bulk import, data generation, the mysql
+-- client) leaves the variable unset and is logged here as before.
+--
+-- Applied as migration 14 by `flask --app app migrate`.
+
+USE mentor_alumni_portal;
+
+DROP TRIGGER IF EXISTS tr_feedback_after_insert;
+DROP TRIGGER IF EXISTS tr_log_activity;
+
+DELIMITER $$
+
+CREATE TRIGGER tr_feedback_after_insert
+AFTER INSERT ON Feedback
+FOR EACH ROW
+BEGIN
+    IF @portal_async_audit IS NULL THEN
+        INSERT INTO Feedback_Log (Alumni_ID, Student_ID, Feedback_Date)
+        VALUES (NEW.Alumni_ID, NEW.Student_ID, NEW.Date);
+    END IF;
+END$$
+
+CREATE TRIGGER tr_log_activity
+AFTER INSERT ON MentorshipSession
+FOR EACH ROW
+BEGIN
+    IF @portal_async_audit IS NULL THEN
+        INSERT INTO Activity_Log (Activity_Type, Alumni_ID, Student_ID, Activity_Date, Details)
+        VALUES ('Session Scheduled', NEW.Alumni_ID, NEW.Student_ID, NEW.Session_Date,
+                CONCAT('Topic: ', NEW.Topic, ', Duration: ', NEW.Duration_Minutes, ' mins'));
+    END IF;
+END$$
+
+DELIMITER ;
@@ -0,0 +1,174 @@
+-- =====================================================
+-- Alumni Mentor Portal - Dashboard Row Counters
+-- =====================================================
+-- The dashboard used to run SELECT COUNT(*) on four tables per page view,
+-- which is a full index scan on InnoDB. Table_Counts keeps those counts
+-- exact through insert/delete triggers so the dashboard reads a handful of
+-- rows regardless of table size.
+--
+-- Each table's count is spread over 16 slots picked by CONNECTION_ID(), so
+-- concurrent inserts from different connections update different rows
+-- instead of queueing on one hot counter row. The count is SUM(Row_Count).
+--
+-- Note: MySQL does not fire triggers for rows removed by ON DELETE CASCADE
+-- or by partition maintenance. None of the counted tables are cascade
+-- targets today; sp_reconcile_table_counts corrects any drift.
+
+USE mentor_alumni_portal;
+
+CREATE TABLE IF NOT EXISTS Table_Counts (
+    Table_Name VARCHAR(64) NOT NULL,
+    Slot TINYINT UNSIGNED NOT NULL,
+    Row_Count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (Table_Name, Slot)
+);
+
+-- Seed one row per slot, with the current count in slot 0
+DELETE FROM Table_Counts WHERE Table_Name IN ('Alumni', 'Student', 'MentorshipSession', 'Feedback');
+
+INSERT INTO Table_Counts (Table_Name, Slot, Row_Count)
+SELECT t.Table_Name, s.Slot, 0
+FROM (SELECT 'Alumni' AS Table_Name UNION ALL SELECT 'Student'
+      UNION ALL SELECT 'MentorshipSession' UNION ALL SELECT 'Feedback') t
+CROSS JOIN (SELECT 0 AS Slot UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3
+            UNION ALL SELECT 4 UNION ALL SELECT 5 UNION ALL SELECT 6 UNION ALL SELECT 7
+            UNION ALL SELECT 8 UNION ALL SELECT 9 UNION ALL SELECT 10 UNION ALL SELECT 11
+            UNION ALL SELECT 12 UNION ALL SELECT 13 UNION ALL SELECT 14 UNION ALL SELECT 15) s;
+
+UPDATE Table_Counts SET Row_Count = (SELECT COUNT(*) FROM Alumni) WHERE Table_Name = 'Alumni' AND Slot = 0;
+UPDATE Table_Counts SET Row_Count = (SELECT COUNT(*) FROM Student) WHERE Table_Name = 'Student' AND Slot = 0;
+UPDATE Table_Counts SET Row_Count = (SELECT COUNT(*) FROM MentorshipSession) WHERE Table_Name = 'MentorshipSession' AND Slot = 0;
+UPDATE Table_Counts SET Row_Count = (SELECT COUNT(*) FROM Feedback) WHERE Table_Name = 'Feedback' AND Slot = 0;
+
+-- =====================================================
+-- COUNTER TRIGGERS
+-- =====================================================
+
+DELIMITER $$
+
+CREATE TRIGGER tr_alumni_count_insert
+AFTER INSERT ON Alumni
+FOR EACH ROW
+BEGIN
+    UPDATE Table_Counts SET Row_Count = Row_Count + 1
+    WHERE Table_Name = 'Alumni' AND Slot = CONNECTION_ID() % 16;
+END$$
+
+CREATE TRIGGER tr_alumni_count_delete
+AFTER DELETE ON Alumni
+FOR EACH ROW
+BEGIN
+    UPDATE Table_Counts SET Row_Count = Row_Count - 1
+    WHERE Table_Name = 'Alumni' AND Slot = CONNECTION_ID() % 16;
+END$$
+
+CREATE TRIGGER tr_student_count_insert
+AFTER INSERT ON Student
+FOR EACH ROW
+BEGIN
+    UPDATE Table_Counts SET Row_Count = Row_Count + 1
+    WHERE Table_Name = 'Student' AND Slot = CONNECTION_ID() % 16;
+END$$
+
+CREATE TRIGGER tr_student_count_delete
+AFTER DELETE ON Student
+FOR EACH ROW
+BEGIN
+    UPDATE Table_Counts SET Row_Count = Row_Count - 1
+    WHERE Table_Name = 'Student' AND Slot = CONNECTION_ID() % 16;
+END$$
+
+CREATE TRIGGER tr_mentorship_session_count_insert
+AFTER INSERT ON MentorshipSession
+FOR EACH ROW
+BEGIN
+    UPDATE Table_Counts SET Row_Count = Row_Count + 1
+    WHERE Table_Name = 'MentorshipSession' AND Slot = CONNECTION_ID() % 16;
+END$$
+
+CREATE TRIGGER tr_mentorship_session_count_delete
+AFTER DELETE ON MentorshipSession
+FOR EACH ROW
+BEGIN
+    UPDATE Table_Counts SET Row_Count = Row_Count - 1
+    WHERE Table_Name = 'MentorshipSession' AND Slot = CONNECTION_ID() % 16;
+END$$
+
+CREATE TRIGGER tr_feedback_count_insert
+AFTER INSERT ON Feedback
+FOR EACH ROW
+BEGIN
+    UPDATE Table_Counts SET Row_Count = Row_Count + 1
+    WHERE Table_Name = 'Feedback' AND Slot = CONNECTION_ID() % 16;
+END$$
+
+CREATE TRIGGER tr_feedback_count_delete
+AFTER DELETE ON Feedback
+FOR EACH ROW
+BEGIN
+    UPDATE Table_Counts SET Row_Count = Row_Count - 1
+    WHERE Table_Name = 'Feedback' AND Slot = CONNECTION_ID() % 16;
+END$$
+
+-- =====================================================
+-- RECONCILE JOB
+-- =====================================================
+
+-- Procedure: Correct counter drift for one table.
+-- Locking the table's counter rows first blocks concurrent insert/delete
+-- triggers, so the COUNT(*) that follows sees exactly the rows the counters
+-- should reflect. Any difference is folded into slot 0.
+CREATE PROCEDURE sp_reconcile_table_count(IN p_table_name VARCHAR(64))
+BEGIN
+    DECLARE v_counted BIGINT;
+    DECLARE v_actual BIGINT;
+
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        RESIGNAL;
+    END;
+
+    START TRANSACTION;
+
+    SELECT COALESCE(SUM(Row_Count), 0) INTO v_counted
+    FROM Table_Counts
+    WHERE Table_Name = p_table_name
+    FOR UPDATE;
+
+    CASE p_table_name
+        WHEN 'Alumni' THEN SELECT COUNT(*) INTO v_actual FROM Alumni;
+        WHEN 'Student' THEN SELECT COUNT(*) INTO v_actual FROM Student;
+        WHEN 'MentorshipSession' THEN SELECT COUNT(*) INTO v_actual FROM MentorshipSession;
+        WHEN 'Feedback' THEN SELECT COUNT(*) INTO v_actual FROM Feedback;
+        ELSE SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Table is not counted';
+    END CASE;
+
+    IF v_actual <> v_counted THEN
+        UPDATE Table_Counts SET Row_Count = Row_Count + (v_actual - v_counted)
+        WHERE Table_Name = p_table_name AND Slot = 0;
+    END IF;
+
+    COMMIT;
+
+    SELECT p_table_name AS Table_Name, v_counted AS Counted, v_actual AS Actual,
+           v_actual - v_counted AS Drift_Corrected;
+END$$
+
+-- Procedure: Reconcile every counted table
+CREATE PROCEDURE sp_reconcile_table_counts()
+BEGIN
+    CALL sp_reconcile_table_count('Alumni');
+    CALL sp_reconcile_table_count('Student');
+    CALL sp_reconcile_table_count('MentorshipSession');
+    CALL sp_reconcile_table_count('Feedback');
+END$$
+
+DELIMITER ;
+
+-- Optional: run the reconcile job hourly (requires event_scheduler=ON)
+-- CREATE EVENT IF NOT EXISTS ev_reconcile_table_counts
+-- ON SCHEDULE EVERY 1 HOUR
+-- DO CALL sp_reconcile_table_counts();
+
+SELECT Table_Name, SUM(Row_Count) AS Row_Count FROM Table_Counts GROUP BY Table_Name;
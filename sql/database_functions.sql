@@ -1,4 +1,5 @@
 -- Function to calculate average rating for an alumni (Updated to match actual database structure)
+-- (mentor_stats.sql redefines this to read Mentor_Stats)
 DELIMITER //
 CREATE FUNCTION GetAlumniAverageRating(alumni_id VARCHAR(20))
 RETURNS DECIMAL(3,2)
@@ -16,6 +17,7 @@ END //
 DELIMITER ;
 
 -- Function to count total sessions for an alumni (Updated to match actual database structure)
+-- (mentor_stats.sql redefines this to read Mentor_Stats)
 DELIMITER //
 CREATE FUNCTION GetAlumniSessionCount(alumni_id VARCHAR(20))
 RETURNS INT
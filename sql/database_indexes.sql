@@ -0,0 +1,54 @@
+-- =====================================================
+-- Alumni Mentor Portal - Indexes for List Pages
+-- =====================================================
+-- Each list page is read with keyset pagination:
+--   WHERE <filters> AND (sort_col, id) after the cursor
+--   ORDER BY sort_col, id LIMIT n
+-- InnoDB appends the primary key to every secondary index, so an index on
+-- (filter_col, sort_col) already ends with the id tiebreaker and lets MySQL
+-- seek straight to the cursor without a filesort.
+--
+-- Applied as migration 8 by `flask --app app migrate`; `flask --app app
+-- check-indexes` EXPLAINs the list and dashboard queries against this set.
+
+USE mentor_alumni_portal;
+
+-- Alumni: sort by Name or experience, filter by company / designation
+CREATE INDEX idx_alumni_name ON Alumni(Name);
+CREATE INDEX idx_alumni_experience ON Alumni(Years_of_Experience);
+CREATE INDEX idx_alumni_company_name ON Alumni(Company, Name);
+CREATE INDEX idx_alumni_designation_name ON Alumni(Current_Designation, Name);
+
+-- Student: sort by Name, filter by department / year of study
+CREATE INDEX idx_student_name ON Student(Name);
+CREATE INDEX idx_student_department_name ON Student(Department, Name);
+CREATE INDEX idx_student_year_name ON Student(Year_of_Study, Name);
+
+-- MentorshipSession: sort by Session_Date, filter by alumni / student.
+-- idx_session_date names the primary key explicitly so it keeps the
+-- (Session_Date, Session_ID) keyset order, and carries Alumni_ID/Student_ID
+-- so the dashboard's recent-sessions widget is answered from the index alone.
+CREATE INDEX idx_session_date ON MentorshipSession(Session_Date, Session_ID, Alumni_ID, Student_ID);
+CREATE INDEX idx_session_alumni_date ON MentorshipSession(Alumni_ID, Session_Date);
+CREATE INDEX idx_session_student_date ON MentorshipSession(Student_ID, Session_Date);
+
+-- Feedback: sort by Date or Rating, filter by alumni / student
+CREATE INDEX idx_feedback_date ON Feedback(Date);
+CREATE INDEX idx_feedback_rating ON Feedback(Rating);
+CREATE INDEX idx_feedback_alumni_date ON Feedback(Alumni_ID, Date);
+CREATE INDEX idx_feedback_student_date ON Feedback(Student_ID, Date);
+
+-- Achievement: sort by Year, filter by alumni
+CREATE INDEX idx_achievement_year ON Achievement(Year);
+CREATE INDEX idx_achievement_alumni_year ON Achievement(Alumni_ID, Year);
+
+-- Industry: sort by Industry_Name, filter by sector
+CREATE INDEX idx_industry_name ON Industry(Industry_Name);
+CREATE INDEX idx_industry_sector_name ON Industry(Sector, Industry_Name);
+CREATE INDEX idx_industry_location_name ON Industry(Location, Industry_Name);
+
+-- Skill: sort by Skill_Name, filter by category
+CREATE INDEX idx_skill_name ON Skill(Skill_Name);
+CREATE INDEX idx_skill_category_name ON Skill(Category, Skill_Name);
+
+SHOW INDEX FROM MentorshipSession;
@@ -139,6 +139,7 @@ END$$
 
 -- Procedure 6: Get Mentor Statistics
 -- Retrieves comprehensive statistics for an alumni mentor
+-- (mentor_stats.sql redefines this to read Mentor_Stats)
 CREATE PROCEDURE GetMentorStats(
     IN p_Alumni_ID VARCHAR(20)
 )
@@ -161,6 +161,8 @@ END$$
 -- =====================================================
 
 -- Procedure to get alumni performance dashboard
+-- Each table is aggregated per alumnus before the join, so an active mentor
+-- contributes one row per table instead of sessions x feedback x achievements
 CREATE PROCEDURE sp_alumni_performance_dashboard()
 BEGIN
     SELECT
@@ -168,21 +170,32 @@ BEGIN
         a.Name,
         a.Current_Designation,
         a.Years_of_Experience,
-        COUNT(DISTINCT ms.Student_ID) AS Total_Mentees,
-        COUNT(ms.Session_ID) AS Total_Sessions,
-        COALESCE(AVG(f.Rating), 0) AS Average_Rating,
-        COUNT(DISTINCT ach.Achievement_ID) AS Total_Achievements,
+        COALESCE(ms.Total_Mentees, 0) AS Total_Mentees,
+        COALESCE(ms.Total_Sessions, 0) AS Total_Sessions,
+        COALESCE(f.Average_Rating, 0) AS Average_Rating,
+        COALESCE(ach.Total_Achievements, 0) AS Total_Achievements,
         CASE
-            WHEN COUNT(ms.Session_ID) >= 10 AND AVG(f.Rating) >= 4.5 THEN 'Premium Mentor'
-            WHEN COUNT(ms.Session_ID) >= 5 AND AVG(f.Rating) >= 4.0 THEN 'Good Mentor'
-            WHEN COUNT(ms.Session_ID) >= 1 THEN 'Active Mentor'
+            WHEN ms.Total_Sessions >= 10 AND f.Average_Rating >= 4.5 THEN 'Premium Mentor'
+            WHEN ms.Total_Sessions >= 5 AND f.Average_Rating >= 4.0 THEN 'Good Mentor'
+            WHEN ms.Total_Sessions >= 1 THEN 'Active Mentor'
             ELSE 'Inactive Mentor'
         END AS Mentor_Status
     FROM Alumni a
-    LEFT JOIN MentorshipSession ms ON a.Alumni_ID = ms.Alumni_ID
-    LEFT JOIN Feedback f ON a.Alumni_ID = f.Alumni_ID
-    LEFT JOIN Achievement ach ON a.Alumni_ID = ach.Alumni_ID
-    GROUP BY a.Alumni_ID, a.Name, a.Current_Position, a.Years_of_Experience
+    LEFT JOIN (
+        SELECT Alumni_ID, COUNT(DISTINCT Student_ID) AS Total_Mentees, COUNT(*) AS Total_Sessions
+        FROM MentorshipSession
+        GROUP BY Alumni_ID
+    ) ms ON a.Alumni_ID = ms.Alumni_ID
+    LEFT JOIN (
+        SELECT Alumni_ID, AVG(Rating) AS Average_Rating
+        FROM Feedback
+        GROUP BY Alumni_ID
+    ) f ON a.Alumni_ID = f.Alumni_ID
+    LEFT JOIN (
+        SELECT Alumni_ID, COUNT(*) AS Total_Achievements
+        FROM Achievement
+        GROUP BY Alumni_ID
+    ) ach ON a.Alumni_ID = ach.Alumni_ID
     ORDER BY Total_Sessions DESC, Average_Rating DESC;
 END$$
 
@@ -337,43 +350,63 @@ DELIMITER ;
 -- =====================================================
 
 -- View: Mentorship Summary
+-- Sessions and feedback are aggregated per (alumnus, student) pair before the
+-- join, so session counts are not multiplied by the pair's feedback rows
 CREATE OR REPLACE VIEW v_mentorship_summary AS
 SELECT
     a.Alumni_ID,
     a.Name AS Alumni_Name,
-    a.Current_Position,
+    a.Current_Designation,
     s.Student_ID,
     s.Name AS Student_Name,
     s.Department,
     p.Status AS Relationship_Status,
-    COUNT(ms.Session_ID) AS Session_Count,
-    AVG(f.Rating) AS Average_Rating,
-    MAX(ms.Session_Date) AS_Last_Session_Date
-FROM Alumni a
-JOIN Provides p ON a.Alumni_ID = p.Alumni_ID
-JOIN Student s ON p.Student_ID = s.Student_ID
-LEFT JOIN MentorshipSession ms ON a.Alumni_ID = ms.Alumni_ID AND s.Student_ID = ms.Student_ID
-LEFT JOIN Feedback f ON a.Alumni_ID = f.Alumni_ID AND s.Student_ID = f.Student_ID
-GROUP BY a.Alumni_ID, a.Name, a.Current_Position, s.Student_ID, s.Name, s.Department, p.Status;
+    COALESCE(ms.Session_Count, 0) AS Session_Count,
+    f.Average_Rating,
+    ms.Last_Session_Date
+FROM Provides p
+JOIN Alumni a ON a.Alumni_ID = p.Alumni_ID
+JOIN Student s ON s.Student_ID = p.Student_ID
+LEFT JOIN (
+    SELECT Alumni_ID, Student_ID, COUNT(*) AS Session_Count, MAX(Session_Date) AS Last_Session_Date
+    FROM MentorshipSession
+    GROUP BY Alumni_ID, Student_ID
+) ms ON ms.Alumni_ID = p.Alumni_ID AND ms.Student_ID = p.Student_ID
+LEFT JOIN (
+    SELECT Alumni_ID, Student_ID, AVG(Rating) AS Average_Rating
+    FROM Feedback
+    GROUP BY Alumni_ID, Student_ID
+) f ON f.Alumni_ID = p.Alumni_ID AND f.Student_ID = p.Student_ID;
 
--- View: Top Performing Mentors
+-- View: Top Performing Mentors (one row per mentor and industry, as before)
 CREATE OR REPLACE VIEW v_top_mentors AS
 SELECT
     a.Alumni_ID,
     a.Name,
-    a.Current_Position,
+    a.Current_Designation,
     i.Industry_Name,
-    COUNT(DISTINCT ms.Student_ID) AS Total_Mentees,
-    COUNT(ms.Session_ID) AS Total_Sessions,
-    COALESCE(AVG(f.Rating), 0) AS Average_Rating,
-    COUNT(DISTINCT ach.Achievement_ID) AS Achievements
+    ms.Total_Mentees,
+    ms.Total_Sessions,
+    COALESCE(f.Average_Rating, 0) AS Average_Rating,
+    COALESCE(ach.Achievements, 0) AS Achievements
 FROM Alumni a
-LEFT JOIN MentorshipSession ms ON a.Alumni_ID = ms.Alumni_ID
-LEFT JOIN Feedback f ON a.Alumni_ID = f.Alumni_ID
+JOIN (
+    SELECT Alumni_ID, COUNT(DISTINCT Student_ID) AS Total_Mentees, COUNT(*) AS Total_Sessions
+    FROM MentorshipSession
+    GROUP BY Alumni_ID
+    HAVING COUNT(*) >= 3
+) ms ON a.Alumni_ID = ms.Alumni_ID
+LEFT JOIN (
+    SELECT Alumni_ID, AVG(Rating) AS Average_Rating
+    FROM Feedback
+    GROUP BY Alumni_ID
+) f ON a.Alumni_ID = f.Alumni_ID
+LEFT JOIN (
+    SELECT Alumni_ID, COUNT(*) AS Achievements
+    FROM Achievement
+    GROUP BY Alumni_ID
+) ach ON a.Alumni_ID = ach.Alumni_ID
 LEFT JOIN Industry i ON a.Alumni_ID = i.Alumni_ID
-LEFT JOIN Achievement ach ON a.Alumni_ID = ach.Alumni_ID
-GROUP BY a.Alumni_ID, a.Name, a.Current_Position, i.Industry_Name
-HAVING Total_Sessions >= 3
 ORDER BY Average_Rating DESC, Total_Sessions DESC;
 
 -- View: Skill Gap Analysis
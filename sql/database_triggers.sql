@@ -142,6 +142,7 @@ BEGIN
 END$$
 
 -- Trigger: Update mentorship statistics after feedback
+-- (replaced by tr_feedback_mentor_stats_insert in mentor_stats.sql)
 CREATE TRIGGER tr_feedback_comprehensive_after_insert
 AFTER INSERT ON Feedback
 FOR EACH ROW
@@ -0,0 +1,76 @@
+-- =====================================================
+-- Alumni Mentor Portal - Declarative Constraints
+-- =====================================================
+-- Several insert triggers ran lookup queries that repeat a constraint the
+-- schema already declares:
+--
+--   tr_student_before_insert             COUNT(*) by Email   UNIQUE (Email)
+--   tr_alumni_before_insert              COUNT(*) by Email   UNIQUE (Email)
+--   tr_mentorship_session_before_insert  COUNT(*) on Alumni  FOREIGN KEY (Alumni_ID)
+--                                        COUNT(*) on Student FOREIGN KEY (Student_ID)
+--
+-- This script drops those queries and moves the remaining single-row
+-- checks that hold for every write into CHECK constraints. The web forms
+-- check the same rules first against cached key and email sets
+-- (validation.py) and show a friendly message; other writers now get the
+-- constraint's own error (1062 duplicate entry, 1452 missing parent,
+-- 3819 check violated) instead of the trigger's text.
+--
+-- Year_of_Study stays a trigger check: graduation sets it to 5 by UPDATE,
+-- so only inserts are limited to 1-4. The graduation year check reads
+-- CURDATE(), which CHECK constraints may not. tr_mentorship_request_before_insert
+-- keeps its pending-request count, a rule across rows, served by
+-- idx_mentorship_request_student.
+--
+-- Existing rows must satisfy the new CHECK constraints, or this script stops
+-- at the ALTER that names the failing one.
+--
+-- Applied as migration 15 by `flask --app app migrate`.
+
+USE mentor_alumni_portal;
+
+ALTER TABLE Student
+    ADD CONSTRAINT chk_student_phone CHECK (Phone_Number BETWEEN 1000000000 AND 9999999999);
+
+ALTER TABLE MentorshipSession
+    ADD CONSTRAINT chk_session_duration CHECK (Duration_Minutes > 0);
+
+DROP TRIGGER IF EXISTS tr_student_before_insert;
+DROP TRIGGER IF EXISTS tr_alumni_before_insert;
+DROP TRIGGER IF EXISTS tr_mentorship_session_before_insert;
+
+DELIMITER $$
+
+-- Trigger: Validate student data before insert (email: UNIQUE, phone: chk_student_phone)
+CREATE TRIGGER tr_student_before_insert
+BEFORE INSERT ON Student
+FOR EACH ROW
+BEGIN
+    -- Validate year of study (1-4 for undergraduate)
+    IF NEW.Year_of_Study IS NOT NULL AND (NEW.Year_of_Study < 1 OR NEW.Year_of_Study > 4) THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Year of study must be between 1 and 4';
+    END IF;
+END$$
+
+-- Trigger: Validate alumni data before insert (email: UNIQUE)
+CREATE TRIGGER tr_alumni_before_insert
+BEFORE INSERT ON Alumni
+FOR EACH ROW
+BEGIN
+    -- Validate graduation year (should not be in future)
+    IF NEW.Graduation_Year > YEAR(CURDATE()) THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Graduation year cannot be in the future';
+    END IF;
+
+    -- Calculate years of experience if not provided
+    IF NEW.Years_of_Experience IS NULL THEN
+        SET NEW.Years_of_Experience = YEAR(CURDATE()) - NEW.Graduation_Year;
+    END IF;
+END$$
+
+-- tr_mentorship_session_before_insert is not recreated: its alumni and student
+-- checks are the foreign keys and its duration check is chk_session_duration
+
+DELIMITER ;
@@ -0,0 +1,309 @@
+-- =====================================================
+-- Alumni Mentor Portal - Incremental Mentor Statistics
+-- =====================================================
+-- Per-mentor feedback and session totals kept up to date by triggers, so
+-- nothing re-aggregates Feedback or MentorshipSession on each write.
+--
+--   Mentor_Stats    one row per alumnus: feedback count, rated count,
+--                   rating sum, session count and distinct mentee count
+--   Mentor_Mentees  sessions per (alumnus, student) pair; the mentee count
+--                   changes only when a pair goes from 0 to 1 session or back
+--
+-- Every insert/update/delete touches one or two primary key rows, so the
+-- cost stays the same no matter how much feedback a mentor already has.
+--
+-- This script replaces tr_feedback_comprehensive_after_insert and
+-- tr_feedback_update_mentor_stats (both recomputed AVG/COUNT over the
+-- mentor's history on every insert) with tr_feedback_mentor_stats_insert,
+-- and redefines GetMentorStats, GetAlumniAverageRating and
+-- GetAlumniSessionCount to read from Mentor_Stats.
+-- Run it after database_procedures.sql, database_functions.sql and
+-- additional_triggers.sql.
+
+USE mentor_alumni_portal;
+
+CREATE TABLE IF NOT EXISTS Mentor_Stats (
+    Alumni_ID VARCHAR(20) PRIMARY KEY,
+    Feedback_Count INT NOT NULL DEFAULT 0,
+    Rating_Count INT NOT NULL DEFAULT 0,
+    Rating_Sum BIGINT NOT NULL DEFAULT 0,
+    Session_Count INT NOT NULL DEFAULT 0,
+    Mentee_Count INT NOT NULL DEFAULT 0,
+    FOREIGN KEY (Alumni_ID) REFERENCES Alumni(Alumni_ID) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS Mentor_Mentees (
+    Alumni_ID VARCHAR(20),
+    Student_ID VARCHAR(20),
+    Session_Count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (Alumni_ID, Student_ID)
+);
+
+DROP TRIGGER IF EXISTS tr_feedback_comprehensive_after_insert;
+DROP TRIGGER IF EXISTS tr_feedback_update_mentor_stats;
+DROP TRIGGER IF EXISTS tr_feedback_mentor_stats_insert;
+DROP TRIGGER IF EXISTS tr_feedback_mentor_stats_update;
+DROP TRIGGER IF EXISTS tr_feedback_mentor_stats_delete;
+DROP TRIGGER IF EXISTS tr_mentorship_session_mentor_stats_insert;
+DROP TRIGGER IF EXISTS tr_mentorship_session_mentor_stats_update;
+DROP TRIGGER IF EXISTS tr_mentorship_session_mentor_stats_delete;
+
+DROP PROCEDURE IF EXISTS sp_mentor_stats_feedback;
+DROP PROCEDURE IF EXISTS sp_mentor_stats_session;
+DROP PROCEDURE IF EXISTS sp_rebuild_mentor_stats;
+DROP PROCEDURE IF EXISTS GetMentorStats;
+DROP FUNCTION IF EXISTS GetAlumniAverageRating;
+DROP FUNCTION IF EXISTS GetAlumniSessionCount;
+
+DELIMITER $$
+
+-- =====================================================
+-- COUNTER MAINTENANCE
+-- =====================================================
+
+-- Procedure: Add (p_sign = 1) or remove (p_sign = -1) one feedback row
+CREATE PROCEDURE sp_mentor_stats_feedback(
+    IN p_alumni_id VARCHAR(20),
+    IN p_rating INT,
+    IN p_sign INT
+)
+BEGIN
+    IF p_alumni_id IS NOT NULL THEN
+        INSERT INTO Mentor_Stats (Alumni_ID, Feedback_Count, Rating_Count, Rating_Sum)
+        VALUES (p_alumni_id, p_sign, IF(p_rating IS NULL, 0, p_sign), COALESCE(p_rating, 0) * p_sign)
+        ON DUPLICATE KEY UPDATE
+            Feedback_Count = Feedback_Count + p_sign,
+            Rating_Count = Rating_Count + IF(p_rating IS NULL, 0, p_sign),
+            Rating_Sum = Rating_Sum + COALESCE(p_rating, 0) * p_sign;
+    END IF;
+END$$
+
+-- Procedure: Add (p_sign = 1) or remove (p_sign = -1) one session
+CREATE PROCEDURE sp_mentor_stats_session(
+    IN p_alumni_id VARCHAR(20),
+    IN p_student_id VARCHAR(20),
+    IN p_sign INT
+)
+BEGIN
+    DECLARE v_pair_sessions INT DEFAULT 0;
+    DECLARE v_mentee_delta INT DEFAULT 0;
+
+    IF p_alumni_id IS NOT NULL THEN
+        IF p_student_id IS NOT NULL THEN
+            -- The upsert locks the pair row, so concurrent sessions for the
+            -- same pair serialize and exactly one of them sees 0 -> 1 (or 1 -> 0)
+            INSERT INTO Mentor_Mentees (Alumni_ID, Student_ID, Session_Count)
+            VALUES (p_alumni_id, p_student_id, p_sign)
+            ON DUPLICATE KEY UPDATE Session_Count = Session_Count + p_sign;
+
+            SELECT Session_Count INTO v_pair_sessions
+            FROM Mentor_Mentees
+            WHERE Alumni_ID = p_alumni_id AND Student_ID = p_student_id;
+
+            IF p_sign > 0 AND v_pair_sessions = 1 THEN
+                SET v_mentee_delta = 1;
+            ELSEIF p_sign < 0 AND v_pair_sessions <= 0 THEN
+                DELETE FROM Mentor_Mentees
+                WHERE Alumni_ID = p_alumni_id AND Student_ID = p_student_id;
+                SET v_mentee_delta = -1;
+            END IF;
+        END IF;
+
+        INSERT INTO Mentor_Stats (Alumni_ID, Session_Count, Mentee_Count)
+        VALUES (p_alumni_id, p_sign, v_mentee_delta)
+        ON DUPLICATE KEY UPDATE
+            Session_Count = Session_Count + p_sign,
+            Mentee_Count = Mentee_Count + v_mentee_delta;
+    END IF;
+END$$
+
+-- =====================================================
+-- FEEDBACK TRIGGERS
+-- =====================================================
+
+-- Trigger: Update mentor statistics and relationship status after feedback
+CREATE TRIGGER tr_feedback_mentor_stats_insert
+AFTER INSERT ON Feedback
+FOR EACH ROW
+BEGIN
+    DECLARE v_total_feedback INT;
+    DECLARE v_avg_rating DECIMAL(3,2);
+    DECLARE v_total_sessions INT;
+
+    IF NEW.Alumni_ID IS NOT NULL THEN
+        CALL sp_mentor_stats_feedback(NEW.Alumni_ID, NEW.Rating, 1);
+
+        SELECT Feedback_Count, Rating_Sum / NULLIF(Rating_Count, 0), Session_Count
+        INTO v_total_feedback, v_avg_rating, v_total_sessions
+        FROM Mentor_Stats
+        WHERE Alumni_ID = NEW.Alumni_ID;
+
+        -- Update relationship status based on performance
+        IF v_avg_rating >= 4.5 AND v_total_sessions >= 5 THEN
+            UPDATE Provides
+            SET Status = 'Premium_Mentor'
+            WHERE Alumni_ID = NEW.Alumni_ID AND Student_ID = NEW.Student_ID;
+        ELSEIF v_avg_rating < 2.5 AND v_total_feedback >= 3 THEN
+            UPDATE Provides
+            SET Status = 'Needs_Improvement'
+            WHERE Alumni_ID = NEW.Alumni_ID AND Student_ID = NEW.Student_ID;
+        END IF;
+    END IF;
+END$$
+
+CREATE TRIGGER tr_feedback_mentor_stats_update
+AFTER UPDATE ON Feedback
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.Alumni_ID <=> NEW.Alumni_ID) OR NOT (OLD.Rating <=> NEW.Rating) THEN
+        CALL sp_mentor_stats_feedback(OLD.Alumni_ID, OLD.Rating, -1);
+        CALL sp_mentor_stats_feedback(NEW.Alumni_ID, NEW.Rating, 1);
+    END IF;
+END$$
+
+CREATE TRIGGER tr_feedback_mentor_stats_delete
+AFTER DELETE ON Feedback
+FOR EACH ROW
+BEGIN
+    CALL sp_mentor_stats_feedback(OLD.Alumni_ID, OLD.Rating, -1);
+END$$
+
+-- =====================================================
+-- SESSION TRIGGERS
+-- =====================================================
+
+CREATE TRIGGER tr_mentorship_session_mentor_stats_insert
+AFTER INSERT ON MentorshipSession
+FOR EACH ROW
+BEGIN
+    CALL sp_mentor_stats_session(NEW.Alumni_ID, NEW.Student_ID, 1);
+END$$
+
+CREATE TRIGGER tr_mentorship_session_mentor_stats_update
+AFTER UPDATE ON MentorshipSession
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.Alumni_ID <=> NEW.Alumni_ID) OR NOT (OLD.Student_ID <=> NEW.Student_ID) THEN
+        CALL sp_mentor_stats_session(OLD.Alumni_ID, OLD.Student_ID, -1);
+        CALL sp_mentor_stats_session(NEW.Alumni_ID, NEW.Student_ID, 1);
+    END IF;
+END$$
+
+CREATE TRIGGER tr_mentorship_session_mentor_stats_delete
+AFTER DELETE ON MentorshipSession
+FOR EACH ROW
+BEGIN
+    CALL sp_mentor_stats_session(OLD.Alumni_ID, OLD.Student_ID, -1);
+END$$
+
+-- =====================================================
+-- REBUILD
+-- =====================================================
+
+-- Procedure: Recompute Mentor_Stats and Mentor_Mentees from the base tables.
+-- INSERT ... SELECT takes shared locks on the rows it reads, so writes that
+-- race with the rebuild wait for it instead of being lost.
+CREATE PROCEDURE sp_rebuild_mentor_stats()
+BEGIN
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        RESIGNAL;
+    END;
+
+    START TRANSACTION;
+
+    DELETE FROM Mentor_Mentees;
+    INSERT INTO Mentor_Mentees (Alumni_ID, Student_ID, Session_Count)
+    SELECT Alumni_ID, Student_ID, COUNT(*)
+    FROM MentorshipSession
+    WHERE Alumni_ID IS NOT NULL AND Student_ID IS NOT NULL
+    GROUP BY Alumni_ID, Student_ID;
+
+    DELETE FROM Mentor_Stats;
+    INSERT INTO Mentor_Stats (Alumni_ID, Feedback_Count, Rating_Count, Rating_Sum,
+                              Session_Count, Mentee_Count)
+    SELECT a.Alumni_ID,
+           COALESCE(f.Feedback_Count, 0), COALESCE(f.Rating_Count, 0), COALESCE(f.Rating_Sum, 0),
+           COALESCE(s.Session_Count, 0), COALESCE(s.Mentee_Count, 0)
+    FROM Alumni a
+    LEFT JOIN (
+        SELECT Alumni_ID, COUNT(*) AS Feedback_Count, COUNT(Rating) AS Rating_Count,
+               SUM(COALESCE(Rating, 0)) AS Rating_Sum
+        FROM Feedback
+        GROUP BY Alumni_ID
+    ) f ON f.Alumni_ID = a.Alumni_ID
+    LEFT JOIN (
+        SELECT Alumni_ID, COUNT(*) AS Session_Count, COUNT(DISTINCT Student_ID) AS Mentee_Count
+        FROM MentorshipSession
+        GROUP BY Alumni_ID
+    ) s ON s.Alumni_ID = a.Alumni_ID
+    WHERE f.Alumni_ID IS NOT NULL OR s.Alumni_ID IS NOT NULL;
+
+    COMMIT;
+
+    SELECT COUNT(*) AS Mentors FROM Mentor_Stats;
+END$$
+
+-- =====================================================
+-- READERS
+-- =====================================================
+
+-- Procedure: Get Mentor Statistics (reads the maintained totals)
+CREATE PROCEDURE GetMentorStats(
+    IN p_Alumni_ID VARCHAR(20)
+)
+BEGIN
+    SELECT
+        a.Alumni_ID,
+        a.Name,
+        a.Current_Designation,
+        a.Years_of_Experience,
+        COALESCE(ms.Mentee_Count, 0) AS Total_Mentees,
+        COALESCE(ms.Session_Count, 0) AS Total_Sessions,
+        IFNULL(ms.Rating_Sum / NULLIF(ms.Rating_Count, 0), 0) AS Average_Rating,
+        COALESCE(ms.Rating_Count, 0) AS Feedback_Count,
+        CASE
+            WHEN ms.Rating_Sum / NULLIF(ms.Rating_Count, 0) >= 4.5 THEN 'Excellent'
+            WHEN ms.Rating_Sum / NULLIF(ms.Rating_Count, 0) >= 4.0 THEN 'Very Good'
+            WHEN ms.Rating_Sum / NULLIF(ms.Rating_Count, 0) >= 3.5 THEN 'Good'
+            WHEN ms.Rating_Sum / NULLIF(ms.Rating_Count, 0) > 0 THEN 'Average'
+            ELSE 'No Feedback'
+        END AS Performance_Rating
+    FROM Alumni a
+    LEFT JOIN Mentor_Stats ms ON ms.Alumni_ID = a.Alumni_ID
+    WHERE a.Alumni_ID = p_Alumni_ID;
+END$$
+
+-- Function: Average rating for an alumni
+CREATE FUNCTION GetAlumniAverageRating(p_alumni_id VARCHAR(20))
+RETURNS DECIMAL(3,2)
+DETERMINISTIC
+READS SQL DATA
+BEGIN
+    RETURN COALESCE((
+        SELECT Rating_Sum / NULLIF(Rating_Count, 0)
+        FROM Mentor_Stats
+        WHERE Alumni_ID = p_alumni_id
+    ), 0);
+END$$
+
+-- Function: Total sessions for an alumni
+CREATE FUNCTION GetAlumniSessionCount(p_alumni_id VARCHAR(20))
+RETURNS INT
+DETERMINISTIC
+READS SQL DATA
+BEGIN
+    RETURN COALESCE((
+        SELECT Session_Count
+        FROM Mentor_Stats
+        WHERE Alumni_ID = p_alumni_id
+    ), 0);
+END$$
+
+DELIMITER ;
+
+-- Backfill from the existing rows
+CALL sp_rebuild_mentor_stats();
+
+SELECT * FROM Mentor_Stats ORDER BY Alumni_ID;
@@ -0,0 +1,35 @@
+-- =====================================================
+-- Alumni Mentor Portal - Full-Text Search Indexes
+-- =====================================================
+-- /search matches words with
+--   MATCH(<indexed columns>) AGAINST ('+term* ...' IN BOOLEAN MODE)
+-- which InnoDB answers from an inverted word index instead of the
+-- LIKE '%...%' scan GetAlumniBySkill does. The MATCH column list must name
+-- exactly the columns of one index below, in the same order (search.py).
+--
+-- Words shorter than innodb_ft_min_token_size (3 by default) and InnoDB's
+-- stopwords are not indexed; search.py drops them from the query. To find
+-- two-letter words such as "Go" or "AI", set innodb_ft_min_token_size = 2
+-- in my.cnf, restart MySQL and rebuild these indexes.
+--
+-- The first FULLTEXT index on a table adds a hidden FTS_DOC_ID column and
+-- rebuilds the table, so apply this outside busy hours on large tables.
+-- After bulk loads, OPTIMIZE TABLE with innodb_optimize_fulltext_only = ON
+-- merges the index's pending updates.
+--
+-- Applied as migration 12 by `flask --app app migrate`; `flask --app app
+-- check-indexes` EXPLAINs the match totals query against this set.
+
+USE mentor_alumni_portal;
+
+-- Alumni: name, employer, role and city in one index, ranked together
+CREATE FULLTEXT INDEX ft_alumni_profile ON Alumni(Name, Company, Current_Designation, Location);
+
+-- Achievement: title and description
+CREATE FULLTEXT INDEX ft_achievement_text ON Achievement(Title, Description);
+
+-- Feedback: free-text comments
+CREATE FULLTEXT INDEX ft_feedback_comments ON Feedback(Comments);
+
+-- Skill: skill names
+CREATE FULLTEXT INDEX ft_skill_name ON Skill(Skill_Name);
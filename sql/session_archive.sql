@@ -0,0 +1,51 @@
+-- =====================================================
+-- Alumni Mentor Portal - Session Archive
+-- =====================================================
+-- Old mentorship sessions are moved here instead of being deleted, a
+-- bounded Session_ID range at a time (archive.py):
+--
+--   Session_Archive  archived MentorshipSession rows, with the job that
+--                    moved them and when
+--   Archive_Jobs     one row per archival run: cutoff date, the last
+--                    Session_ID done, counters and state. Each batch commits
+--                    its rows and the new Last_Session_ID together, so an
+--                    interrupted job resumes exactly where it stopped.
+--
+-- Removing a session still fires the MentorshipSession delete triggers
+-- (Table_Counts, Mentor_Stats, Table_Versions), one short batch at a time.
+-- DeleteOldSessions is left installed but the app no longer calls it.
+--
+-- Applied as migration 13 by `flask --app app migrate`.
+
+USE mentor_alumni_portal;
+
+CREATE TABLE IF NOT EXISTS Archive_Jobs (
+    Job_ID INT AUTO_INCREMENT PRIMARY KEY,
+    Cutoff_Date DATE NOT NULL,
+    Last_Session_ID VARCHAR(20) NOT NULL DEFAULT '',
+    Status ENUM('running', 'paused', 'done', 'failed') NOT NULL DEFAULT 'running',
+    Batches INT NOT NULL DEFAULT 0,
+    Scanned INT NOT NULL DEFAULT 0,
+    Archived INT NOT NULL DEFAULT 0,
+    Error VARCHAR(500),
+    Started_At TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    Updated_At TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    Finished_At TIMESTAMP NULL,
+    INDEX idx_archive_jobs_status (Status)
+);
+
+-- No foreign keys: archived sessions may outlive the alumni and students they name
+CREATE TABLE IF NOT EXISTS Session_Archive (
+    Archive_ID BIGINT AUTO_INCREMENT PRIMARY KEY,
+    Session_ID VARCHAR(20) NOT NULL,
+    Alumni_ID VARCHAR(20),
+    Student_ID VARCHAR(20),
+    Session_Date DATE,
+    Duration_Minutes INT,
+    Topic VARCHAR(200),
+    Job_ID INT NOT NULL,
+    Archived_At TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_session_archive_session (Session_ID),
+    INDEX idx_session_archive_alumni_date (Alumni_ID, Session_Date),
+    INDEX idx_session_archive_student_date (Student_ID, Session_Date)
+);
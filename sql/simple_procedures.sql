@@ -11,7 +11,7 @@ CREATE PROCEDURE sp_get_alumni_statistics(IN p_alumni_id VARCHAR(20))
 BEGIN
     SELECT
         a.Name,
-        a.Current_Position,
+        a.Current_Designation,
         a.Years_of_Experience,
         COUNT(DISTINCT ms.Student_ID) AS Total_Mentees,
         COUNT(ms.Session_ID) AS Total_Sessions,
@@ -20,7 +20,7 @@ BEGIN
     LEFT JOIN MentorshipSession ms ON a.Alumni_ID = ms.Alumni_ID
     LEFT JOIN Feedback f ON a.Alumni_ID = f.Alumni_ID
     WHERE a.Alumni_ID = p_alumni_id
-    GROUP BY a.Alumni_ID, a.Name, a.Current_Position, a.Years_of_Experience;
+    GROUP BY a.Alumni_ID, a.Name, a.Current_Designation, a.Years_of_Experience;
 END$$
 
 -- Procedure to get student session history
@@ -29,10 +29,10 @@ BEGIN
     SELECT
         s.Name AS Student_Name,
         a.Name AS Alumni_Name,
-        a.Current_Position,
-        ms.Date,
-        ms.Mode,
-        ms.Duration,
+        a.Current_Designation,
+        ms.Session_Date,
+        ms.Topic,
+        ms.Duration_Minutes,
         f.Rating,
         f.Comments
     FROM Student s
@@ -40,9 +40,9 @@ BEGIN
     JOIN Alumni a ON ms.Alumni_ID = a.Alumni_ID
     LEFT JOIN Feedback f ON ms.Alumni_ID = f.Alumni_ID
         AND ms.Student_ID = f.Student_ID
-        AND ms.Date = f.Date
+        AND ms.Session_Date = f.Date
     WHERE s.Student_ID = p_student_id
-    ORDER BY ms.Date DESC;
+    ORDER BY ms.Session_Date DESC;
 END$$
 
 -- Procedure to get top mentors by rating
@@ -51,14 +51,14 @@ BEGIN
     SELECT
         a.Alumni_ID,
         a.Name,
-        a.Current_Position,
+        a.Current_Designation,
         COUNT(DISTINCT ms.Student_ID) AS Total_Mentees,
         COUNT(ms.Session_ID) AS Total_Sessions,
         COALESCE(AVG(f.Rating), 0) AS Average_Rating
     FROM Alumni a
     LEFT JOIN MentorshipSession ms ON a.Alumni_ID = ms.Alumni_ID
     LEFT JOIN Feedback f ON a.Alumni_ID = f.Alumni_ID
-    GROUP BY a.Alumni_ID, a.Name, a.Current_Position
+    GROUP BY a.Alumni_ID, a.Name, a.Current_Designation
     HAVING Total_Sessions > 0
     ORDER BY Average_Rating DESC, Total_Sessions DESC
     LIMIT p_limit;
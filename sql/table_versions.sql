@@ -0,0 +1,362 @@
+-- =====================================================
+-- Alumni Mentor Portal - Table Change Versions
+-- =====================================================
+-- List, report and dashboard pages answer conditional GETs (ETag and
+-- Last-Modified) from these versions instead of re-running their queries.
+-- A table's version is SUM(Version) over 16 slots picked by CONNECTION_ID(),
+-- bumped by AFTER INSERT/UPDATE/DELETE triggers, so concurrent writers update
+-- different rows (as in dashboard_counters.sql). Changed_At is the time of the
+-- latest change.
+--
+-- Note: rows removed by ON DELETE CASCADE do not fire triggers; the app also
+-- watches the parent tables (TABLE_DEPENDENTS in query_cache.py). The derived
+-- tables (Table_Counts, Mentor_Stats, Mentor_Mentees) have no version
+-- triggers: their sources' triggers cover normal writes, and the app calls
+-- sp_touch_table_version after reconciling or rebuilding them.
+
+USE mentor_alumni_portal;
+
+CREATE TABLE IF NOT EXISTS Table_Versions (
+    Table_Name VARCHAR(64) NOT NULL,
+    Slot TINYINT UNSIGNED NOT NULL,
+    Version BIGINT UNSIGNED NOT NULL DEFAULT 0,
+    Changed_At TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    PRIMARY KEY (Table_Name, Slot)
+);
+
+INSERT IGNORE INTO Table_Versions (Table_Name, Slot)
+SELECT t.Table_Name, s.Slot
+FROM (SELECT 'Alumni' AS Table_Name
+      UNION ALL SELECT 'Student'
+      UNION ALL SELECT 'Skill'
+      UNION ALL SELECT 'Industry'
+      UNION ALL SELECT 'Achievement'
+      UNION ALL SELECT 'MentorshipSession'
+      UNION ALL SELECT 'Feedback'
+      UNION ALL SELECT 'Provides'
+      UNION ALL SELECT 'Alumni_Skills'
+      UNION ALL SELECT 'Student_Skills'
+      UNION ALL SELECT 'Mentorship_Request'
+      UNION ALL SELECT 'Table_Counts'
+      UNION ALL SELECT 'Mentor_Stats'
+      UNION ALL SELECT 'Mentor_Mentees') t
+CROSS JOIN (SELECT 0 AS Slot UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3
+            UNION ALL SELECT 4 UNION ALL SELECT 5 UNION ALL SELECT 6 UNION ALL SELECT 7
+            UNION ALL SELECT 8 UNION ALL SELECT 9 UNION ALL SELECT 10 UNION ALL SELECT 11
+            UNION ALL SELECT 12 UNION ALL SELECT 13 UNION ALL SELECT 14 UNION ALL SELECT 15) s;
+
+DELIMITER $$
+
+DROP PROCEDURE IF EXISTS sp_touch_table_version$$
+
+CREATE PROCEDURE sp_touch_table_version(IN p_table_name VARCHAR(64))
+BEGIN
+    UPDATE Table_Versions SET Version = Version + 1, Changed_At = CURRENT_TIMESTAMP(6)
+    WHERE Table_Name = p_table_name AND Slot = CONNECTION_ID() % 16;
+END$$
+
+-- =====================================================
+-- VERSION TRIGGERS
+-- =====================================================
+
+DROP TRIGGER IF EXISTS tr_alumni_version_insert$$
+
+CREATE TRIGGER tr_alumni_version_insert
+AFTER INSERT ON Alumni
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Alumni');
+END$$
+
+DROP TRIGGER IF EXISTS tr_alumni_version_update$$
+
+CREATE TRIGGER tr_alumni_version_update
+AFTER UPDATE ON Alumni
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Alumni');
+END$$
+
+DROP TRIGGER IF EXISTS tr_alumni_version_delete$$
+
+CREATE TRIGGER tr_alumni_version_delete
+AFTER DELETE ON Alumni
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Alumni');
+END$$
+
+DROP TRIGGER IF EXISTS tr_student_version_insert$$
+
+CREATE TRIGGER tr_student_version_insert
+AFTER INSERT ON Student
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Student');
+END$$
+
+DROP TRIGGER IF EXISTS tr_student_version_update$$
+
+CREATE TRIGGER tr_student_version_update
+AFTER UPDATE ON Student
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Student');
+END$$
+
+DROP TRIGGER IF EXISTS tr_student_version_delete$$
+
+CREATE TRIGGER tr_student_version_delete
+AFTER DELETE ON Student
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Student');
+END$$
+
+DROP TRIGGER IF EXISTS tr_skill_version_insert$$
+
+CREATE TRIGGER tr_skill_version_insert
+AFTER INSERT ON Skill
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Skill');
+END$$
+
+DROP TRIGGER IF EXISTS tr_skill_version_update$$
+
+CREATE TRIGGER tr_skill_version_update
+AFTER UPDATE ON Skill
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Skill');
+END$$
+
+DROP TRIGGER IF EXISTS tr_skill_version_delete$$
+
+CREATE TRIGGER tr_skill_version_delete
+AFTER DELETE ON Skill
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Skill');
+END$$
+
+DROP TRIGGER IF EXISTS tr_industry_version_insert$$
+
+CREATE TRIGGER tr_industry_version_insert
+AFTER INSERT ON Industry
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Industry');
+END$$
+
+DROP TRIGGER IF EXISTS tr_industry_version_update$$
+
+CREATE TRIGGER tr_industry_version_update
+AFTER UPDATE ON Industry
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Industry');
+END$$
+
+DROP TRIGGER IF EXISTS tr_industry_version_delete$$
+
+CREATE TRIGGER tr_industry_version_delete
+AFTER DELETE ON Industry
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Industry');
+END$$
+
+DROP TRIGGER IF EXISTS tr_achievement_version_insert$$
+
+CREATE TRIGGER tr_achievement_version_insert
+AFTER INSERT ON Achievement
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Achievement');
+END$$
+
+DROP TRIGGER IF EXISTS tr_achievement_version_update$$
+
+CREATE TRIGGER tr_achievement_version_update
+AFTER UPDATE ON Achievement
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Achievement');
+END$$
+
+DROP TRIGGER IF EXISTS tr_achievement_version_delete$$
+
+CREATE TRIGGER tr_achievement_version_delete
+AFTER DELETE ON Achievement
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Achievement');
+END$$
+
+DROP TRIGGER IF EXISTS tr_mentorship_session_version_insert$$
+
+CREATE TRIGGER tr_mentorship_session_version_insert
+AFTER INSERT ON MentorshipSession
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('MentorshipSession');
+END$$
+
+DROP TRIGGER IF EXISTS tr_mentorship_session_version_update$$
+
+CREATE TRIGGER tr_mentorship_session_version_update
+AFTER UPDATE ON MentorshipSession
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('MentorshipSession');
+END$$
+
+DROP TRIGGER IF EXISTS tr_mentorship_session_version_delete$$
+
+CREATE TRIGGER tr_mentorship_session_version_delete
+AFTER DELETE ON MentorshipSession
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('MentorshipSession');
+END$$
+
+DROP TRIGGER IF EXISTS tr_feedback_version_insert$$
+
+CREATE TRIGGER tr_feedback_version_insert
+AFTER INSERT ON Feedback
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Feedback');
+END$$
+
+DROP TRIGGER IF EXISTS tr_feedback_version_update$$
+
+CREATE TRIGGER tr_feedback_version_update
+AFTER UPDATE ON Feedback
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Feedback');
+END$$
+
+DROP TRIGGER IF EXISTS tr_feedback_version_delete$$
+
+CREATE TRIGGER tr_feedback_version_delete
+AFTER DELETE ON Feedback
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Feedback');
+END$$
+
+DROP TRIGGER IF EXISTS tr_provides_version_insert$$
+
+CREATE TRIGGER tr_provides_version_insert
+AFTER INSERT ON Provides
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Provides');
+END$$
+
+DROP TRIGGER IF EXISTS tr_provides_version_update$$
+
+CREATE TRIGGER tr_provides_version_update
+AFTER UPDATE ON Provides
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Provides');
+END$$
+
+DROP TRIGGER IF EXISTS tr_provides_version_delete$$
+
+CREATE TRIGGER tr_provides_version_delete
+AFTER DELETE ON Provides
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Provides');
+END$$
+
+DROP TRIGGER IF EXISTS tr_alumni_skills_version_insert$$
+
+CREATE TRIGGER tr_alumni_skills_version_insert
+AFTER INSERT ON Alumni_Skills
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Alumni_Skills');
+END$$
+
+DROP TRIGGER IF EXISTS tr_alumni_skills_version_update$$
+
+CREATE TRIGGER tr_alumni_skills_version_update
+AFTER UPDATE ON Alumni_Skills
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Alumni_Skills');
+END$$
+
+DROP TRIGGER IF EXISTS tr_alumni_skills_version_delete$$
+
+CREATE TRIGGER tr_alumni_skills_version_delete
+AFTER DELETE ON Alumni_Skills
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Alumni_Skills');
+END$$
+
+DROP TRIGGER IF EXISTS tr_student_skills_version_insert$$
+
+CREATE TRIGGER tr_student_skills_version_insert
+AFTER INSERT ON Student_Skills
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Student_Skills');
+END$$
+
+DROP TRIGGER IF EXISTS tr_student_skills_version_update$$
+
+CREATE TRIGGER tr_student_skills_version_update
+AFTER UPDATE ON Student_Skills
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Student_Skills');
+END$$
+
+DROP TRIGGER IF EXISTS tr_student_skills_version_delete$$
+
+CREATE TRIGGER tr_student_skills_version_delete
+AFTER DELETE ON Student_Skills
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Student_Skills');
+END$$
+
+DROP TRIGGER IF EXISTS tr_mentorship_request_version_insert$$
+
+CREATE TRIGGER tr_mentorship_request_version_insert
+AFTER INSERT ON Mentorship_Request
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Mentorship_Request');
+END$$
+
+DROP TRIGGER IF EXISTS tr_mentorship_request_version_update$$
+
+CREATE TRIGGER tr_mentorship_request_version_update
+AFTER UPDATE ON Mentorship_Request
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Mentorship_Request');
+END$$
+
+DROP TRIGGER IF EXISTS tr_mentorship_request_version_delete$$
+
+CREATE TRIGGER tr_mentorship_request_version_delete
+AFTER DELETE ON Mentorship_Request
+FOR EACH ROW
+BEGIN
+    CALL sp_touch_table_version('Mentorship_Request');
+END$$
+
+DELIMITER ;
+
+SELECT Table_Name, SUM(Version) AS Version, MAX(Changed_At) AS Changed_At
+FROM Table_Versions GROUP BY Table_Name;
@@ -0,0 +1,96 @@
+"""
+Alumni Mentor Portal - Form Validation Cache
+Checks web form inserts against in-memory sets of alumni and student IDs,
+emails and phone numbers, with the CSV import's rules, so a duplicate or a
+missing reference gets a friendly message without lookup queries in the
+insert triggers
+"""
+
+from datetime import date
+
+from bulk_import import IMPORT_SPECS, validate_row
+from snapshots import Snapshot
+
+# table -> query for the keys its forms are checked against
+KEY_SOURCES = {
+    'Alumni': "SELECT Alumni_ID AS Id, Email, Phone_Number AS Phone FROM Alumni",
+    'Student': "SELECT Student_ID AS Id, Email, Phone_Number AS Phone FROM Student",
+}
+
+
+class KeySet(Snapshot):
+    """IDs, emails (lower-cased, as the collation compares them) and phones of one table.
+
+    Reloads after writes to the table, like the typeahead indexes. A row this
+    process inserts is added in place instead (remember), so a run of form
+    inserts does not reload the table after each one.
+    """
+
+    def __init__(self, table, query, max_age=300):
+        super().__init__((table,), max_age)
+        self.table = table
+        self.query = query
+        # _data: (ids, emails, phones)
+
+    def _build(self, fetch):
+        results = fetch([self.query])
+        if results is None:
+            return None
+        rows = results[0]
+        return ({row['Id'] for row in rows},
+                {row['Email'].lower() for row in rows if row['Email']},
+                {row['Phone'] for row in rows if row['Phone'] is not None})
+
+    def lookups(self):
+        ids, emails, phones = self._data
+        return {'ids': ids, 'emails': emails, 'phones': phones}
+
+    def remember(self, row_id, email, phone, before, versions):
+        """Add a row just inserted by this process.
+
+        before is the table version read ahead of the insert. The sets stay
+        current only if they matched it and the insert's own bump is the only
+        change since; otherwise the next refresh reloads them.
+        """
+        with self._lock:
+            version = self._own_write(before, self.table, versions)
+            if version is None:
+                return False
+            ids, emails, phones = self._data
+            ids.add(row_id)
+            if email:
+                emails.add(email.lower())
+            if phone is not None:
+                phones.add(phone)
+            self._version = version
+            return True
+
+    def stats(self):
+        data = self._data
+        return {
+            'table': self.table,
+            'ids': len(data[0]) if data else 0,
+            'loads': self._loads,
+            'age_seconds': round(self.age, 1) if data else None,
+        }
+
+
+def form_lookups(dataset, keysets, daily=None):
+    """Lookups for validate_row from the cached key sets.
+
+    Session and feedback IDs are left to their primary keys: caching them
+    would mean holding the largest tables in memory. daily is the sessions per
+    (alumni, day) of the availability index, if there is one.
+    """
+    if dataset in ('alumni', 'students'):
+        return keysets[IMPORT_SPECS[dataset].table].lookups()
+    return {'ids': frozenset(), 'daily': daily if daily is not None else {},
+            'alumni': keysets['Alumni'].lookups()['ids'],
+            'students': keysets['Student'].lookups()['ids']}
+
+
+def validate_form(dataset, values, keysets, today=None, daily=None):
+    """(row, errors) for one form insert; values maps column names to submitted strings"""
+    spec = IMPORT_SPECS[dataset]
+    row = {column: '' if values.get(column) is None else str(values[column]) for column in spec.columns}
+    return validate_row(spec, row, form_lookups(dataset, keysets, daily), today or date.today())
@@ -0,0 +1,9 @@
+"""
+Alumni Mentor Portal - WSGI Entry Point
+For production servers: gunicorn -c gunicorn.conf.py wsgi:app
+(`python app.py` runs the single-process development server instead)
+"""
+
+from app import app
+
+application = app